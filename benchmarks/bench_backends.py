@@ -0,0 +1,92 @@
+"""
+Benchmark the pydantic v1 and pydantic v2 validation backends side by side.
+
+Validates a `List[User]` return value, and composes a request with a `User` body
+argument, where `User` is either a pydantic v1 model or (if pydantic v2 is
+installed) a pydantic v2 model.
+
+Usage:
+    python -m benchmarks.bench_backends
+"""
+
+import json
+import timeit
+from typing import Any, Callable, List, MutableSequence, Tuple, Type
+
+import pydantic
+
+from neoclient import Body
+from neoclient._compat import PYDANTIC_V2, BaseModel
+from neoclient.adapters import get_type_adapter
+from neoclient.composition import Composition, compose, get_composition
+from neoclient.models import RequestOpts
+
+NUMBER: int = 2_000
+
+
+class UserV1(BaseModel):
+    id: int
+    name: str
+    email: str
+
+
+MODELS: MutableSequence[Tuple[str, Type[Any]]] = [("pydantic v1", UserV1)]
+
+if PYDANTIC_V2:
+
+    class UserV2(pydantic.BaseModel):
+        id: int
+        name: str
+        email: str
+
+    MODELS.append(("pydantic v2", UserV2))
+
+
+USER: dict = {"id": 1, "name": "user1", "email": "user1@example.com"}
+USERS: str = json.dumps(
+    [{"id": i, "name": f"user{i}", "email": f"user{i}@example.com"} for i in range(10)]
+)
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=5))
+
+    print(f"{name:<40} {seconds / NUMBER * 1e6:>8.2f} us/call")
+
+    return seconds
+
+
+def main() -> None:
+    print(f"pydantic {pydantic.VERSION}\n")
+
+    name: str
+    model: Type[Any]
+    for name, model in MODELS:
+        annotation: Any = List[model]  # type: ignore
+
+        def create_user(user: model = Body()) -> None:  # type: ignore
+            ...
+
+        composition: Composition = get_composition(
+            RequestOpts("POST", "/users"), create_user
+        )
+
+        bench(
+            f"{name}: return List[User]",
+            lambda: get_type_adapter(annotation).validate_json(USERS),
+        )
+        bench(
+            f"{name}: argument User",
+            lambda: compose(
+                create_user,
+                RequestOpts("POST", "/users"),
+                (),
+                {"user": USER},
+                composition=composition,
+            ),
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
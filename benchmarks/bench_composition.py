@@ -0,0 +1,106 @@
+"""
+Benchmark composing a request from the arguments of an operation with 4
+parameters, preparing its fields (and validation model) for every call versus
+once per operation.
+
+Reports the time taken and the peak memory allocated (using `tracemalloc`) per
+call.
+
+Usage:
+    python -m benchmarks.bench_composition
+"""
+
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from neoclient import Header, Query
+from neoclient.api import bind_arguments, validate_v2_arguments
+from neoclient.composition import Composition, compose, get_composition
+from neoclient.models import RequestOpts
+
+NUMBER: int = 2_000
+
+
+def get_user(
+    id: int, page: int = 1, q: str = Query(default=""), x_trace: str = Header()
+) -> None: ...
+
+
+TEMPLATE: RequestOpts = RequestOpts("GET", "/users/{id}")
+# Prepared once per operation (and kept by the operation)
+COMPOSITION: Composition = get_composition(TEMPLATE, get_user)
+
+
+def compose_unprepared() -> RequestOpts:
+    request: RequestOpts = TEMPLATE.copy()
+
+    # Prepare the composition afresh, as each call did previously
+    composition: Composition = Composition.prepare(
+        get_user, request.url_template.placeholders
+    )
+    arguments: Any = bind_arguments(get_user, (1,), {"page": 2, "x_trace": "abc"})
+    model: Any = composition.model_cls(
+        **validate_v2_arguments(composition.fields, arguments)
+    )
+
+    for field_name, (_, parameter) in composition.fields.items():
+        parameter.compose(request, getattr(model, field_name))
+
+    return request
+
+
+def compose_prepared() -> RequestOpts:
+    request: RequestOpts = TEMPLATE.copy()
+
+    compose(
+        get_user,
+        request,
+        (1,),
+        {"page": 2, "x_trace": "abc"},
+        composition=COMPOSITION,
+    )
+
+    return request
+
+
+def measure_allocations(func: Callable[[], Any], /) -> float:
+    """The peak memory allocated whilst calling `func` (on average)"""
+
+    peaks: List[int] = []
+
+    tracemalloc.start()
+
+    for _ in range(100):
+        tracemalloc.reset_peak()
+        before: int = tracemalloc.get_traced_memory()[0]
+
+        func()
+
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+    tracemalloc.stop()
+
+    return sum(peaks) / len(peaks)
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    allocated: float = measure_allocations(func)
+
+    print(f"{name:<24} {seconds / NUMBER * 1e6:>8.2f}µs {allocated:>10.0f}B")
+
+    return seconds
+
+
+def main() -> None:
+    assert compose_unprepared() == compose_prepared()
+
+    before: float = bench("prepared per call", compose_unprepared)
+    after: float = bench("prepared per operation", compose_prepared)
+
+    print(f"{'':<24} {before / after:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark decoding of large JSON responses into operation return types.
+
+Compares the previous behaviour (`response.json()` followed by validation) against
+each available decoder, for a ~5MB JSON list decoded as a list of pydantic models
+and as a list of dataclasses.
+
+Usage:
+    python -m benchmarks.bench_decoding
+"""
+
+import importlib.util
+import json
+import timeit
+from dataclasses import dataclass
+from typing import Any, Callable, List, MutableSequence, Tuple
+
+import httpx
+
+from neoclient._compat import BaseModel
+from neoclient.adapters import get_type_adapter
+from neoclient.decoders import Decoder, JSONDecoder, MsgspecDecoder, OrjsonDecoder
+
+NUMBER: int = 3
+
+
+class UserModel(BaseModel):
+    id: int
+    name: str
+    email: str
+    active: bool
+    tags: List[str]
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    email: str
+    active: bool
+    tags: List[str]
+
+
+CONTENT: bytes = json.dumps(
+    [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "email": f"user{i}@example.com",
+            "active": i % 2 == 0,
+            "tags": ["a", "b", "c"],
+        }
+        for i in range(50_000)
+    ]
+).encode()
+
+DECODERS: MutableSequence[Tuple[str, Decoder]] = [("json", JSONDecoder())]
+
+if importlib.util.find_spec("orjson") is not None:
+    DECODERS.append(("orjson", OrjsonDecoder()))
+if importlib.util.find_spec("msgspec") is not None:
+    DECODERS.append(("msgspec", MsgspecDecoder()))
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=3))
+
+    print(f"{name:<40} {seconds / NUMBER * 1e3:>8.2f} ms/call")
+
+    return seconds
+
+
+def main() -> None:
+    print(f"{len(CONTENT) / 1e6:.1f}MB\n")
+
+    response: httpx.Response = httpx.Response(200, content=CONTENT)
+
+    for name, annotation in (
+        ("List[UserModel]", List[UserModel]),
+        ("List[User] (dataclass)", List[User]),
+    ):
+        before: float = bench(
+            f"{name}: response.json()",
+            lambda: get_type_adapter(annotation).validate_python(response.json()),
+        )
+
+        for decoder_name, decoder in DECODERS:
+            after: float = bench(
+                f"{name}: {decoder_name}",
+                lambda: decoder.decode(response.content, annotation),
+            )
+
+            print(f"{'':<40} {before / after:>8.2f}x")
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark parsing of operation return types.
+
+Compares `pydantic.parse_raw_as` (as previously used by operations) against the
+cached type adapters now used, for a `List[Model]` return type and a nested
+`NamedTuple` return type (like those in `examples/suggestqueries.py`).
+
+Usage:
+    python -m benchmarks.bench_parsing
+"""
+
+import json
+import timeit
+from typing import Any, Callable, List, Mapping, NamedTuple
+
+import pydantic
+from pydantic import BaseModel
+
+from neoclient.adapters import get_type_adapter
+
+NUMBER: int = 2_000
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    email: str
+
+
+class Suggestion(NamedTuple):
+    suggestion: str
+    location: int
+    confidence: List[int]
+
+
+class Suggestions(NamedTuple):
+    query: str
+    suggestions: List[Suggestion]
+    parameters: Mapping[str, Any]
+
+
+USERS: str = json.dumps(
+    [{"id": i, "name": f"user{i}", "email": f"user{i}@example.com"} for i in range(10)]
+)
+SUGGESTIONS: str = json.dumps(
+    [
+        "foo",
+        [[f"foo {i}", 0, [512, 433]] for i in range(10)],
+        {"k": "1", "q": "abc"},
+    ]
+)
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=5))
+
+    print(f"{name:<40} {seconds / NUMBER * 1e6:>8.2f} us/call")
+
+    return seconds
+
+
+def main() -> None:
+    for name, annotation, data in (
+        ("List[User]", List[User], USERS),
+        ("Suggestions (NamedTuple)", Suggestions, SUGGESTIONS),
+    ):
+        before: float = bench(
+            f"{name}: parse_raw_as",
+            lambda: pydantic.parse_raw_as(annotation, data),
+        )
+        after: float = bench(
+            f"{name}: cached adapter",
+            lambda: get_type_adapter(annotation).validate_json(data),
+        )
+
+        print(f"{name}: {before / after:.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
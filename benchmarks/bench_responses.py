@@ -0,0 +1,85 @@
+"""
+Benchmark the throughput of operations returning large list payloads, with and
+without response validation.
+
+Usage:
+    python -m benchmarks.bench_responses
+"""
+
+import json
+import timeit
+from typing import Any, Callable, List, Optional
+
+import httpx
+from pydantic import BaseModel
+
+from neoclient import NeoClient
+
+NUMBER: int = 20
+SIZE: int = 5_000
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    postcode: Optional[str] = None
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    email: str
+    tags: List[str]
+    address: Address
+
+
+PAYLOAD: bytes = json.dumps(
+    [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "email": f"user{i}@example.com",
+            "tags": ["a", "b", "c"],
+            "address": {"street": f"{i} High Street", "city": "London"},
+        }
+        for i in range(SIZE)
+    ]
+).encode()
+
+
+def build_client(*, validate_response: bool) -> NeoClient:
+    return NeoClient(
+        "https://example.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=PAYLOAD)
+        ),
+        validate_response=validate_response,
+    )
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=3))
+
+    print(f"{name:<24} {NUMBER * SIZE / seconds:>12,.0f} items/s")
+
+    return seconds
+
+
+def main() -> None:
+    validated: NeoClient = build_client(validate_response=True)
+    trusted: NeoClient = build_client(validate_response=False)
+
+    @validated.get("/users")
+    def get_users() -> List[User]: ...
+
+    @trusted.get("/users")
+    def get_trusted_users() -> List[User]: ...
+
+    before: float = bench("validate_response=True", get_users)
+    after: float = bench("validate_response=False", get_trusted_users)
+
+    print(f"{before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark the instantiation of a service with many operations, and the first call
+of an operation of each new instance (e.g. when instantiated per request context),
+versus repeated calls of the same instance.
+
+Usage:
+    python -m benchmarks.bench_services
+"""
+
+import timeit
+from typing import Any, Callable, Dict
+
+import httpx
+
+from neoclient import NeoClient, Service, get, service
+
+NUMBER: int = 200
+OPERATIONS: int = 50
+
+
+def build_service() -> type:
+    attrs: Dict[str, Any] = {}
+
+    i: int
+    for i in range(OPERATIONS):
+
+        def operation(self, id: int) -> dict: ...
+
+        operation.__name__ = operation.__qualname__ = f"get_{i}"
+
+        attrs[operation.__name__] = get(f"/resources/{i}/{{id}}")(operation)
+
+    @service.middleware
+    def some_middleware(self, call_next, request):
+        return call_next(request)
+
+    @service.request_depends
+    def some_request_dependency(self) -> None:
+        pass
+
+    attrs["some_middleware"] = some_middleware
+    attrs["some_request_dependency"] = some_request_dependency
+
+    service_cls: type = type("SomeService", (Service,), attrs)
+
+    # Avoid loading SSL certificates, which would otherwise dominate
+    service_cls._spec.options.transport = httpx.MockTransport(  # type: ignore
+        lambda request: httpx.Response(200)
+    )
+
+    return service_cls
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=7))
+
+    print(f"{name:<32} {seconds / NUMBER * 1e6:>10,.1f}µs")
+
+    return seconds
+
+
+def main() -> None:
+    service_cls: type = build_service()
+
+    bench(f"{OPERATIONS} operations: __init__", service_cls)
+
+    # Instances are given a client, so that only their operations are measured
+    client: NeoClient = NeoClient(
+        "https://api.example.com/",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+    )
+    instance: Any = service_cls(client=client)
+
+    bench("first call per instance", lambda: service_cls(client=client).get_0(1))
+    bench("call (same instance)", lambda: instance.get_0(1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark expanding URL templates with 0-5 placeholders, using `str.format` (and
+parsing the template for its placeholders) versus a compiled `URLTemplate`.
+
+Like an operation, the placeholders of the template are looked up twice (to infer
+path parameters, and to validate the path params of the request), and the
+template is then expanded.
+
+Usage:
+    python -m benchmarks.bench_templates
+"""
+
+import timeit
+from typing import Any, Callable, Mapping
+
+from httpx import URL
+
+from neoclient import utils
+from neoclient.templates import get_url_template
+
+NUMBER: int = 20_000
+
+
+def build_template(placeholders: int, /) -> str:
+    return "https://api.example.com/v1" + "".join(
+        f"/resources{i}/{{id{i}}}" for i in range(placeholders)
+    )
+
+
+def format_url(url: URL, values: Mapping[str, str], /) -> URL:
+    utils.parse_format_string(str(url))
+    utils.parse_format_string(str(url))
+
+    return URL(str(url).format(**values))
+
+
+def expand_url(url: URL, values: Mapping[str, str], /) -> URL:
+    get_url_template(str(url)).placeholders
+    get_url_template(str(url)).placeholders
+
+    return get_url_template(str(url)).expand(values)
+
+
+def bench(name: str, func: Callable[[], Any], /) -> float:
+    seconds: float = min(timeit.repeat(func, number=NUMBER, repeat=5))
+
+    print(f"{name:<32} {seconds / NUMBER * 1e6:>8.2f}µs")
+
+    return seconds
+
+
+def main() -> None:
+    placeholders: int
+    for placeholders in range(6):
+        template: URL = URL(build_template(placeholders))
+        values: Mapping[str, str] = {f"id{i}": str(i) for i in range(placeholders)}
+
+        assert format_url(template, values) == expand_url(template, values)
+
+        before: float = bench(
+            f"{placeholders} placeholders: str.format",
+            lambda: format_url(template, values),
+        )
+        after: float = bench(
+            f"{placeholders} placeholders: URLTemplate",
+            lambda: expand_url(template, values),
+        )
+
+        print(f"{'':<32} {before / after:>8.2f}x\n")
+
+
+if __name__ == "__main__":
+    main()
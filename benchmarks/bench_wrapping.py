@@ -0,0 +1,122 @@
+"""
+Benchmark wrapping httpx requests and responses as neoclient requests and
+responses, by copying them (re-building their headers and content) versus adopting
+them in place.
+
+Reports the time taken and the memory allocated (using `tracemalloc`) per wrap.
+
+Usage:
+    python -m benchmarks.bench_wrapping
+"""
+
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+import httpx
+
+from neoclient.models import Request, Response, State
+
+NUMBER: int = 20_000
+HEADERS: int = 20
+
+
+def build_request() -> httpx.Request:
+    return httpx.Request(
+        "POST",
+        "https://api.example.com/users",
+        headers={f"x-header-{i}": str(i) for i in range(HEADERS)},
+        json={"name": "sam"},
+    )
+
+
+def build_response() -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={f"x-header-{i}": str(i) for i in range(HEADERS)},
+        json={"name": "sam"},
+        request=build_request(),
+    )
+
+
+def copy_request(httpx_request: httpx.Request, /) -> Request:
+    request: Request = Request(
+        method=httpx_request.method,
+        url=httpx_request.url,
+        headers=httpx_request.headers,
+        extensions=httpx_request.extensions,
+        stream=httpx_request.stream,
+        state=State(),
+    )
+
+    request._content = httpx_request.content
+
+    return request
+
+
+def copy_response(httpx_response: httpx.Response, /) -> Response:
+    response: Response = Response(
+        status_code=httpx_response.status_code,
+        headers=httpx_response.headers,
+        request=httpx_response.request,  # type: ignore
+        stream=httpx_response.stream,
+        state=State(),
+    )
+
+    response._content = httpx_response.content
+    response.history = httpx_response.history
+
+    return response
+
+
+def adopt_request(httpx_request: httpx.Request, /) -> Request:
+    # Adopting mutates the request, so a fresh one is adopted each time
+    httpx_request.__class__ = httpx.Request
+
+    return Request.from_httpx_request(httpx_request)
+
+
+def adopt_response(httpx_response: httpx.Response, /) -> Response:
+    httpx_response.__class__ = httpx.Response
+
+    return Response.from_httpx_response(httpx_response)
+
+
+def measure_allocations(
+    wrap: Callable[[Any], Any], build: Callable[[], Any], /
+) -> float:
+    objs: List[Any] = [build() for _ in range(1_000)]
+    # Results are kept alive, so that their memory isn't reused
+    results: List[Any] = []
+
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+
+    obj: Any
+    for obj in objs:
+        results.append(wrap(obj))
+
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / len(objs)
+
+
+def bench(name: str, wrap: Callable[[Any], Any], build: Callable[[], Any], /) -> None:
+    obj: Any = build()
+
+    seconds: float = min(timeit.repeat(lambda: wrap(obj), number=NUMBER, repeat=5))
+    allocated: float = measure_allocations(wrap, build)
+
+    print(f"{name:<24} {seconds / NUMBER * 1e6:>8.2f}µs {allocated:>10.0f}B")
+
+
+def main() -> None:
+    bench("request: copy", copy_request, build_request)
+    bench("request: adopt", adopt_request, build_request)
+    bench("response: copy", copy_response, build_response)
+    bench("response: adopt", adopt_response, build_response)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,16 +17,19 @@ __version__: str = "0.1.55"
 from .client import NeoClient
 from .decorators import (
     base_url,
+    cache,
     content,
     cookie,
     cookies,
     data,
+    decoder,
     files,
     follow_redirects,
     header,
     headers,
     json,
     mount,
+    paginate,
     param,
     params,
     path,
@@ -36,11 +39,15 @@ from .decorators import (
     response_depends,
     service,
     timeout,
+    validate_arguments,
+    validate_response,
     verify,
 )
 from .decorators._auth import auth, basic_auth
-from .decorators._headers import accept, referer, user_agent
+from .decorators._headers import accept, content_type, referer, user_agent
 from .decorators._middleware import (
+    cache_responses,
+    compress,
     expect_content_type,
     expect_header,
     expect_status,
@@ -55,6 +62,7 @@ from .param_functions import (
     AllResponseState,
     AllState,
     Body,
+    Content,
     Cookie,
     Cookies,
     Depends,
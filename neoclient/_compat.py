@@ -0,0 +1,86 @@
+"""
+Compatibility layer over the installed version of pydantic.
+
+Parameters, and the models used to infer them, are built on the pydantic v1 API,
+which pydantic v2 still ships as `pydantic.v1`. If pydantic v2 is installed, its
+(much faster) `TypeAdapter` is used for validation and its serialiser for encoding,
+so that pydantic v2 models can be used as arguments and return types.
+"""
+
+from typing import Any, Tuple
+
+import pydantic
+from typing_extensions import get_args
+
+__all__ = (
+    "PYDANTIC_V2",
+    "MODEL_TYPES",
+    "BaseConfig",
+    "BaseModel",
+    "Extra",
+    "FieldInfo",
+    "ModelField",
+    "Required",
+    "Undefined",
+    "ValidationError",
+    "create_model",
+    "display_as_type",
+    "get_all_type_hints",
+    "to_camel",
+    "jsonable_encoder",
+    "is_model_type",
+    "has_v2_model",
+)
+
+PYDANTIC_V2: bool = pydantic.VERSION.startswith("2.")
+
+# pylint: disable=ungrouped-imports,wrong-import-position
+if PYDANTIC_V2:
+    from pydantic.v1 import BaseConfig, BaseModel, Extra, ValidationError, create_model
+    from pydantic.v1.fields import FieldInfo, ModelField, Required, Undefined
+    from pydantic.v1.typing import display_as_type, get_all_type_hints
+    from pydantic.v1.utils import to_camel
+    from pydantic_core import to_jsonable_python
+else:
+    from fastapi.encoders import jsonable_encoder as _jsonable_encoder
+    from pydantic import BaseConfig, BaseModel, Extra, ValidationError, create_model
+    from pydantic.fields import FieldInfo, ModelField, Required, Undefined
+    from pydantic.typing import display_as_type, get_all_type_hints
+    from pydantic.utils import to_camel
+
+# Both pydantic v1 models, and pydantic v2 models (if available)
+MODEL_TYPES: Tuple[type, ...] = (
+    (BaseModel, pydantic.BaseModel) if PYDANTIC_V2 else (BaseModel,)
+)
+
+
+def is_model_type(obj: Any, /) -> bool:
+    return isinstance(obj, type) and issubclass(obj, MODEL_TYPES)
+
+
+def has_v2_model(annotation: Any, /) -> bool:
+    """Check whether `annotation` is, or contains, a pydantic v2 model"""
+
+    if not PYDANTIC_V2:
+        return False
+
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        return True
+
+    return any(has_v2_model(arg) for arg in get_args(annotation))
+
+
+def jsonable_encoder(obj: Any, /) -> Any:
+    """Convert `obj` (e.g. a pydantic model) into a JSON-compatible value"""
+
+    if PYDANTIC_V2:
+        return to_jsonable_python(obj, fallback=_encode_v1_model)
+
+    return _jsonable_encoder(obj)
+
+
+def _encode_v1_model(obj: Any, /) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+
+    raise TypeError(f"Object of type {type(obj)!r} is not JSON serializable")
@@ -0,0 +1,413 @@
+import collections.abc
+import dataclasses
+import enum
+import functools
+import json
+import typing
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import pydantic
+from typing_extensions import Annotated, get_args, get_origin
+
+from ._compat import (
+    BaseConfig,
+    BaseModel,
+    ModelField,
+    ValidationError,
+    create_model,
+    display_as_type,
+    has_v2_model,
+    is_model_type,
+)
+
+__all__ = (
+    "TypeAdapter",
+    "get_type_adapter",
+    "get_constructor",
+)
+
+T = TypeVar("T")
+
+Constructor = Callable[[Any], Any]
+
+NoneType: type = type(None)
+
+SEQUENCE_TYPES: Mapping[Any, Callable[[Any], Any]] = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    collections.abc.Set: set,
+    collections.abc.MutableSet: set,
+}
+MAPPING_TYPES: Sequence[Any] = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+
+
+class ArbitraryTypesConfig(BaseConfig):
+    arbitrary_types_allowed: bool = True
+
+
+def _has_v1_model(type_: Any, /) -> bool:
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return True
+
+    return any(_has_v1_model(arg) for arg in get_args(type_))
+
+
+def _build_v2_adapter(type_: Any, /, *, arbitrary_types_allowed: bool) -> Any:
+    if not arbitrary_types_allowed:
+        return pydantic.TypeAdapter(type_)
+
+    try:
+        return pydantic.TypeAdapter(
+            type_, config=pydantic.ConfigDict(arbitrary_types_allowed=True)
+        )
+    except pydantic.PydanticUserError:
+        # Models (and dataclasses) carry their own config
+        return pydantic.TypeAdapter(type_)
+
+
+class TypeAdapter(Generic[T]):
+    """
+    Validator for values of type `type_`.
+
+    The parsing model (and its field) are built once, so that values can then be
+    validated repeatedly without the overhead of `pydantic.parse_obj_as`, which
+    both looks up the model and instantiates it for each value.
+
+    Types involving pydantic v2 models are instead validated by the `TypeAdapter`
+    of pydantic v2 (unless they also involve pydantic v1 models).
+    """
+
+    type: Type[T]
+    model: Optional[Type[BaseModel]]
+    field: Optional[ModelField]
+    json_loads: Callable[[Union[str, bytes]], Any]
+
+    def __init__(
+        self, type_: Type[T], /, *, arbitrary_types_allowed: bool = False
+    ) -> None:
+        self.type = type_
+        self.model = None
+        self.field = None
+        self.json_loads = json.loads
+
+        self._adapter: Optional[Any] = None
+
+        if has_v2_model(type_) and not _has_v1_model(type_):
+            self._adapter = _build_v2_adapter(
+                type_, arbitrary_types_allowed=arbitrary_types_allowed
+            )
+        else:
+            self.model = create_model(
+                f"ParsingModel[{display_as_type(type_)}]",
+                __config__=ArbitraryTypesConfig if arbitrary_types_allowed else None,
+                __root__=(type_, ...),
+            )
+            self.field = self.model.__fields__["__root__"]
+            self.json_loads = self.model.__config__.json_loads
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({display_as_type(self.type)})"
+
+    def validate_python(self, obj: Any, /) -> T:
+        if self._adapter is not None:
+            return self._adapter.validate_python(obj)
+
+        assert self.model is not None and self.field is not None
+
+        value: Any
+        errors: Any
+        value, errors = self.field.validate(obj, {}, loc="__root__", cls=self.model)
+
+        if errors:
+            raise ValidationError([errors], self.model)
+
+        return value
+
+    def validate_json(
+        self,
+        data: Union[str, bytes],
+        /,
+        *,
+        loads: Optional[Callable[[Union[str, bytes]], Any]] = None,
+    ) -> T:
+        """
+        Validate JSON `data`, decoded by `loads` (if given).
+
+        Pydantic v2 adapters decode and validate `data` in a single pass, so do
+        not use `loads`.
+        """
+
+        if self._adapter is not None:
+            return self._adapter.validate_json(data)
+
+        return self.validate_python((loads or self.json_loads)(data))
+
+    def construct_python(self, obj: Any, /) -> T:
+        """Build a value of this type from `obj` *without* validation"""
+
+        return get_constructor(self.type)(obj)
+
+    def construct_json(
+        self,
+        data: Union[str, bytes],
+        /,
+        *,
+        loads: Optional[Callable[[Union[str, bytes]], Any]] = None,
+    ) -> T:
+        return self.construct_python((loads or self.json_loads)(data))
+
+
+@functools.lru_cache(maxsize=2048)
+def _get_type_adapter(type_: Any, arbitrary_types_allowed: bool, /) -> TypeAdapter:
+    return TypeAdapter(type_, arbitrary_types_allowed=arbitrary_types_allowed)
+
+
+def get_type_adapter(
+    type_: Type[T], /, *, arbitrary_types_allowed: bool = False
+) -> TypeAdapter[T]:
+    """
+    Get the (cached) type adapter for `type_`.
+
+    Annotations that can't be hashed (and so can't be cached) get a fresh adapter.
+    """
+
+    try:
+        return _get_type_adapter(type_, arbitrary_types_allowed)
+    except TypeError:
+        return TypeAdapter(type_, arbitrary_types_allowed=arbitrary_types_allowed)
+
+
+def _identity(obj: Any, /) -> Any:
+    return obj
+
+
+def _get_type_hints(cls: type, /) -> Mapping[str, Any]:
+    try:
+        # The class is made available so that self-referencing types resolve
+        return typing.get_type_hints(cls, localns={cls.__name__: cls})
+    except (NameError, TypeError):
+        return {}
+
+
+def _build_model_constructor(
+    model: type, building: MutableMapping[Any, Constructor], /
+) -> Constructor:
+    hints: Mapping[str, Any] = _get_type_hints(model)
+
+    fields: Sequence[Tuple[str, str, Constructor]]
+    construct_model: Callable[..., Any]
+
+    if issubclass(model, BaseModel):
+        fields = [
+            (
+                field.alias,
+                name,
+                _build_constructor(hints.get(name, field.outer_type_), building),
+            )
+            for name, field in model.__fields__.items()
+        ]
+        construct_model = model.construct
+    else:
+        # Pydantic v2 model
+        fields = [
+            (
+                field.alias if field.alias is not None else name,
+                name,
+                _build_constructor(hints.get(name, field.annotation), building),
+            )
+            for name, field in model.model_fields.items()  # type: ignore
+        ]
+        construct_model = model.model_construct  # type: ignore
+
+    def construct(obj: Any, /) -> Any:
+        if not isinstance(obj, dict):
+            return obj
+
+        values: MutableMapping[str, Any] = {}
+
+        alias: str
+        name: str
+        constructor: Constructor
+        for alias, name, constructor in fields:
+            if alias in obj:
+                value: Any = obj[alias]
+
+                values[name] = (
+                    constructor(value)
+                    if value is not None and constructor is not _identity
+                    else value
+                )
+
+        return construct_model(**values)
+
+    return construct
+
+
+def _build_class_constructor(
+    cls: type, building: MutableMapping[Any, Constructor], /
+) -> Constructor:
+    hints: Mapping[str, Any] = _get_type_hints(cls)
+
+    names: Sequence[str]
+    if dataclasses.is_dataclass(cls):
+        names = [field.name for field in dataclasses.fields(cls) if field.init]
+    else:
+        names = cls._fields  # type: ignore
+
+    fields: Sequence[Tuple[str, Constructor]] = [
+        (name, _build_constructor(hints.get(name, Any), building)) for name in names
+    ]
+
+    def construct(obj: Any, /) -> Any:
+        if isinstance(obj, dict):
+            return cls(
+                **{
+                    name: constructor(obj[name]) if obj[name] is not None else None
+                    for name, constructor in fields
+                    if name in obj
+                }
+            )
+        if isinstance(obj, (list, tuple)) and not dataclasses.is_dataclass(cls):
+            return cls(
+                *(
+                    constructor(value) if value is not None else None
+                    for (_, constructor), value in zip(fields, obj)
+                )
+            )
+
+        return obj
+
+    return construct
+
+
+def _build_constructor(
+    type_: Any, building: MutableMapping[Any, Constructor], /
+) -> Constructor:
+    origin: Any = get_origin(type_)
+    args: Tuple[Any, ...] = get_args(type_)
+
+    if origin is Annotated:
+        return _build_constructor(args[0], building)
+
+    if origin is Union:
+        members: Sequence[Any] = [arg for arg in args if arg is not NoneType]
+
+        # Unions other than `Optional[T]` would need validation to pick a member
+        if len(members) != 1:
+            return _identity
+
+        member: Constructor = _build_constructor(members[0], building)
+
+        if member is _identity:
+            return _identity
+
+        return lambda obj: member(obj) if obj is not None else None
+
+    if origin in SEQUENCE_TYPES:
+        container: Callable[[Any], Any] = SEQUENCE_TYPES[origin]
+        item: Constructor = _build_constructor(args[0] if args else Any, building)
+
+        # Decoded JSON arrays are already lists
+        if item is _identity and container is list:
+            return _identity
+        if item is _identity:
+            return lambda obj: container(obj) if isinstance(obj, list) else obj
+
+        return lambda obj: (
+            container(item(value) for value in obj) if isinstance(obj, list) else obj
+        )
+
+    if origin is tuple:
+        items: Sequence[Constructor]
+
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = _build_constructor(args[0], building)
+
+            return lambda obj: (
+                tuple(item(value) for value in obj) if isinstance(obj, list) else obj
+            )
+
+        items = [_build_constructor(arg, building) for arg in args]
+
+        return lambda obj: (
+            tuple(item(value) for item, value in zip(items, obj))
+            if isinstance(obj, list)
+            else obj
+        )
+
+    if origin in MAPPING_TYPES:
+        key: Constructor = _build_constructor(args[0] if args else Any, building)
+        value: Constructor = _build_constructor(args[1] if args else Any, building)
+
+        return lambda obj: (
+            {key(k): value(v) for k, v in obj.items()} if isinstance(obj, dict) else obj
+        )
+
+    if not isinstance(type_, type):
+        return _identity
+
+    # Recursive types (e.g. self-referencing models) defer to the constructor
+    # currently being built
+    if type_ in building:
+        return lambda obj: building[type_](obj)
+
+    constructor: Constructor
+
+    building[type_] = _identity
+
+    if is_model_type(type_):
+        constructor = _build_model_constructor(type_, building)
+    elif dataclasses.is_dataclass(type_) or (
+        issubclass(type_, tuple) and hasattr(type_, "_fields")
+    ):
+        constructor = _build_class_constructor(type_, building)
+    elif issubclass(type_, enum.Enum):
+        constructor = type_
+    else:
+        constructor = _identity
+
+    building[type_] = constructor
+
+    return constructor
+
+
+@functools.lru_cache(maxsize=2048)
+def _get_constructor(type_: Any, /) -> Constructor:
+    return _build_constructor(type_, {})
+
+
+def get_constructor(type_: Any, /) -> Constructor:
+    """
+    Get a function that builds values of type `type_` from decoded JSON *without*
+    validating them.
+
+    Pydantic models are built with `Model.construct`, and dataclasses and named
+    tuples with their constructors. Containers of these are built recursively, but
+    all other values (e.g. strings and numbers) are passed through as-is.
+    """
+
+    try:
+        return _get_constructor(type_)
+    except TypeError:
+        return _build_constructor(type_, {})
@@ -1,14 +1,14 @@
 from typing import Any, Callable, Mapping, Tuple, Type
 
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo
-
 from . import utils
+from ._compat import BaseModel, FieldInfo, has_v2_model
+from .adapters import get_type_adapter
 from .validation import create_func_model
 
 __all__ = (
     "create_model_cls",
     "create_model",
+    "validate_v2_arguments",
     "bind_arguments",
 )
 
@@ -30,7 +30,29 @@ def create_model(
 ) -> BaseModel:
     model_cls: Type[BaseModel] = create_model_cls(func, fields)
 
-    return model_cls(**arguments)
+    return model_cls(**validate_v2_arguments(fields, arguments))
+
+
+def validate_v2_arguments(
+    fields: Mapping[str, Tuple[Any, FieldInfo]], arguments: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    """
+    Validate the arguments for any fields annotated with pydantic v2 models.
+
+    The (pydantic v1) function model treats pydantic v2 models as arbitrary types,
+    so these arguments are validated up-front.
+    """
+
+    return {
+        key: (
+            get_type_adapter(
+                fields[key][0], arbitrary_types_allowed=True
+            ).validate_python(value)
+            if value is not None and key in fields and has_v2_model(fields[key][0])
+            else value
+        )
+        for key, value in arguments.items()
+    }
 
 
 def bind_arguments(
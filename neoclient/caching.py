@@ -0,0 +1,701 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    BinaryIO,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import httpx
+
+from .enums import HTTPHeader
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (e.g. Windows)
+    fcntl = None  # type: ignore
+
+__all__ = (
+    "CacheEntry",
+    "Storage",
+    "MemoryStorage",
+    "DiskStorage",
+    "get_cache_key",
+    "parse_cache_control",
+    "parse_vary",
+)
+
+# Request headers that identify the user, so that responses aren't shared between
+# users (be it by a shared storage, or by a client re-used with other credentials)
+CREDENTIAL_HEADERS: Sequence[str] = (HTTPHeader.AUTHORIZATION, HTTPHeader.COOKIE)
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response.
+
+    The entry is fresh until `fresh_until`, and can be discarded once `expires_at`
+    has passed (the two differ when stale entries may still be served).
+    """
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+    fresh_until: float = float("inf")
+    expires_at: float = float("inf")
+
+    def is_fresh(self, now: Optional[float] = None, /) -> bool:
+        return (now if now is not None else time.time()) < self.fresh_until
+
+    def is_expired(self, now: Optional[float] = None, /) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+
+def get_cache_key(
+    request: httpx.Request, /, *, vary: Sequence[str] = ()
+) -> Optional[str]:
+    """
+    Get the cache key of `request`: a digest of its method, URL, body and
+    credentials (its `Authorization` and `Cookie` headers), as well as the headers
+    named by `vary` (those listed by a response's `Vary` header).
+
+    Requests with streamed bodies can't be keyed without consuming their stream,
+    so return `None`.
+    """
+
+    if not hasattr(request, "_content"):
+        return None
+
+    digest: Any = hashlib.sha256()
+
+    digest.update(request.method.encode("ascii"))
+    digest.update(b"\0")
+    digest.update(str(request.url).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(request.content)
+
+    name: str
+    for name in (*CREDENTIAL_HEADERS, *vary):
+        digest.update(b"\0")
+        digest.update(name.lower().encode("ascii"))
+        digest.update(b"\0")
+        digest.update(", ".join(request.headers.get_list(name)).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def parse_cache_control(value: Optional[str], /) -> Mapping[str, Optional[str]]:
+    """Parse the directives of a `Cache-Control` header (e.g. `max-age=60`)"""
+
+    directives: MutableMapping[str, Optional[str]] = {}
+
+    if not value:
+        return directives
+
+    directive: str
+    for directive in value.split(","):
+        name: str
+        argument: str
+        name, _, argument = directive.strip().partition("=")
+
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+
+    return directives
+
+
+def parse_vary(value: Optional[str], /) -> Sequence[str]:
+    """Parse the (sorted, lowercase) header names of a `Vary` header"""
+
+    if not value:
+        return ()
+
+    return sorted({name.strip().lower() for name in value.split(",") if name.strip()})
+
+
+class Storage(ABC):
+    """Storage of cached responses"""
+
+    @abstractmethod
+    def get(self, key: str, /) -> Optional[CacheEntry]:
+        """Get the (unexpired) entry stored for `key`"""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str, /) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return
+
+
+class MemoryStorage(Storage):
+    """Thread-safe in-memory storage, evicting the least recently used entries"""
+
+    maxsize: Optional[int]
+
+    def __init__(self, *, maxsize: Optional[int] = 1024) -> None:
+        self.maxsize = maxsize
+
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(maxsize={self.maxsize!r})>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, /) -> Optional[CacheEntry]:
+        with self._lock:
+            entry: Optional[CacheEntry] = self._entries.get(key)
+
+            if entry is None:
+                return None
+            if entry.is_expired():
+                del self._entries[key]
+
+                return None
+
+            self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str, /) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Record header: magic, flags, key length, metadata length, body length,
+# fresh until, expires at, CRC32 of the key, metadata and body
+_HEADER: struct.Struct = struct.Struct("<4sBHIQddI")
+_MAGIC: bytes = b"NCC1"
+_FLAG_TOMBSTONE: int = 1
+
+_INDEX_VERSION: int = 1
+
+
+@dataclass
+class _Record:
+    offset: int
+    key_length: int
+    meta_length: int
+    body_length: int
+    fresh_until: float
+    expires_at: float
+
+    @property
+    def meta_offset(self) -> int:
+        return self.offset + _HEADER.size + self.key_length
+
+    @property
+    def body_offset(self) -> int:
+        return self.meta_offset + self.meta_length
+
+    @property
+    def end(self) -> int:
+        return self.body_offset + self.body_length
+
+    @property
+    def size(self) -> int:
+        return self.end - self.offset
+
+
+class DiskStorage(Storage):
+    """
+    Persistent storage in an append-only log, shared by processes on the same host.
+
+    Each entry is appended to the log as a checksummed record, and entries are
+    deleted by appending tombstones. Records are read through `mmap`, straight from
+    the page cache. A record torn by a crash fails its checksum, so is ignored (and
+    truncated by the next write).
+
+    Writers hold an exclusive `flock` on the log's lock file, and readers a shared
+    one whilst scanning the log for records appended by other processes. Once the
+    log grows beyond `max_size` bytes, it is compacted: expired and deleted entries
+    are dropped, as are the oldest entries, until the log is at most three quarters
+    of `max_size`. The compacted log atomically replaces the old one, which readers
+    that have it mapped can continue to use until they next scan.
+
+    An index of the log's records is saved on compaction and `close`, so that the
+    log need not be scanned in full on start-up.
+
+    If `fsync` is set, each write is flushed to disk before it is indexed, trading
+    write throughput for durability across power loss.
+    """
+
+    directory: str
+    max_size: Optional[int]
+    fsync: bool
+
+    def __init__(
+        self,
+        directory: str,
+        /,
+        *,
+        max_size: Optional[int] = 256 * 1024 * 1024,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.fsync = fsync
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._log_path: str = os.path.join(directory, "cache.log")
+        self._index_path: str = os.path.join(directory, "cache.idx")
+
+        self._lock: threading.RLock = threading.RLock()
+        self._lock_file: BinaryIO = open(os.path.join(directory, "cache.lock"), "a+b")
+        self._file: Optional[BinaryIO] = None
+        self._inode: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._position: int = 0
+        self._records: MutableMapping[str, _Record] = {}
+
+        with self._lock, self._flock(shared=True):
+            self._open()
+            self._load_index()
+            self._scan()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}({self.directory!r}, max_size={self.max_size!r})>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: str, /) -> Optional[CacheEntry]:
+        with self._lock:
+            self._refresh()
+
+            record: Optional[_Record] = self._records.get(key)
+
+            if record is None or time.time() >= record.expires_at:
+                return None
+
+            data: mmap.mmap = self._map(record.end)
+
+            meta: Mapping[str, Any] = json.loads(
+                data[record.meta_offset : record.body_offset]
+            )
+
+            return CacheEntry(
+                status_code=meta["status_code"],
+                headers=[(name, value) for name, value in meta["headers"]],
+                content=data[record.body_offset : record.end],
+                stored_at=meta["stored_at"],
+                fresh_until=record.fresh_until,
+                expires_at=record.expires_at,
+            )
+
+    def set(self, key: str, entry: CacheEntry, /) -> None:
+        meta: bytes = json.dumps(
+            {
+                "status_code": entry.status_code,
+                "headers": entry.headers,
+                "stored_at": entry.stored_at,
+            }
+        ).encode("utf-8")
+
+        self._append(key, meta, entry.content, entry.fresh_until, entry.expires_at)
+
+    def delete(self, key: str, /) -> None:
+        with self._lock:
+            self._refresh()
+
+            if key in self._records:
+                self._append(key, b"", b"", 0.0, 0.0, flags=_FLAG_TOMBSTONE)
+
+    def clear(self) -> None:
+        with self._lock, self._flock(shared=False):
+            self._replace_log([])
+
+    def compact(self) -> None:
+        """Drop expired and deleted entries (and the oldest, if over `max_size`)"""
+
+        with self._lock, self._flock(shared=False):
+            self._scan()
+            self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+
+            with self._flock(shared=True):
+                self._scan()
+                self._save_index()
+
+            self._close()
+            self._lock_file.close()
+
+    @staticmethod
+    def _pack(
+        key: bytes,
+        meta: bytes,
+        body: bytes,
+        fresh_until: float,
+        expires_at: float,
+        flags: int,
+    ) -> bytes:
+        crc: int = zlib.crc32(body, zlib.crc32(meta, zlib.crc32(key)))
+
+        return b"".join(
+            (
+                _HEADER.pack(
+                    _MAGIC,
+                    flags,
+                    len(key),
+                    len(meta),
+                    len(body),
+                    fresh_until,
+                    expires_at,
+                    crc,
+                ),
+                key,
+                meta,
+                body,
+            )
+        )
+
+    def _append(
+        self,
+        key: str,
+        meta: bytes,
+        body: bytes,
+        fresh_until: float,
+        expires_at: float,
+        /,
+        *,
+        flags: int = 0,
+    ) -> None:
+        record_bytes: bytes = self._pack(
+            key.encode("utf-8"), meta, body, fresh_until, expires_at, flags
+        )
+
+        # Entries that could never fit are not stored
+        if self.max_size is not None and len(record_bytes) > self.max_size:
+            return
+
+        with self._lock, self._flock(shared=False):
+            self._scan()
+
+            assert self._file is not None
+
+            # Truncate any record torn by a writer that crashed
+            self._file.truncate(self._position)
+            self._file.seek(self._position)
+            self._file.write(record_bytes)
+            self._file.flush()
+
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+            self._index(key, self._position, record_bytes)
+            self._position += len(record_bytes)
+
+            if self.max_size is not None and self._position > self.max_size:
+                self._compact()
+
+    def _index(self, key: str, offset: int, record_bytes: bytes, /) -> None:
+        flags: int
+        key_length: int
+        meta_length: int
+        body_length: int
+        fresh_until: float
+        expires_at: float
+        (
+            _,
+            flags,
+            key_length,
+            meta_length,
+            body_length,
+            fresh_until,
+            expires_at,
+            _,
+        ) = _HEADER.unpack_from(record_bytes)
+
+        if flags & _FLAG_TOMBSTONE:
+            self._records.pop(key, None)
+
+            return
+
+        # Re-inserted, so that the records remain ordered by offset
+        self._records.pop(key, None)
+        self._records[key] = _Record(
+            offset=offset,
+            key_length=key_length,
+            meta_length=meta_length,
+            body_length=body_length,
+            fresh_until=fresh_until,
+            expires_at=expires_at,
+        )
+
+    def _refresh(self) -> None:
+        """Pick up any records written (or compactions made) by other processes"""
+
+        try:
+            stat: os.stat_result = os.stat(self._log_path)
+        except FileNotFoundError:
+            stat = None  # type: ignore
+
+        if (
+            stat is not None
+            and stat.st_ino == self._inode
+            and stat.st_size == self._position
+        ):
+            return
+
+        with self._flock(shared=True):
+            self._scan()
+
+    def _scan(self) -> None:
+        """Index the records appended to the log since it was last scanned"""
+
+        if not os.path.exists(self._log_path) or (
+            os.stat(self._log_path).st_ino != self._inode
+        ):
+            self._close()
+            self._open()
+
+        assert self._file is not None
+
+        size: int = os.fstat(self._file.fileno()).st_size
+
+        if size <= self._position:
+            return
+
+        data: mmap.mmap = self._map(size)
+
+        while self._position + _HEADER.size <= size:
+            magic: bytes
+            flags: int
+            key_length: int
+            meta_length: int
+            body_length: int
+            crc: int
+            (
+                magic,
+                flags,
+                key_length,
+                meta_length,
+                body_length,
+                _,
+                _,
+                crc,
+            ) = _HEADER.unpack_from(data, self._position)
+
+            start: int = self._position + _HEADER.size
+            end: int = start + key_length + meta_length + body_length
+
+            if magic != _MAGIC or end > size:
+                break
+
+            key: bytes = data[start : start + key_length]
+
+            if not self._verify(data, start, end, crc):
+                break
+
+            self._index(
+                key.decode("utf-8"),
+                self._position,
+                data[self._position : self._position + _HEADER.size],
+            )
+            self._position = end
+
+    @staticmethod
+    def _verify(data: mmap.mmap, start: int, end: int, crc: int, /) -> bool:
+        # Checksummed through a view, so that bodies aren't copied
+        with memoryview(data) as view, view[start:end] as record_view:
+            return zlib.crc32(record_view) == crc
+
+    def _compact(self) -> None:
+        now: float = time.time()
+
+        records: Sequence[Tuple[str, _Record]] = [
+            (key, record)
+            for key, record in self._records.items()
+            if now < record.expires_at
+        ]
+
+        if self.max_size is not None:
+            target_size: int = self.max_size * 3 // 4
+            total_size: int = sum(record.size for _, record in records)
+
+            index: int = 0
+            while total_size > target_size and index < len(records):
+                total_size -= records[index][1].size
+                index += 1
+
+            records = records[index:]
+
+        self._replace_log(records)
+
+    def _replace_log(self, records: Sequence[Tuple[str, _Record]], /) -> None:
+        temporary_path: str = f"{self._log_path}.{os.getpid()}.tmp"
+
+        data: Optional[mmap.mmap] = (
+            self._map(max(record.end for _, record in records)) if records else None
+        )
+
+        with open(temporary_path, "wb") as file:
+            for _, record in records:
+                assert data is not None
+
+                file.write(data[record.offset : record.end])
+
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temporary_path, self._log_path)
+
+        self._close()
+        self._open()
+        self._scan()
+        self._save_index()
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path, "rb") as file:
+                index: Mapping[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if (
+            index.get("version") != _INDEX_VERSION
+            or index.get("inode") != self._inode
+            or index.get("position", 0) > os.stat(self._log_path).st_size
+        ):
+            return
+
+        records: MutableMapping[str, _Record] = {
+            key: _Record(*values) for key, values in index["records"].items()
+        }
+
+        # Guard against the index describing a different log (e.g. one that reused
+        # the inode of a replaced log)
+        if records:
+            record: _Record = next(reversed(records.values()))
+            data: mmap.mmap = self._map(record.end)
+
+            header: Tuple[Any, ...] = _HEADER.unpack_from(data, record.offset)
+
+            if header[0] != _MAGIC or not self._verify(
+                data, record.offset + _HEADER.size, record.end, header[-1]
+            ):
+                return
+
+        self._records = records
+        self._position = index["position"]
+
+    def _save_index(self) -> None:
+        temporary_path: str = f"{self._index_path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": _INDEX_VERSION,
+                    "inode": self._inode,
+                    "position": self._position,
+                    "records": {
+                        key: [
+                            record.offset,
+                            record.key_length,
+                            record.meta_length,
+                            record.body_length,
+                            record.fresh_until,
+                            record.expires_at,
+                        ]
+                        for key, record in self._records.items()
+                    },
+                },
+                file,
+            )
+
+        os.replace(temporary_path, self._index_path)
+
+    def _open(self) -> None:
+        # Opened without truncating, creating the log if it doesn't exist
+        self._file = open(self._log_path, "a+b")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._position = 0
+        self._records = {}
+
+    def _close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _map(self, size: int, /) -> mmap.mmap:
+        """Map (at least) the first `size` bytes of the log"""
+
+        if self._mmap is None or len(self._mmap) < size:
+            assert self._file is not None
+
+            if self._mmap is not None:
+                self._mmap.close()
+
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return self._mmap
+
+    def _flock(self, *, shared: bool) -> "_FileLock":
+        return _FileLock(self._lock_file, shared=shared)
+
+
+class _FileLock:
+    def __init__(self, file: BinaryIO, /, *, shared: bool) -> None:
+        self._file = file
+        self._shared = shared
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(
+                self._file.fileno(), fcntl.LOCK_SH if self._shared else fcntl.LOCK_EX
+            )
+
+    def __exit__(self, *_: Any) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
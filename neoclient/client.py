@@ -22,6 +22,7 @@ from typing_extensions import ParamSpec
 from . import converters
 from .composition import get_fields, validate_fields
 from .constants import USER_AGENT
+from .decoders import Decoder
 from .defaults import (
     DEFAULT_AUTH,
     DEFAULT_BASE_URL,
@@ -30,16 +31,21 @@ from .defaults import (
     DEFAULT_EVENT_HOOKS,
     DEFAULT_FOLLOW_REDIRECTS,
     DEFAULT_HEADERS,
+    DEFAULT_HTTP1,
+    DEFAULT_HTTP2,
     DEFAULT_LIMITS,
     DEFAULT_MAX_REDIRECTS,
     DEFAULT_PARAMS,
     DEFAULT_TIMEOUT,
     DEFAULT_TRUST_ENV,
 )
+from .dns import DNSCache, install_dns_cache
 from .enums import HTTPHeader, HTTPMethod
 from .middleware import Middleware
 from .models import ClientOptions, Request, RequestOpts, Response
 from .operation import Operation, get_operation
+from .pool import KeepAlive, maintain, warmup
+from .transports import HostOptions, build_host_mounts, instrument
 from .types import (
     AuthTypes,
     CertTypes,
@@ -68,6 +74,7 @@ PS = ParamSpec("PS")
 RT = TypeVar("RT")
 
 D = TypeVar("D", bound=Dependency)
+C = TypeVar("C", bound="Client")
 
 
 class BaseService:
@@ -98,10 +105,13 @@ class Session(httpx.Client):
         cookies: Optional[CookiesTypes] = DEFAULT_COOKIES,
         verify: VerifyTypes = True,
         cert: Optional[CertTypes] = None,
-        http1: bool = True,
-        http2: bool = False,
+        http1: bool = DEFAULT_HTTP1,
+        http2: bool = DEFAULT_HTTP2,
         proxies: Optional[ProxiesTypes] = None,
         mounts: Optional[Mapping[str, BaseTransport]] = None,
+        hosts: Optional[Mapping[str, HostOptions]] = None,
+        max_concurrent_streams: Optional[int] = None,
+        dns_cache: Optional[DNSCache] = None,
         timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         follow_redirects: bool = DEFAULT_FOLLOW_REDIRECTS,
         limits: Limits = DEFAULT_LIMITS,
@@ -131,6 +141,15 @@ class Session(httpx.Client):
         # Set a default User-Agent header
         headers.setdefault(HTTPHeader.USER_AGENT, USER_AGENT)
 
+        # Host-specific transports are mounted, unless explicitly overridden
+        if hosts is not None:
+            mounts = {
+                **build_host_mounts(
+                    hosts, verify=verify, cert=cert, trust_env=trust_env
+                ),
+                **(mounts if mounts is not None else {}),
+            }
+
         super().__init__(
             auth=auth,
             params=params,
@@ -154,6 +173,11 @@ class Session(httpx.Client):
             default_encoding=default_encoding,
         )
 
+        instrument(self, max_concurrent_streams=max_concurrent_streams)
+
+        if dns_cache is not None:
+            install_dns_cache(self, dns_cache)
+
 
 @dataclass(init=False)
 class Client:
@@ -162,6 +186,11 @@ class Client:
     default_response: Optional[Dependency] = None
     request_dependencies: MutableSequence[Dependency] = field(default_factory=list)
     response_dependencies: MutableSequence[Dependency] = field(default_factory=list)
+    # If `None`, operations use their own setting (validating by default)
+    validate_response: Optional[bool] = None
+    validate_arguments: Optional[bool] = None
+    check_argument_types: Optional[bool] = None
+    decoder: Optional[Decoder] = None
 
     def __init__(
         self,
@@ -170,6 +199,10 @@ class Client:
         default_response: Optional[Dependency] = None,
         request_dependencies: Optional[Sequence[Dependency]] = None,
         response_dependencies: Optional[Sequence[Dependency]] = None,
+        validate_response: Optional[bool] = None,
+        validate_arguments: Optional[bool] = None,
+        check_argument_types: Optional[bool] = None,
+        decoder: Optional[Decoder] = None,
     ) -> None:
         self.client = client
         self.middleware = middleware if middleware is not None else Middleware()
@@ -180,6 +213,10 @@ class Client:
         self.response_dependencies = (
             [*response_dependencies] if response_dependencies is not None else []
         )
+        self.validate_response = validate_response
+        self.validate_arguments = validate_arguments
+        self.check_argument_types = check_argument_types
+        self.decoder = decoder
 
     def bind(self, func: Callable[PS, RT], /) -> Callable[PS, RT]:
         operation: Operation = get_operation(func)
@@ -205,6 +242,9 @@ class Client:
             middleware=middleware,
             request_dependencies=request_dependencies,
             response_dependencies=response_dependencies,
+            # Memoized values aren't shared with other clients (which may use other
+            # credentials)
+            cache=operation.cache.fork() if operation.cache is not None else None,
         )
 
         # If the operation doesn't have a response, use the client's default response
@@ -212,6 +252,21 @@ class Client:
         if bound_operation.response is None and self.default_response is not None:
             bound_operation.response = self.default_response
 
+        # If the operation doesn't specify whether to validate responses, use
+        # the client's setting
+        if bound_operation.validate_response is None:
+            bound_operation.validate_response = self.validate_response
+
+        # Likewise for whether to validate arguments (and check their types)
+        if bound_operation.validate_arguments is None:
+            bound_operation.validate_arguments = self.validate_arguments
+        if bound_operation.check_argument_types is None:
+            bound_operation.check_argument_types = self.check_argument_types
+
+        # Likewise for the decoder of responses
+        if bound_operation.decoder is None:
+            bound_operation.decoder = self.decoder
+
         # Add the client's middleware
         bound_operation.middleware.add_all(self.middleware.record)
 
@@ -266,6 +321,10 @@ class Client:
                 response=operation_response,
                 request_dependencies=request_dependencies,
                 response_dependencies=response_dependencies,
+                validate_response=self.validate_response,
+                validate_arguments=self.validate_arguments,
+                check_argument_types=self.check_argument_types,
+                decoder=self.decoder,
             )
 
             # Validate operation function parameters are acceptable
@@ -320,6 +379,26 @@ class Client:
 
         return dependency
 
+    def warmup(self, connections: int = 1, /) -> int:
+        """Open up to `connections` pooled connections to the base URL"""
+
+        if self.client is None:
+            raise ValueError("Cannot warm up connections without a client")
+
+        return warmup(self.client, connections=connections)
+
+    def close(self) -> None:
+        """Close the client, and with it the connections in its pool"""
+
+        if self.client is not None:
+            self.client.close()
+
+    def __enter__(self: C, /) -> C:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
 
 class NeoClient(Client):
     def __init__(
@@ -332,10 +411,13 @@ class NeoClient(Client):
         cookies: Optional[CookiesTypes] = DEFAULT_COOKIES,
         verify: VerifyTypes = True,
         cert: Optional[CertTypes] = None,
-        http1: bool = True,
-        http2: bool = False,
+        http1: bool = DEFAULT_HTTP1,
+        http2: bool = DEFAULT_HTTP2,
         proxies: Optional[ProxiesTypes] = None,
         mounts: Optional[Mapping[str, BaseTransport]] = None,
+        hosts: Optional[Mapping[str, HostOptions]] = None,
+        max_concurrent_streams: Optional[int] = None,
+        dns_cache: Optional[DNSCache] = None,
         timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         follow_redirects: bool = DEFAULT_FOLLOW_REDIRECTS,
         limits: Limits = DEFAULT_LIMITS,
@@ -349,6 +431,11 @@ class NeoClient(Client):
         default_response: Optional[Dependency] = None,
         request_dependencies: Optional[Sequence[Dependency]] = None,
         response_dependencies: Optional[Sequence[Dependency]] = None,
+        keep_alive: Optional[KeepAlive] = None,
+        validate_response: Optional[bool] = None,
+        validate_arguments: Optional[bool] = None,
+        check_argument_types: Optional[bool] = None,
+        decoder: Optional[Decoder] = None,
     ) -> None:
         super().__init__(
             client=Session(
@@ -362,6 +449,9 @@ class NeoClient(Client):
                 http2=http2,
                 proxies=proxies,
                 mounts=mounts,
+                hosts=hosts,
+                max_concurrent_streams=max_concurrent_streams,
+                dns_cache=dns_cache,
                 timeout=timeout,
                 follow_redirects=follow_redirects,
                 limits=limits,
@@ -385,4 +475,11 @@ class NeoClient(Client):
             response_dependencies=(
                 response_dependencies if response_dependencies is not None else []
             ),
+            validate_response=validate_response,
+            validate_arguments=validate_arguments,
+            check_argument_types=check_argument_types,
+            decoder=decoder,
         )
+
+        if keep_alive is not None and self.client is not None:
+            maintain(self.client, keep_alive)
@@ -0,0 +1,180 @@
+import importlib
+import importlib.util
+import json
+from abc import ABC, abstractmethod
+from typing import Any, MutableMapping, MutableSequence, Optional, Sequence
+
+import mediatype
+from mediatype import MediaType
+
+__all__ = (
+    "Codec",
+    "JSONCodec",
+    "MessagePackCodec",
+    "CBORCodec",
+    "CodecRegistry",
+    "registry",
+    "get_codec",
+    "register_codec",
+    "is_json",
+)
+
+
+class Codec(ABC):
+    """
+    Encoder and decoder of content of a media type.
+
+    Codecs handle each of their `media_types` (e.g. `application/msgpack`), and any
+    structured syntax `suffix` (e.g. `application/vnd.foo+msgpack`).
+    """
+
+    media_types: Sequence[str] = ()
+    suffix: Optional[str] = None
+
+    @abstractmethod
+    def encode(self, obj: Any, /) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, content: bytes, /) -> Any:
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    media_types: Sequence[str] = ("application/json",)
+    suffix: Optional[str] = "json"
+
+    def encode(self, obj: Any, /) -> bytes:
+        # Matches the encoding of JSON request content by httpx
+        return json.dumps(obj).encode("utf-8")
+
+    def decode(self, content: bytes, /) -> Any:
+        return json.loads(content)
+
+
+class MessagePackCodec(Codec):
+    """Codec for MessagePack, using `msgpack`"""
+
+    media_types: Sequence[str] = (
+        "application/msgpack",
+        "application/x-msgpack",
+        "application/vnd.msgpack",
+    )
+    suffix: Optional[str] = "msgpack"
+
+    def __init__(self) -> None:
+        self._msgpack: Any = importlib.import_module("msgpack")
+
+    def encode(self, obj: Any, /) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True)
+
+    def decode(self, content: bytes, /) -> Any:
+        return self._msgpack.unpackb(content, raw=False)
+
+
+class CBORCodec(Codec):
+    """Codec for CBOR, using `cbor2`"""
+
+    media_types: Sequence[str] = ("application/cbor",)
+    suffix: Optional[str] = "cbor"
+
+    def __init__(self) -> None:
+        self._cbor2: Any = importlib.import_module("cbor2")
+
+    def encode(self, obj: Any, /) -> bytes:
+        return self._cbor2.dumps(obj)
+
+    def decode(self, content: bytes, /) -> Any:
+        return self._cbor2.loads(content)
+
+
+class CodecRegistry:
+    """
+    Registry of codecs, keyed on media type.
+
+    Codecs registered later take precedence over those registered earlier.
+    Lookups are cached by content type, as responses of an API tend to share a
+    handful of content types.
+    """
+
+    codecs: MutableSequence[Codec]
+
+    def __init__(self, codecs: Optional[Sequence[Codec]] = None, /) -> None:
+        self.codecs = [*codecs] if codecs is not None else []
+
+        self._cache: MutableMapping[str, Optional[Codec]] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.codecs!r})"
+
+    def register(self, codec: Codec, /) -> None:
+        self.codecs.append(codec)
+        self._cache.clear()
+
+    def get(self, content_type: Optional[str], /) -> Optional[Codec]:
+        """Get the codec for `content_type` (e.g. `application/json; charset=utf-8`)"""
+
+        if not content_type:
+            return None
+
+        try:
+            return self._cache[content_type]
+        except KeyError:
+            pass
+
+        codec: Optional[Codec] = self._lookup(content_type)
+
+        # Bound the cache, in case of content types with varying parameters
+        if len(self._cache) >= 256:
+            self._cache.clear()
+
+        self._cache[content_type] = codec
+
+        return codec
+
+    def _lookup(self, content_type: str, /) -> Optional[Codec]:
+        media_type: MediaType
+
+        try:
+            media_type = mediatype.parse(content_type)
+        except ValueError:
+            return None
+
+        essence: str = f"{media_type.type}/{media_type.subtype}".lower()
+
+        codec: Codec
+        for codec in reversed(self.codecs):
+            if essence in codec.media_types:
+                return codec
+
+        if media_type.suffix is not None:
+            for codec in reversed(self.codecs):
+                if codec.suffix == media_type.suffix.lower():
+                    return codec
+
+        return None
+
+
+registry: CodecRegistry = CodecRegistry([JSONCodec()])
+
+# MessagePack and CBOR are only supported if their (optional) libraries are installed
+if importlib.util.find_spec("msgpack") is not None:
+    registry.register(MessagePackCodec())
+if importlib.util.find_spec("cbor2") is not None:
+    registry.register(CBORCodec())
+
+
+def get_codec(content_type: Optional[str], /) -> Optional[Codec]:
+    """Get the codec for `content_type` from the default registry"""
+
+    return registry.get(content_type)
+
+
+def register_codec(codec: Codec, /) -> None:
+    """Register `codec` with the default registry"""
+
+    registry.register(codec)
+
+
+def is_json(codec: Optional[Codec], /) -> bool:
+    return codec is None or isinstance(codec, JSONCodec)
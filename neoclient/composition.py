@@ -1,19 +1,40 @@
 import collections.abc
 import dataclasses
+import functools
 import inspect
 import typing
-import urllib.parse
 from collections import Counter
-from typing import Any, Callable, Mapping, MutableMapping, MutableSequence, Set, Tuple
-
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo, ModelField
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from . import api, utils
-from .errors import DuplicateParameters
+from ._compat import (
+    MODEL_TYPES,
+    PYDANTIC_V2,
+    BaseModel,
+    FieldInfo,
+    ModelField,
+    Required,
+    Undefined,
+)
+from .builders import building
+from .errors import CompositionError, DuplicateParameters
 from .models import RequestOpts
 from .params import (
     BodyParameter,
+    ContentParameter,
     Parameter,
     PathParameter,
     QueryParameter,
@@ -22,23 +43,127 @@ from .params import (
 from .validation import ValidatedFunction
 
 __all__ = (
+    "Composition",
+    "get_composition",
     "get_fields",
     "validate_fields",
+    "bind_fields",
     "compose",
 )
 
 
+@dataclass(frozen=True)
+class Composition:
+    """
+    The prepared (and validated) fields of a function, for composing requests.
+
+    Compositions are prepared once per function (and path), then shared by each of
+    its calls, so shouldn't be mutated. Compositions of bound methods are shared by
+    each binding of the same function (e.g. by each instance of a service).
+    """
+
+    fields: Mapping[str, Tuple[Any, Parameter]]
+    # Streamed content is passed through as-is, as exporting it from the model
+    # would otherwise attempt to copy (and potentially consume) it.
+    content_fields: FrozenSet[str]
+    # The function composed (for bound methods, the underlying function), so that
+    # the composition doesn't keep the object a method is bound to alive
+    func: Callable
+    method: bool
+    # The signature of calls (for bound methods, excluding the bound argument)
+    signature: inspect.Signature
+    path_params: FrozenSet[str]
+
+    @classmethod
+    def prepare(cls, func: Callable, path_params: FrozenSet[str], /) -> "Composition":
+        fields: Mapping[str, Tuple[Any, Parameter]] = _get_fields(func, path_params)
+
+        # Validate that the fields are acceptable
+        validate_fields(fields)
+
+        return cls(
+            fields=MappingProxyType(fields),
+            content_fields=frozenset(
+                field_name
+                for field_name, (_, parameter) in fields.items()
+                if isinstance(parameter, ContentParameter)
+            ),
+            func=_get_function(func),
+            method=inspect.ismethod(func),
+            signature=inspect.signature(func),
+            path_params=path_params,
+        )
+
+    @functools.cached_property
+    def model_cls(self) -> Type[BaseModel]:
+        return api.create_model_cls(self.func, self.fields)
+
+    def is_current(self, request: Optional[RequestOpts], func: Callable, /) -> bool:
+        """Whether this is (still) the composition of `func` for `request`"""
+
+        return (
+            self.func is _get_function(func)
+            and self.method is inspect.ismethod(func)
+            and self.path_params == _get_path_params(request)
+        )
+
+    def bind_arguments(
+        self, args: Tuple[Any, ...], kwargs: Mapping[str, Any], /
+    ) -> Mapping[str, Any]:
+        """Bind the arguments of a call, as `api.bind_arguments` would"""
+
+        bound_arguments: inspect.BoundArguments = self.signature.bind(*args, **kwargs)
+
+        bound_arguments.apply_defaults()
+
+        return {
+            key: value
+            for key, value in bound_arguments.arguments.items()
+            if not isinstance(value, FieldInfo)
+        }
+
+
+def get_composition(request: Optional[RequestOpts], func: Callable) -> Composition:
+    """
+    Prepare the composition of `func` for `request`.
+
+    Compositions aren't cached, so should be kept by their owner (e.g. an
+    operation) and shared by each of its calls.
+    """
+
+    return Composition.prepare(func, _get_path_params(request))
+
+
+def _get_function(func: Callable, /) -> Callable:
+    # Bound methods are wrapped per binding (e.g. by `Operation.wrapper`), so are
+    # unwrapped to the function they were bound from
+    if inspect.ismethod(func):
+        return inspect.unwrap(func.__func__)
+
+    return func
+
+
+def _get_path_params(request: Optional[RequestOpts], /) -> FrozenSet[str]:
+    return request.url_template.placeholders if request is not None else frozenset()
+
+
 def get_fields(
-    request: RequestOpts,
+    request: Optional[RequestOpts],
     func: Callable,
 ) -> Mapping[str, Tuple[Any, Parameter]]:
-    path_params: Set[str] = (
-        utils.parse_format_string(urllib.parse.unquote(str(request.url)))
-        if request is not None
-        else set()
+    return _get_fields(
+        func,
+        request.url_template.placeholders if request is not None else frozenset(),
     )
 
-    validated_function: ValidatedFunction = ValidatedFunction(func)
+
+def _get_fields(
+    func: Callable, path_params: FrozenSet[str], /
+) -> Mapping[str, Tuple[Any, Parameter]]:
+    # Pydantic v2 models are validated separately (see `api.create_model`)
+    validated_function: ValidatedFunction = ValidatedFunction(
+        func, config={"arbitrary_types_allowed": True} if PYDANTIC_V2 else None
+    )
 
     parameters: Mapping[str, inspect.Parameter] = (
         validated_function.signature.parameters
@@ -68,7 +193,7 @@ def get_fields(
             elif (
                 (
                     isinstance(model_field.annotation, type)
-                    and issubclass(model_field.annotation, (BaseModel, dict))
+                    and issubclass(model_field.annotation, (*MODEL_TYPES, dict))
                 )
                 or dataclasses.is_dataclass(model_field.annotation)
                 or (
@@ -134,26 +259,124 @@ def validate_fields(fields: Mapping[str, Tuple[Any, Parameter]], /) -> None:
         raise DuplicateParameters(f"Duplicate parameters: {duplicate_aliases!r}")
 
 
+def bind_fields(
+    fields: Mapping[str, Tuple[Any, Parameter]],
+    arguments: Mapping[str, Any],
+    /,
+    *,
+    check_types: bool = False,
+) -> Mapping[str, Any]:
+    """
+    Bind `arguments` to `fields` *without* validating them.
+
+    Omitted arguments take the default of their parameter. If `check_types` is set,
+    each argument is (cheaply) checked to be an instance of its annotation.
+    """
+
+    bound_arguments: MutableMapping[str, Any] = {}
+
+    field_name: str
+    annotation: Any
+    parameter: Parameter
+    for field_name, (annotation, parameter) in fields.items():
+        argument: Any
+
+        if field_name in arguments:
+            argument = arguments[field_name]
+        elif parameter.default_factory is not None:
+            argument = parameter.default_factory()
+        elif parameter.default not in (Undefined, Required):
+            argument = parameter.default
+        else:
+            raise CompositionError(f"Missing argument for parameter {field_name!r}")
+
+        if (
+            check_types
+            and argument is not None
+            and not utils.is_instance(argument, annotation)
+        ):
+            raise CompositionError(
+                f"Argument for parameter {field_name!r} has incorrect type."
+                f" Expected {annotation!r}, got {type(argument)!r}"
+            )
+
+        bound_arguments[field_name] = argument
+
+    return bound_arguments
+
+
 def compose(
     func: Callable,
     request: RequestOpts,
     args: Tuple[Any, ...],
     kwargs: Mapping[str, Any],
+    *,
+    validate: bool = True,
+    check_types: bool = False,
+    composition: Optional[Composition] = None,
 ) -> None:
-    arguments: Mapping[str, Any] = api.bind_arguments(func, args, kwargs)
+    """
+    Compose `request` from the arguments of a call to `func`.
 
-    fields: Mapping[str, Tuple[Any, Parameter]] = get_fields(request, func)
+    If no `composition` (of `func`, for `request`) is given, one is prepared.
+    """
 
-    # Validate that the fields are acceptable
-    validate_fields(fields)
+    if composition is None:
+        composition = get_composition(request, func)
 
-    model: BaseModel = api.create_model(func, fields, arguments)
+    # Query params are built up in place, rather than copied as each is added
+    with building(request):
+        _compose(
+            composition,
+            request,
+            args,
+            kwargs,
+            validate=validate,
+            check_types=check_types,
+        )
 
-    # By this stage the arguments have been validated
-    validated_arguments: Mapping[str, Any] = model.dict()
+
+def _compose(
+    composition: Composition,
+    request: RequestOpts,
+    args: Tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    *,
+    validate: bool = True,
+    check_types: bool = False,
+) -> None:
+    arguments: Mapping[str, Any] = composition.bind_arguments(args, kwargs)
+
+    fields: Mapping[str, Tuple[Any, Parameter]] = composition.fields
 
     field_name: str
     parameter: Parameter
+
+    # Trusted callers may skip validation, in which case arguments are passed
+    # through to their parameters as-is
+    if not validate:
+        bound_arguments: Mapping[str, Any] = bind_fields(
+            fields, arguments, check_types=check_types
+        )
+
+        for field_name, (_, parameter) in fields.items():
+            parameter.compose(request, bound_arguments[field_name])
+
+        return
+
+    model: BaseModel = composition.model_cls(
+        **api.validate_v2_arguments(fields, arguments)
+    )
+
+    # By this stage the arguments have been validated
+    validated_arguments: Mapping[str, Any] = {
+        **model.dict(exclude=composition.content_fields),
+        **{
+            field_name: getattr(model, field_name)
+            for field_name in composition.content_fields
+        },
+    }
+
     for field_name, (_, parameter) in fields.items():
         argument: Any = validated_arguments[field_name]
 
@@ -0,0 +1,215 @@
+import importlib
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, Mapping, Optional, Type
+
+import httpx
+
+__all__ = (
+    "CompressionStats",
+    "Compressor",
+    "GzipCompressor",
+    "ZstdCompressor",
+    "COMPRESSORS",
+    "get_compressor",
+    "StatsRecorder",
+    "CompressedStream",
+)
+
+
+@dataclass
+class CompressionStats:
+    """
+    Statistics of compressed request bodies.
+
+    `bytes_in` and `bytes_out` are the sizes of bodies before and after compression,
+    and `cpu_time` the (thread) CPU time in seconds spent compressing them.
+    """
+
+    requests: int = 0
+    compressed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_time: float = 0.0
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """The compressed size of bodies as a fraction of their original size"""
+
+        if not self.bytes_in:
+            return None
+
+        return self.bytes_out / self.bytes_in
+
+
+class Compressor(ABC):
+    """Compressor for a content coding (e.g. `gzip`)"""
+
+    encoding: str
+
+    def compress(self, data: bytes, /) -> bytes:
+        compressobj: Any = self.compressobj()
+
+        return compressobj.compress(data) + compressobj.flush()
+
+    @abstractmethod
+    def compressobj(self) -> Any:
+        """Create an incremental compressor (with `compress` and `flush` methods)"""
+
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    encoding: str = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compressobj(self) -> Any:
+        # A window size of 16 + MAX_WBITS writes a gzip header and trailer
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class ZstdCompressor(Compressor):
+    """
+    Compressor for Zstandard, using `zstandard`.
+
+    `zstandard.ZstdCompressor`s are not thread-safe, so one is kept (and re-used)
+    per thread.
+    """
+
+    encoding: str = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        self.level = level
+
+        self._zstandard: Any = importlib.import_module("zstandard")
+        self._local: threading.local = threading.local()
+
+    def compress(self, data: bytes, /) -> bytes:
+        return self._get_compressor().compress(data)
+
+    def compressobj(self) -> Any:
+        return self._get_compressor().compressobj()
+
+    def _get_compressor(self) -> Any:
+        compressor: Optional[Any] = getattr(self._local, "compressor", None)
+
+        if compressor is None:
+            compressor = self._zstandard.ZstdCompressor(level=self.level)
+
+            self._local.compressor = compressor
+
+        return compressor
+
+
+COMPRESSORS: Mapping[str, Type[Compressor]] = {
+    GzipCompressor.encoding: GzipCompressor,
+    ZstdCompressor.encoding: ZstdCompressor,
+}
+
+
+def get_compressor(encoding: str, /, *, level: Optional[int] = None) -> Compressor:
+    if encoding not in COMPRESSORS:
+        raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+    compressor_cls: Type[Any] = COMPRESSORS[encoding]
+
+    return compressor_cls() if level is None else compressor_cls(level)
+
+
+class StatsRecorder:
+    """Thread-safe recorder of `CompressionStats`"""
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._stats: CompressionStats = CompressionStats()
+
+    @property
+    def stats(self) -> CompressionStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = CompressionStats()
+
+    def record(
+        self,
+        *,
+        requests: int = 0,
+        compressed: int = 0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        cpu_time: float = 0.0,
+    ) -> None:
+        with self._lock:
+            self._stats.requests += requests
+            self._stats.compressed += compressed
+            self._stats.bytes_in += bytes_in
+            self._stats.bytes_out += bytes_out
+            self._stats.cpu_time += cpu_time
+
+
+class CompressedStream(httpx.SyncByteStream):
+    """
+    Stream that lazily compresses the chunks of `stream`.
+
+    The stream may be iterated more than once (e.g. if the request is retried),
+    but stats are only recorded for the first complete iteration, so that they
+    count each request once.
+    """
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        compressor: Compressor,
+        recorder: StatsRecorder,
+        /,
+    ) -> None:
+        self._stream = stream
+        self._compressor = compressor
+        self._recorder = recorder
+        self._recorded: bool = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressobj: Any = self._compressor.compressobj()
+
+        bytes_in: int = 0
+        bytes_out: int = 0
+        cpu_time: float = 0.0
+
+        start: float
+        chunk: bytes
+        for chunk in self._stream:
+            start = time.thread_time()
+            compressed_chunk: bytes = compressobj.compress(chunk)
+            cpu_time += time.thread_time() - start
+
+            bytes_in += len(chunk)
+            bytes_out += len(compressed_chunk)
+
+            if compressed_chunk:
+                yield compressed_chunk
+
+        start = time.thread_time()
+        final_chunk: bytes = compressobj.flush()
+        cpu_time += time.thread_time() - start
+
+        bytes_out += len(final_chunk)
+
+        if not self._recorded:
+            self._recorded = True
+
+            self._recorder.record(
+                bytes_in=bytes_in, bytes_out=bytes_out, cpu_time=cpu_time
+            )
+
+        if final_chunk:
+            yield final_chunk
+
+    def close(self) -> None:
+        self._stream.close()
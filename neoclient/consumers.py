@@ -45,6 +45,8 @@ __all__ = (
 
 @dataclass(init=False)
 class QueryConsumer(SupportsConsumeClient, SupportsConsumeRequest):
+    __slots__ = ("key", "values")
+
     key: str
     values: Sequence[str]
 
@@ -75,6 +77,8 @@ class QueryConsumer(SupportsConsumeClient, SupportsConsumeRequest):
 
 @dataclass(init=False)
 class HeaderConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("key", "values")
+
     key: str
     values: Sequence[str]
 
@@ -105,6 +109,8 @@ class HeaderConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class CookieConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("key", "value")
+
     key: str
     value: str
 
@@ -121,6 +127,8 @@ class CookieConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class PathConsumer(SupportsConsumeRequest):
+    __slots__ = ("key", "value")
+
     key: str
     value: str
 
@@ -134,6 +142,8 @@ class PathConsumer(SupportsConsumeRequest):
 
 @dataclass(init=False)
 class QueryParamsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("params",)
+
     params: QueryParams
 
     def __init__(self, params: QueryParamsTypes, /) -> None:
@@ -148,6 +158,8 @@ class QueryParamsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class HeadersConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("headers",)
+
     headers: Headers
 
     def __init__(self, headers: HeadersTypes, /) -> None:
@@ -162,6 +174,8 @@ class HeadersConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class CookiesConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("cookies",)
+
     cookies: Cookies
 
     def __init__(self, cookies: CookiesTypes, /) -> None:
@@ -176,22 +190,31 @@ class CookiesConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass
 class PathParamsConsumer(SupportsConsumeRequest):
+    __slots__ = ("path_params",)
+
     path_params: Mapping[str, str]
 
     def consume_request(self, request: RequestOpts, /) -> None:
         request.path_params.update(self.path_params)
 
 
-@dataclass
+@dataclass(init=False)
 class ContentConsumer(SupportsConsumeRequest):
+    __slots__ = ("content",)
+
     content: RequestContent
 
+    def __init__(self, content: RequestContent, /) -> None:
+        self.content = converters.convert_content(content)
+
     def consume_request(self, request: RequestOpts, /) -> None:
         request.content = self.content
 
 
 @dataclass
 class DataConsumer(SupportsConsumeRequest):
+    __slots__ = ("data",)
+
     data: RequestData
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -200,6 +223,8 @@ class DataConsumer(SupportsConsumeRequest):
 
 @dataclass
 class FilesConsumer(SupportsConsumeRequest):
+    __slots__ = ("files",)
+
     files: RequestFiles
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -208,6 +233,8 @@ class FilesConsumer(SupportsConsumeRequest):
 
 @dataclass
 class JsonConsumer(SupportsConsumeRequest):
+    __slots__ = ("json",)
+
     json: JsonTypes
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -216,6 +243,8 @@ class JsonConsumer(SupportsConsumeRequest):
 
 @dataclass(init=False)
 class TimeoutConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("timeout",)
+
     timeout: Timeout
 
     def __init__(self, timeout: TimeoutTypes, /) -> None:
@@ -230,6 +259,8 @@ class TimeoutConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass
 class StateConsumer(SupportsConsumeRequest):
+    __slots__ = ("key", "value")
+
     key: str
     value: Any
 
@@ -239,6 +270,8 @@ class StateConsumer(SupportsConsumeRequest):
 
 @dataclass
 class MountConsumer(SupportsConsumeRequest):
+    __slots__ = ("path",)
+
     path: str
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -247,6 +280,8 @@ class MountConsumer(SupportsConsumeRequest):
 
 @dataclass
 class BaseURLConsumer(SupportsConsumeClient):
+    __slots__ = ("base_url",)
+
     base_url: str
 
     def consume_client(self, client: ClientOptions, /) -> None:
@@ -255,6 +290,8 @@ class BaseURLConsumer(SupportsConsumeClient):
 
 @dataclass
 class VerifyConsumer(SupportsConsumeClient):
+    __slots__ = ("verify",)
+
     verify: VerifyTypes
 
     def consume_client(self, client: ClientOptions, /) -> None:
@@ -263,6 +300,8 @@ class VerifyConsumer(SupportsConsumeClient):
 
 @dataclass
 class FollowRedirectsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("follow_redirects",)
+
     follow_redirects: bool
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -1,3 +1,4 @@
+import mmap
 from http.cookiejar import CookieJar
 from typing import Mapping, MutableMapping, MutableSequence, Sequence
 
@@ -5,6 +6,7 @@ from httpx import Cookies, Headers, QueryParams, Timeout
 from httpx._utils import primitive_value_to_str
 
 from .errors import ConversionError
+from .streams import FileStream, is_seekable
 from .types import (
     CookiesTypes,
     CookieTypes,
@@ -15,6 +17,7 @@ from .types import (
     Primitive,
     QueryParamsTypes,
     QueryTypes,
+    RequestContent,
     TimeoutTypes,
 )
 from .utils import is_primitive
@@ -29,6 +32,7 @@ __all__ = (
     "convert_cookies",
     "convert_path_params",
     "convert_timeout",
+    "convert_content",
 )
 
 
@@ -134,3 +138,12 @@ def convert_path_params(
 
 def convert_timeout(value: TimeoutTypes, /) -> Timeout:
     return Timeout(value)
+
+
+def convert_content(value: RequestContent, /) -> RequestContent:
+    # Seekable files (and memory maps) are wrapped so that they have a known
+    # length and can be rewound if the request is sent more than once.
+    if isinstance(value, mmap.mmap) or (hasattr(value, "read") and is_seekable(value)):
+        return FileStream(value)  # type: ignore
+
+    return value
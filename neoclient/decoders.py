@@ -0,0 +1,224 @@
+import collections.abc
+import dataclasses
+import datetime
+import decimal
+import enum
+import functools
+import importlib
+import importlib.util
+import json
+import typing
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable, MutableSet, Optional, Union
+
+from typing_extensions import Annotated, Literal, get_args, get_origin
+
+from .adapters import TypeAdapter, get_type_adapter
+
+__all__ = (
+    "Decoder",
+    "JSONDecoder",
+    "OrjsonDecoder",
+    "MsgspecDecoder",
+    "get_default_decoder",
+)
+
+Loads = Callable[[Union[str, bytes]], Any]
+
+NoneType: type = type(None)
+
+# Types that msgspec decodes natively (besides structs, dataclasses etc.)
+MSGSPEC_TYPES: typing.Set[Any] = {
+    NoneType,
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    bytearray,
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    decimal.Decimal,
+}
+MSGSPEC_CONTAINERS: typing.Set[Any] = {
+    Union,
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+}
+
+
+class Decoder(ABC):
+    """
+    Decoder of JSON response content.
+
+    Content is decoded straight into the return annotation of an operation, so
+    that implementations can decode and validate it in a single pass.
+    """
+
+    @abstractmethod
+    def loads(self, content: Union[str, bytes], /) -> Any:
+        """Decode `content` into plain Python values (e.g. dicts and lists)"""
+
+        raise NotImplementedError
+
+    def decode(
+        self, content: Union[str, bytes], annotation: Any, /, *, validate: bool = True
+    ) -> Any:
+        """
+        Decode `content` into a value of type `annotation`.
+
+        If `validate` is disabled, the value is built *without* validation.
+        """
+
+        adapter: TypeAdapter = get_type_adapter(annotation)
+
+        if not validate:
+            return adapter.construct_json(content, loads=self.loads)
+
+        return adapter.validate_json(content, loads=self.loads)
+
+
+class JSONDecoder(Decoder):
+    """Decoder using the standard library's `json` module"""
+
+    def loads(self, content: Union[str, bytes], /) -> Any:
+        return json.loads(content)
+
+
+class OrjsonDecoder(Decoder):
+    """
+    Decoder using `orjson`.
+
+    Raises `orjson.JSONDecodeError` (a subclass of `json.JSONDecodeError`) if
+    content is not valid JSON.
+    """
+
+    def __init__(self) -> None:
+        self._loads: Loads = importlib.import_module("orjson").loads
+
+    def loads(self, content: Union[str, bytes], /) -> Any:
+        return self._loads(content)
+
+
+class MsgspecDecoder(Decoder):
+    """
+    Decoder using `msgspec`.
+
+    Annotations that msgspec supports (e.g. `msgspec.Struct`s, dataclasses, named
+    tuples and builtin types, and containers of these) are decoded *and* validated
+    by msgspec in a single pass. All other annotations (e.g. pydantic models) are
+    validated by pydantic.
+
+    msgspec validates more strictly than pydantic: strings are decoded as numbers
+    (e.g. `"1"` to `1`), but numbers are not decoded as strings, floats are not
+    truncated to integers, and `bytes` are decoded from base64. Values that do not
+    match raise `msgspec.ValidationError`, so this decoder must be opted into
+    (e.g. `NeoClient(..., decoder=MsgspecDecoder())`).
+
+    Content that is not valid JSON raises `json.JSONDecodeError`.
+    """
+
+    def __init__(self) -> None:
+        self._msgspec: Any = importlib.import_module("msgspec")
+        self._decoder: Any = self._msgspec.json.Decoder()
+
+    def loads(self, content: Union[str, bytes], /) -> Any:
+        try:
+            return self._decoder.decode(content)
+        except self._msgspec.DecodeError as error:
+            raise json.JSONDecodeError(str(error), str(content), 0) from error
+
+    def decode(
+        self, content: Union[str, bytes], annotation: Any, /, *, validate: bool = True
+    ) -> Any:
+        decoder: Optional[Any] = None
+
+        if validate:
+            try:
+                decoder = self._get_decoder(annotation)
+            except TypeError:
+                # Unhashable annotation
+                pass
+
+        if decoder is None:
+            return super().decode(content, annotation, validate=validate)
+
+        return decoder.decode(content)
+
+    @functools.lru_cache(maxsize=1024)
+    def _get_decoder(self, annotation: Any, /) -> Optional[Any]:
+        if not self._is_supported(annotation, set()):
+            return None
+
+        try:
+            return self._msgspec.json.Decoder(annotation, strict=False)
+        except TypeError:
+            return None
+
+    def _is_supported(self, annotation: Any, seen: MutableSet[Any], /) -> bool:
+        # msgspec would otherwise decode unsupported classes (e.g. pydantic models)
+        # by requiring values to already be instances of them
+        if annotation is Any or annotation is None or annotation in MSGSPEC_TYPES:
+            return True
+
+        origin: Any = get_origin(annotation)
+
+        if origin is Literal:
+            return True
+        if origin is Annotated:
+            return self._is_supported(get_args(annotation)[0], seen)
+        if origin is not None:
+            return origin in MSGSPEC_CONTAINERS and all(
+                self._is_supported(arg, seen)
+                for arg in get_args(annotation)
+                if arg is not Ellipsis
+            )
+
+        if not isinstance(annotation, type):
+            return False
+        if issubclass(annotation, (self._msgspec.Struct, enum.Enum)):
+            return True
+
+        if not dataclasses.is_dataclass(annotation) and not (
+            issubclass(annotation, tuple) and hasattr(annotation, "_fields")
+        ):
+            return False
+
+        # Self-referencing classes
+        if annotation in seen:
+            return True
+
+        seen.add(annotation)
+
+        try:
+            hints: typing.Mapping[str, Any] = typing.get_type_hints(annotation)
+        except (NameError, TypeError):
+            return False
+
+        return all(self._is_supported(hint, seen) for hint in hints.values())
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_decoder() -> Decoder:
+    """
+    Get the fastest available decoder that validates as pydantic does: orjson, then
+    stdlib json.
+    """
+
+    if importlib.util.find_spec("orjson") is not None:
+        return OrjsonDecoder()
+
+    return JSONDecoder()
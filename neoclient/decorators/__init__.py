@@ -1,10 +1,13 @@
 from ._auth import *
+from ._cache import *
 from ._client import *
 from ._common import *
 from ._headers import *
 from ._middleware import *
 from ._operation import *
+from ._pagination import *
 from ._request import *
 from ._response import *
 from ._service import *
 from ._utils import *
+from ._validation import *
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from ..memoization import OperationCache
+from ..operation import Operation
+from .api import operation_decorator
+
+__all__ = ("cache",)
+
+
+def cache(*, ttl: Optional[float] = None, maxsize: Optional[int] = 128):
+    """
+    Memoize the return value of an operation, keyed on its composed request.
+
+    Repeated calls that compose the same request (method, URL, query params and
+    body) return the memoized value for up to `ttl` seconds, skipping both the
+    network and response parsing. At most `maxsize` values are kept, evicting the
+    least recently used. Requests with streamed bodies are never memoized.
+
+    The cache is available as `get_operation(func).cache`, and values can be
+    invalidated using `get_operation(func).invalidate(*args, **kwargs)`. Each
+    client (or service instance) the operation is bound to has its own cache.
+    """
+
+    @operation_decorator
+    def decorate(operation: Operation, /) -> None:
+        operation.cache = OperationCache(ttl=ttl, maxsize=maxsize)
+
+    return decorate
@@ -1,7 +1,7 @@
 from ..enums import HTTPHeader
 from ._common import header
 
-__all__ = ("accept", "host", "referer", "user_agent")
+__all__ = ("accept", "content_type", "host", "referer", "user_agent")
 
 # TODO: Type responses
 
@@ -10,6 +10,17 @@ def accept(*content_types: str):
     return header(HTTPHeader.ACCEPT, ",".join(content_types))
 
 
+def content_type(content_type: str, /):
+    """
+    Declare the content type of the request body.
+
+    JSON bodies (e.g. `Body` parameters) are encoded using the codec registered
+    for `content_type` (e.g. `application/msgpack`).
+    """
+
+    return header(HTTPHeader.CONTENT_TYPE, content_type)
+
+
 def host(host: str, /):
     return header(HTTPHeader.HOST, host)
 
@@ -2,8 +2,11 @@ from typing import Optional
 
 from mediate.protocols import MiddlewareCallable
 
+from neoclient.caching import Storage
 from neoclient.decorators.api import CS, middleware_decorator
 from neoclient.middleware import (
+    CacheMiddleware,
+    CompressionMiddleware,
     ExpectedContentTypeMiddleware,
     ExpectedHeaderMiddleware,
     ExpectedStatusCodeMiddleware,
@@ -14,6 +17,8 @@ from neoclient.models import Request, Response
 
 __all__ = (
     "middleware",
+    "cache_responses",
+    "compress",
     "expect_content_type",
     "expect_header",
     "expect_status",
@@ -31,6 +36,48 @@ def middleware(*middlewares: MiddlewareCallable[Request, Response]):
     return decorate
 
 
+def cache_responses(
+    storage: Optional[Storage] = None,
+    /,
+    *,
+    ttl: float = 60.0,
+    stale_while_revalidate: float = 0.0,
+    stale_if_error: float = 0.0,
+):
+    """
+    Cache responses in `storage` (in memory, by default) for `ttl` seconds.
+
+    Once stale, responses are served for up to `stale_while_revalidate` seconds
+    whilst being revalidated in the background, and for up to `stale_if_error`
+    seconds if the request fails.
+
+    For a persistent cache, shared by processes on the same host, use a
+    `DiskStorage`.
+    """
+
+    return middleware(
+        CacheMiddleware(
+            storage,
+            ttl=ttl,
+            stale_while_revalidate=stale_while_revalidate,
+            stale_if_error=stale_if_error,
+        )
+    )
+
+
+def compress(
+    encoding: str = "gzip", /, *, threshold: int = 1024, level: Optional[int] = None
+):
+    """
+    Compress request bodies of at least `threshold` bytes using `encoding`.
+
+    To inspect the compression stats, register a `CompressionMiddleware` using
+    `middleware` instead.
+    """
+
+    return middleware(CompressionMiddleware(encoding, threshold=threshold, level=level))
+
+
 def expect_content_type(content_type: str, /):
     return middleware(ExpectedContentTypeMiddleware(content_type))
 
@@ -3,7 +3,7 @@ from typing import Mapping
 from neoclient.decorators.api import request_options_decorator
 from neoclient.models import RequestOpts
 
-from ..converters import convert_path_param, convert_path_params
+from ..converters import convert_content, convert_path_param, convert_path_params
 from ..types import (
     JsonTypes,
     PathParamsTypes,
@@ -29,7 +29,7 @@ __all__ = (
 def content(content: RequestContent, /):
     @request_options_decorator
     def decorate(request_options: RequestOpts, /) -> None:
-        request_options.content = content
+        request_options.content = convert_content(content)
 
     return decorate
 
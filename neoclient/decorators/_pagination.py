@@ -0,0 +1,15 @@
+from ..operation import Operation
+from ..pagination import Pagination, Paginator
+from .api import operation_decorator
+
+__all__ = ("paginate",)
+
+# TODO: Type responses
+
+
+def paginate(pagination: Pagination, /, *, prefetch: int = 0):
+    @operation_decorator
+    def decorate(operation: Operation, /) -> None:
+        operation.paginator = Paginator(pagination, prefetch=prefetch)
+
+    return decorate
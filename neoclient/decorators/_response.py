@@ -1,9 +1,13 @@
+from ..decoders import Decoder
 from ..operation import Operation
 from ..specification import ClientSpecification
 from ..typing import Dependency
 from .api import DecoratorTarget, common_decorator
 
-__all__ = ("response",)
+__all__ = (
+    "response",
+    "decoder",
+)
 
 # TODO: Type return values
 
@@ -19,3 +23,13 @@ def response(dependency: Dependency, /):
             raise TypeError
 
     return decorate
+
+
+def decoder(decoder: Decoder, /):
+    """Decode responses using `decoder` (e.g. `OrjsonDecoder()`)"""
+
+    @common_decorator
+    def decorate(target: DecoratorTarget, /) -> None:
+        target.decoder = decoder
+
+    return decorate
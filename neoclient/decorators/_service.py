@@ -13,6 +13,7 @@ from ..annotations import (
     service_response_dependency,
 )
 from ..models import Request, Response
+from ..pool import KeepAlive
 from ..typing import Dependency
 from .api import Decorator
 
@@ -31,6 +32,9 @@ class ServiceDecoratorImpl(Decorator):
     default_response: Optional[Dependency] = None
     request_dependencies: Optional[Sequence[Dependency]] = None
     response_dependencies: Optional[Sequence[Dependency]] = None
+    warmup: Optional[int] = None
+    keep_alive: Optional[KeepAlive] = None
+    shared: Optional[bool] = None
 
     def __init__(
         self,
@@ -40,12 +44,18 @@ class ServiceDecoratorImpl(Decorator):
         default_response: Optional[Dependency] = None,
         request_dependencies: Optional[Sequence[Dependency]] = None,
         response_dependencies: Optional[Sequence[Dependency]] = None,
+        warmup: Optional[int] = None,
+        keep_alive: Optional[KeepAlive] = None,
+        shared: Optional[bool] = None,
     ) -> None:
         self.base_url = base_url
         self.middlewares = middleware
         self.default_response = default_response
         self.request_dependencies = request_dependencies
         self.response_dependencies = response_dependencies
+        self.warmup = warmup
+        self.keep_alive = keep_alive
+        self.shared = shared
 
     def decorate_client(self, client: ClientSpecification, /) -> None:
         if self.base_url is not None:
@@ -58,6 +68,12 @@ class ServiceDecoratorImpl(Decorator):
             client.request_dependencies.extend(self.request_dependencies)
         if self.response_dependencies is not None:
             client.response_dependencies.extend(self.response_dependencies)
+        if self.warmup is not None:
+            client.warmup = self.warmup
+        if self.keep_alive is not None:
+            client.keep_alive = self.keep_alive
+        if self.shared is not None:
+            client.shared = self.shared
 
     @staticmethod
     def middleware(middleware: M, /) -> M:
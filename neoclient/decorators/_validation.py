@@ -0,0 +1,40 @@
+from .api import DecoratorTarget, common_decorator
+
+__all__ = (
+    "validate_arguments",
+    "validate_response",
+)
+
+
+def validate_arguments(validate_arguments: bool, /, *, check_types: bool = False):
+    """
+    Whether to validate arguments against the operation's parameters.
+
+    If disabled, arguments are passed straight through to their parameters, which
+    is considerably faster, but should only be used by trusted callers. If
+    `check_types` is set, arguments are instead cheaply checked to be instances
+    of their annotations.
+    """
+
+    @common_decorator
+    def decorate(target: DecoratorTarget, /) -> None:
+        target.validate_arguments = validate_arguments
+        target.check_argument_types = check_types
+
+    return decorate
+
+
+def validate_response(validate_response: bool, /):
+    """
+    Whether to validate responses against the operation's return type.
+
+    If disabled, return values are built *without* validation (e.g. pydantic models
+    are built using `Model.construct`), which is considerably faster, but should
+    only be used for trusted upstreams.
+    """
+
+    @common_decorator
+    def decorate(target: DecoratorTarget, /) -> None:
+        target.validate_response = validate_response
+
+    return decorate
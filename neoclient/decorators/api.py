@@ -6,7 +6,7 @@ from httpx import Cookies, Headers, QueryParams
 from neoclient.middleware import Middleware
 from neoclient.models import ClientOptions, RequestOpts
 from neoclient.operation import Operation, get_operation
-from neoclient.services import Service
+from neoclient.services import Service, get_service_members
 from neoclient.specification import ClientSpecification
 from neoclient.typing import Consumer, Dependency, Function
 
@@ -29,6 +29,9 @@ class Decorator:
             specification: ClientSpecification = target._spec
 
             self.decorate_client(specification)
+
+            # Re-bind the service's operations to its decorated specification
+            target._members = get_service_members(target)
         elif callable(target):
             operation: Operation = get_operation(target)
 
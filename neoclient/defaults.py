@@ -1,3 +1,4 @@
+import importlib.util
 from typing import Optional
 
 from httpx import URL, Limits, Timeout
@@ -28,6 +29,8 @@ __all__ = (
     "DEFAULT_ENCODING",
     "DEFAULT_LIMITS",
     "DEFAULT_VERIFY",
+    "DEFAULT_HTTP1",
+    "DEFAULT_HTTP2",
 )
 
 DEFAULT_BASE_URL: URLTypes = URL()
@@ -43,3 +46,7 @@ DEFAULT_ENCODING: DefaultEncodingTypes = "utf-8"
 DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20)
 DEFAULT_EVENT_HOOKS: Optional[EventHooks] = None
 DEFAULT_VERIFY: VerifyTypes = True
+DEFAULT_HTTP1: bool = True
+# HTTP/2 is preferred whenever it's available (it requires the `h2` package).
+# Connections negotiate the protocol, so will fall back to HTTP/1.1 if necessary.
+DEFAULT_HTTP2: bool = importlib.util.find_spec("h2") is not None
@@ -1,15 +1,24 @@
 import collections.abc
 import dataclasses
+import inspect
+import threading
+import time
 import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
     Generic,
+    Hashable,
     Mapping,
     MutableMapping,
+    MutableSequence,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -18,10 +27,9 @@ from typing import (
 
 import httpx
 from httpx import URL, Cookies, Headers, QueryParams
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo, ModelField
 
 from . import api, utils
+from ._compat import MODEL_TYPES, BaseModel, FieldInfo, ModelField
 from .errors import PreparationError, ResolutionError
 from .models import Request, RequestOpts, Response, State
 from .params import (
@@ -41,6 +49,9 @@ from .validation import ValidatedFunction
 
 T = TypeVar("T")
 
+# The result of a dependency, and the seconds it took to resolve
+TimedResult = Tuple[Any, float]
+
 
 def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
     class Config:
@@ -76,7 +87,7 @@ def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
             elif (
                 (
                     isinstance(model_field.annotation, type)
-                    and issubclass(model_field.annotation, (BaseModel, dict))
+                    and issubclass(model_field.annotation, (*MODEL_TYPES, dict))
                 )
                 or dataclasses.is_dataclass(model_field.annotation)
                 or (
@@ -105,6 +116,26 @@ def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
     return fields
 
 
+@dataclass(frozen=True)
+class PreparedDependency:
+    """
+    The prepared fields (and model) of a dependency, shared by each of its
+    resolutions, so shouldn't be mutated.
+    """
+
+    fields: Mapping[str, Tuple[Any, Parameter]]
+    model_cls: Type[BaseModel]
+
+    @classmethod
+    def prepare(cls, dependency: Callable, /) -> "PreparedDependency":
+        fields: Mapping[str, Tuple[Any, Parameter]] = get_fields(dependency)
+
+        return cls(
+            fields=MappingProxyType(fields),
+            model_cls=api.create_model_cls(dependency, fields),
+        )
+
+
 @dataclass
 class DependencyResolver(Generic[T]):
     dependency: Callable[..., T]
@@ -114,32 +145,50 @@ class DependencyResolver(Generic[T]):
         request: RequestOpts,
         /,
         *,
-        cache: Optional[MutableMapping[Parameter, Any]] = None,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        prepared: Optional[Mapping[Callable, PreparedDependency]] = None,
     ) -> T:
-        return self.resolve(request, cache=cache)
+        return self.resolve(request, cache=cache, prepared=prepared)
 
     def resolve_response(
         self,
         response: Response,
         /,
         *,
-        cache: Optional[MutableMapping[Parameter, Any]] = None,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        prepared: Optional[Mapping[Callable, PreparedDependency]] = None,
     ) -> T:
-        return self.resolve(response, cache=cache)
+        return self.resolve(response, cache=cache, prepared=prepared)
 
     def resolve(
         self,
         request_or_response: Union[RequestOpts, Response],
         /,
         *,
-        cache: Optional[MutableMapping[Parameter, Any]] = None,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        prepared: Optional[Mapping[Callable, PreparedDependency]] = None,
     ) -> T:
+        """
+        Resolve the dependency against `request_or_response`.
+
+        Dependencies are prepared afresh, unless found in `prepared` (e.g. those of
+        a compiled `DependencyGraph`).
+        """
+
         if cache is None:
             cache = {}
 
-        fields: Mapping[str, Tuple[Any, Parameter]] = get_fields(self.dependency)
+        prepared_dependency: Optional[PreparedDependency] = (
+            prepared.get(self.dependency)
+            if prepared is not None
+            and isinstance(self.dependency, collections.abc.Hashable)
+            else None
+        )
+
+        if prepared_dependency is None:
+            prepared_dependency = PreparedDependency.prepare(self.dependency)
 
-        model_cls: Type[BaseModel] = api.create_model_cls(self.dependency, fields)
+        fields: Mapping[str, Tuple[Any, Parameter]] = prepared_dependency.fields
 
         arguments: MutableMapping[str, Any] = {}
 
@@ -148,54 +197,60 @@ class DependencyResolver(Generic[T]):
         parameter: Parameter
         for field_name, (field_annotation, parameter) in fields.items():
             resolution: Any
+            # Dependencies are cached by their callable, so that a dependency shared
+            # by several parameters (e.g. of different names) is only resolved once
+            cache_key: Any = parameter
+            use_cache: bool = True
 
-            if parameter in cache:
-                resolution = cache[parameter]
-            else:
-                cache_parameter: bool = True
+            if isinstance(parameter, DependencyParameter):
+                cache_key = parameter.dependency
+                use_cache = parameter.use_cache
 
+            if use_cache and cache_key in cache:
+                resolution = cache[cache_key]
+            else:
                 if isinstance(parameter, DependencyParameter):
                     if isinstance(request_or_response, RequestOpts):
                         resolution = parameter.resolve_request(
                             request_or_response,
                             cache=cache,
+                            prepared=prepared,
                         )
                     else:
                         resolution = parameter.resolve_response(
                             request_or_response,
                             cache=cache,
+                            prepared=prepared,
                         )
-
-                    cache_parameter = parameter.use_cache
                 else:
                     if isinstance(request_or_response, RequestOpts):
                         resolution = parameter.resolve_request(request_or_response)
                     else:
                         resolution = parameter.resolve_response(request_or_response)
 
-                # If the parameter has a resolution function that is backed to
-                # a multi-value mapping (and will yield a sequence of values),
-                # inspect the field's annotation to decide whether to use the
-                # entire sequence, or only the first value within it.
-                if isinstance(parameter, (QueryParameter, HeaderParameter)):
-                    field_annotation_origin: Optional[Any] = typing.get_origin(
-                        field_annotation
-                    )
+                if use_cache:
+                    cache[cache_key] = resolution
 
-                    if (
-                        field_annotation is Any
-                        or field_annotation not in (list, tuple)
-                        and (
-                            not utils.is_generic_alias(field_annotation)
-                            or field_annotation_origin
-                            not in (list, tuple, collections.abc.Sequence)
-                        )
-                    ):
-                        if isinstance(resolution, Sequence) and resolution:
-                            resolution = resolution[0]
+            # If the parameter has a resolution function that is backed to
+            # a multi-value mapping (and will yield a sequence of values),
+            # inspect the field's annotation to decide whether to use the
+            # entire sequence, or only the first value within it.
+            if isinstance(parameter, (QueryParameter, HeaderParameter)):
+                field_annotation_origin: Optional[Any] = typing.get_origin(
+                    field_annotation
+                )
 
-                if cache_parameter:
-                    cache[parameter] = resolution
+                if (
+                    field_annotation is Any
+                    or field_annotation not in (list, tuple)
+                    and (
+                        not utils.is_generic_alias(field_annotation)
+                        or field_annotation_origin
+                        not in (list, tuple, collections.abc.Sequence)
+                    )
+                ):
+                    if isinstance(resolution, Sequence) and resolution:
+                        resolution = resolution[0]
 
             # If there is no resolution (e.g. missing header/query param etc.)
             # and the parameter has a default, then we can omit the value from
@@ -207,7 +262,9 @@ class DependencyResolver(Generic[T]):
 
             arguments[field_name] = resolution
 
-        model: BaseModel = model_cls(**arguments)
+        model: BaseModel = prepared_dependency.model_cls(
+            **api.validate_v2_arguments(fields, arguments)
+        )
 
         validated_arguments: Mapping[str, Any] = model.dict()
 
@@ -222,27 +279,36 @@ class DependencyResolver(Generic[T]):
 class DependencyParameter(Parameter):
     dependency: Optional[Callable] = None
     use_cache: bool = True
+    # Cached dependencies can be resolved concurrently (in a worker thread) with
+    # other dependencies that they don't depend on (e.g. if they perform I/O)
+    concurrent: bool = False
+    # Concurrent dependencies that take longer than `timeout` seconds fail
+    timeout: Optional[float] = None
 
     def resolve_request(
         self,
         request: RequestOpts,
         /,
         *,
-        cache: Optional[MutableMapping[Parameter, Any]] = None,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        prepared: Optional[Mapping[Callable, PreparedDependency]] = None,
     ) -> Any:
         if self.dependency is None:
             raise ResolutionError(
                 f"Cannot resolve parameter {type(self)!r} without a dependency"
             )
 
-        return DependencyResolver(self.dependency).resolve_request(request, cache=cache)
+        return DependencyResolver(self.dependency).resolve_request(
+            request, cache=cache, prepared=prepared
+        )
 
     def resolve_response(
         self,
         response: Response,
         /,
         *,
-        cache: Optional[MutableMapping[Parameter, Any]] = None,
+        cache: Optional[MutableMapping[Any, Any]] = None,
+        prepared: Optional[Mapping[Callable, PreparedDependency]] = None,
     ) -> Any:
         if self.dependency is None:
             raise ResolutionError(
@@ -250,7 +316,7 @@ class DependencyParameter(Parameter):
             )
 
         return DependencyResolver(self.dependency).resolve_response(
-            response, cache=cache
+            response, cache=cache, prepared=prepared
         )
 
     def prepare(self, field: ModelField, /) -> None:
@@ -266,3 +332,331 @@ class DependencyParameter(Parameter):
             )
 
         self.dependency = field.annotation
+
+
+@dataclass(frozen=True)
+class DependencyGraph:
+    """
+    Compiled graph of `dependencies` and their (cached) sub-dependencies.
+
+    Each resolution of the graph shares one cache, so that each dependency is
+    resolved at most once (unless it opts out of caching, using `use_cache`),
+    with dependencies resolved in topological order: each after any of its
+    sub-dependencies.
+
+    Sub-dependencies marked as `concurrent` (or given a `timeout`) are resolved in
+    worker threads, concurrently with the dependencies that follow them, up until a
+    dependency needs their result (so shouldn't modify the request or response).
+
+    The time taken to resolve each dependency is recorded in the extensions of the
+    request (or response), as `dependency_timings`.
+    """
+
+    dependencies: Sequence[Callable]
+    # The dependencies and their cached sub-dependencies, in topological order
+    order: Sequence[Callable]
+    # The cached sub-dependencies of each dependency
+    edges: Mapping[Callable, Sequence[Callable]]
+    # The timeouts (if any) of the sub-dependencies to resolve concurrently
+    concurrent: Mapping[Callable, Optional[float]]
+    # Each dependency (including uncached sub-dependencies), prepared once for all
+    # resolutions of the graph
+    prepared: Mapping[Callable, PreparedDependency]
+
+    @classmethod
+    def compile(
+        cls,
+        dependencies: Sequence[Callable],
+        /,
+        *,
+        prepared: Optional[MutableMapping[Hashable, PreparedDependency]] = None,
+    ) -> "DependencyGraph":
+        """
+        Compile the graph of `dependencies`.
+
+        Dependencies already in `prepared` (if given) aren't prepared again, and
+        those newly prepared are added to it, so that other graphs can re-use them.
+        Bound methods (e.g. of each instance of a service) are keyed on the function
+        they're bound from, as their preparation doesn't depend on what they're bound
+        to.
+        """
+
+        order: MutableSequence[Callable] = []
+        edges: MutableMapping[Callable, Sequence[Callable]] = {}
+        concurrent: MutableMapping[Callable, Optional[float]] = {}
+        graph_prepared: MutableMapping[Callable, PreparedDependency] = {}
+        visiting: Set[Callable] = set()
+
+        def prepare(dependency: Callable, /) -> PreparedDependency:
+            if dependency in graph_prepared:
+                return graph_prepared[dependency]
+
+            key: Hashable = (
+                (inspect.unwrap(dependency.__func__), "method")
+                if inspect.ismethod(dependency)
+                else dependency
+            )
+            prepared_dependency: Optional[PreparedDependency] = (
+                prepared.get(key) if prepared is not None else None
+            )
+
+            if prepared_dependency is None:
+                prepared_dependency = PreparedDependency.prepare(dependency)
+
+                if prepared is not None:
+                    prepared[key] = prepared_dependency
+
+            graph_prepared[dependency] = prepared_dependency
+
+            # Uncached sub-dependencies aren't part of the graph, as they're
+            # resolved afresh for each use, but are still only prepared once
+            parameter: Parameter
+            for _, parameter in prepared_dependency.fields.values():
+                if (
+                    isinstance(parameter, DependencyParameter)
+                    and parameter.dependency is not None
+                    and isinstance(parameter.dependency, collections.abc.Hashable)
+                    and not parameter.use_cache
+                ):
+                    prepare(parameter.dependency)
+
+            return prepared_dependency
+
+        def visit(dependency: Callable, /) -> None:
+            if dependency in edges:
+                return
+            if dependency in visiting:
+                raise PreparationError(f"Circular dependency on {dependency!r}")
+
+            visiting.add(dependency)
+
+            sub_dependencies: MutableSequence[Callable] = []
+
+            parameter: Parameter
+            for _, parameter in prepare(dependency).fields.values():
+                # Uncached sub-dependencies are resolved afresh for each use
+                if (
+                    not isinstance(parameter, DependencyParameter)
+                    or parameter.dependency is None
+                    or not parameter.use_cache
+                ):
+                    continue
+
+                if parameter.concurrent or parameter.timeout is not None:
+                    timeouts: Sequence[float] = [
+                        timeout
+                        for timeout in (
+                            concurrent.get(parameter.dependency),
+                            parameter.timeout,
+                        )
+                        if timeout is not None
+                    ]
+
+                    # The strictest timeout applies
+                    concurrent[parameter.dependency] = (
+                        min(timeouts) if timeouts else None
+                    )
+
+                visit(parameter.dependency)
+
+                sub_dependencies.append(parameter.dependency)
+
+            visiting.remove(dependency)
+            edges[dependency] = tuple(sub_dependencies)
+            order.append(dependency)
+
+        dependency: Callable
+        for dependency in dependencies:
+            visit(dependency)
+
+        return cls(
+            dependencies=tuple(dependencies),
+            order=tuple(order),
+            edges=edges,
+            prepared=graph_prepared,
+            # The dependencies themselves are always resolved in order, as they
+            # may modify the request (or response)
+            concurrent={
+                dependency: timeout
+                for dependency, timeout in concurrent.items()
+                if dependency not in dependencies
+            },
+        )
+
+    def resolve_request(self, request: RequestOpts, /) -> Sequence[Any]:
+        """Resolve the graph against `request`, returning each dependency's result"""
+
+        return self.resolve(request)
+
+    def resolve_response(self, response: Response, /) -> Sequence[Any]:
+        """Resolve the graph against `response`, returning each dependency's result"""
+
+        return self.resolve(response)
+
+    def resolve(
+        self, request_or_response: Union[RequestOpts, Response], /
+    ) -> Sequence[Any]:
+        if not self.order:
+            return []
+
+        timings: MutableMapping[Callable, float] = {}
+
+        request_or_response.extensions["dependency_timings"] = timings
+
+        cache: MutableMapping[Any, Any] = {}
+        # The concurrent dependencies being resolved, and when they time out (if
+        # ever)
+        pending: MutableMapping[
+            Callable, Tuple["Future[TimedResult]", Optional[float]]
+        ] = {}
+        # Graphs resolved within workers (e.g. those of operations called by
+        # concurrent dependencies) are resolved serially, so that they can't
+        # exhaust (and so deadlock) the pool of workers
+        executor: Optional[ThreadPoolExecutor] = (
+            get_executor()
+            if self.concurrent and not getattr(_worker, "active", False)
+            else None
+        )
+
+        def wait(dependency: Callable, /) -> None:
+            future: "Future[TimedResult]"
+            deadline: Optional[float]
+            future, deadline = pending.pop(dependency)
+
+            try:
+                cache[dependency], timings[dependency] = future.result(
+                    max(deadline - time.monotonic(), 0)
+                    if deadline is not None
+                    else None
+                )
+            except FutureTimeoutError:
+                # The worker stays busy with the timed out dependency, so isn't
+                # re-used
+                assert executor is not None
+
+                _retire_executor(executor)
+
+                raise ResolutionError(
+                    f"Dependency {dependency!r} timed out after"
+                    f" {self.concurrent[dependency]}s"
+                ) from None
+
+        dependency: Callable
+        for dependency in self.order:
+            # Results of concurrent sub-dependencies are waited for once needed
+            sub_dependency: Callable
+            for sub_dependency in self.edges[dependency]:
+                if sub_dependency in pending:
+                    wait(sub_dependency)
+
+            if executor is None or dependency not in self.concurrent:
+                cache[dependency], timings[dependency] = _resolve_timed(
+                    dependency, request_or_response, cache, self.prepared
+                )
+
+                continue
+
+            timeout: Optional[float] = self.concurrent[dependency]
+
+            pending[dependency] = (
+                # Workers are given a snapshot of the cache, so that they don't
+                # modify it concurrently
+                executor.submit(
+                    _resolve_timed,
+                    dependency,
+                    request_or_response,
+                    {**cache},
+                    self.prepared,
+                ),
+                time.monotonic() + timeout if timeout is not None else None,
+            )
+
+        for dependency in list(pending):
+            wait(dependency)
+
+        return [cache[dependency] for dependency in self.dependencies]
+
+
+# Concurrent dependencies are resolved by a single pool of workers (started once
+# first needed), shared by every graph. Timed out dependencies can't be
+# interrupted, so the pool they're running in is retired (left to finish its work)
+# and replaced, so that they don't hold workers needed by other dependencies
+# (though a dependency that never finishes still holds its thread).
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock: threading.Lock = threading.Lock()
+_max_workers: Optional[int] = None
+_worker: threading.local = threading.local()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the pool of workers that concurrent dependencies are resolved by"""
+
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers,
+                thread_name_prefix="neoclient-dependency",
+                initializer=_init_worker,
+            )
+
+        return _executor
+
+
+def set_max_workers(max_workers: Optional[int], /) -> None:
+    """
+    Set the number of workers that concurrent dependencies are resolved by.
+
+    Once every worker is busy, concurrent dependencies queue (and count towards
+    their timeout) until one is free. By default, there are `min(32, cpus + 4)`
+    workers.
+    """
+
+    global _executor, _max_workers
+
+    executor: Optional[ThreadPoolExecutor]
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+        _max_workers = max_workers
+
+    # The pool is replaced (once next needed) by one of the new size
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _retire_executor(executor: ThreadPoolExecutor, /) -> None:
+    global _executor
+
+    with _executor_lock:
+        # The pool may have already been replaced (e.g. by another timeout)
+        if _executor is not executor:
+            return
+
+        _executor = None
+
+    # Work already submitted to the pool is still finished
+    executor.shutdown(wait=False)
+
+
+def _init_worker() -> None:
+    _worker.active = True
+
+
+def _resolve_timed(
+    dependency: Callable,
+    request_or_response: Union[RequestOpts, Response],
+    cache: MutableMapping[Any, Any],
+    prepared: Mapping[Callable, PreparedDependency],
+    /,
+) -> TimedResult:
+    """Resolve `dependency`, returning its result and the seconds it took"""
+
+    start: float = time.perf_counter()
+
+    result: Any = DependencyResolver(dependency).resolve(
+        request_or_response, cache=cache, prepared=prepared
+    )
+
+    return result, time.perf_counter() - start
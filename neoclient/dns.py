@@ -0,0 +1,305 @@
+import ipaddress
+import socket
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import (
+    Callable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import httpcore
+import httpx
+
+from .pool import get_pools
+
+__all__ = (
+    "DNSStats",
+    "DNSCache",
+    "CachingNetworkBackend",
+    "resolve",
+    "install_dns_cache",
+)
+
+Resolver = Callable[[str], Sequence[str]]
+SocketOptions = Iterable[Union[tuple, Sequence]]
+
+
+def resolve(host: str, /) -> Sequence[str]:
+    """Resolve `host` to its addresses (both A and AAAA records) using `getaddrinfo`"""
+
+    addresses: MutableMapping[str, None] = {}
+
+    info: tuple
+    for info in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM):
+        addresses[info[4][0]] = None
+
+    return list(addresses)
+
+
+def is_ip_address(host: str, /) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+
+    return True
+
+
+@dataclass
+class DNSStats:
+    hits: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+    failures: int = 0
+
+
+@dataclass
+class _Entry:
+    addresses: Sequence[str]
+    expires_at: float
+    error: Optional[Exception] = None
+    counter: int = 0
+
+
+class DNSCache:
+    """
+    Thread-safe cache of host name resolutions.
+
+    `getaddrinfo` does not expose record TTLs, so successful resolutions are cached
+    for `ttl` seconds and failed resolutions (negative caching) for `negative_ttl`
+    seconds. Each lookup of a host rotates its addresses, spreading connections
+    round-robin across its A/AAAA records.
+
+    Hosts in `static` always resolve to the given addresses, which is useful for
+    tests and for pinning hosts.
+    """
+
+    ttl: float
+    negative_ttl: float
+    maxsize: int
+    static: Mapping[str, Sequence[str]]
+    resolver: Resolver
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        maxsize: int = 1024,
+        static: Optional[Mapping[str, Sequence[str]]] = None,
+        resolver: Resolver = resolve,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.static = (
+            {host.lower(): addresses for host, addresses in static.items()}
+            if static is not None
+            else {}
+        )
+        self.resolver = resolver
+
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._stats: DNSStats = DNSStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}(ttl={self.ttl!r},"
+            f" negative_ttl={self.negative_ttl!r}, size={len(self._entries)!r})>"
+        )
+
+    @property
+    def stats(self) -> DNSStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def lookup(self, host: str, /) -> Sequence[str]:
+        """
+        Look up the addresses of `host`, in round-robin order.
+
+        Raises `socket.gaierror` (or whatever the resolver raised) if `host` could
+        not be resolved.
+        """
+
+        host = host.lower()
+
+        entry: Optional[_Entry] = self._get(host)
+
+        if entry is None:
+            entry = self._resolve(host)
+
+        if entry.error is not None:
+            raise entry.error
+
+        with self._lock:
+            index: int = entry.counter % len(entry.addresses)
+            entry.counter += 1
+
+        return [*entry.addresses[index:], *entry.addresses[:index]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, host: str, /) -> Optional[_Entry]:
+        static: Optional[Sequence[str]] = self.static.get(host)
+
+        with self._lock:
+            if static is not None:
+                self._stats.hits += 1
+
+                return self._entries.setdefault(
+                    host, _Entry(addresses=static, expires_at=float("inf"))
+                )
+
+            entry: Optional[_Entry] = self._entries.get(host)
+
+            if entry is None or entry.expires_at <= time.monotonic():
+                self._stats.misses += 1
+
+                return None
+
+            self._entries.move_to_end(host)
+
+            if entry.error is not None:
+                self._stats.negative_hits += 1
+            else:
+                self._stats.hits += 1
+
+            return entry
+
+    def _resolve(self, host: str, /) -> _Entry:
+        entry: _Entry
+
+        try:
+            addresses: Sequence[str] = self.resolver(host)
+        except (OSError, UnicodeError) as error:
+            entry = _Entry(
+                addresses=(),
+                expires_at=time.monotonic() + self.negative_ttl,
+                error=error,
+            )
+        else:
+            if addresses:
+                entry = _Entry(
+                    addresses=addresses, expires_at=time.monotonic() + self.ttl
+                )
+            else:
+                entry = _Entry(
+                    addresses=(),
+                    expires_at=time.monotonic() + self.negative_ttl,
+                    error=socket.gaierror(f"No addresses found for {host!r}"),
+                )
+
+        with self._lock:
+            if entry.error is not None:
+                self._stats.failures += 1
+
+            self._entries[host] = entry
+            self._entries.move_to_end(host)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return entry
+
+
+class CachingNetworkBackend(httpcore.NetworkBackend):
+    """
+    Network backend that resolves host names through a `DNSCache`.
+
+    Connections are attempted against each of the host's addresses in turn, until
+    one succeeds. As TLS uses the origin's host name, certificates are still
+    verified against the host name rather than the address.
+    """
+
+    cache: DNSCache
+    backend: httpcore.NetworkBackend
+
+    def __init__(
+        self,
+        cache: DNSCache,
+        backend: Optional[httpcore.NetworkBackend] = None,
+        /,
+    ) -> None:
+        self.cache = cache
+        self.backend = backend if backend is not None else httpcore.SyncBackend()
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[SocketOptions] = None,
+    ) -> httpcore.NetworkStream:
+        if is_ip_address(host):
+            return self.backend.connect_tcp(
+                host,
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+
+        try:
+            addresses: Sequence[str] = self.cache.lookup(host)
+        except (OSError, UnicodeError) as error:
+            raise httpcore.ConnectError(error) from error
+
+        # Socket options may be a one-shot iterable, so are materialised once
+        options: Optional[Sequence] = (
+            list(socket_options) if socket_options is not None else None
+        )
+        error: Optional[Exception] = None
+
+        address: str
+        for address in addresses:
+            try:
+                return self.backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+
+        assert error is not None
+
+        raise error
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[SocketOptions] = None,
+    ) -> httpcore.NetworkStream:
+        return self.backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    def sleep(self, seconds: float) -> None:
+        self.backend.sleep(seconds)
+
+
+def install_dns_cache(client: httpx.Client, cache: DNSCache, /) -> None:
+    """Resolve host names through `cache` for each connection pool used by `client`"""
+
+    pool: httpcore.ConnectionPool
+    for pool in get_pools(client):
+        backend: httpcore.NetworkBackend = pool._network_backend
+
+        if isinstance(backend, CachingNetworkBackend):
+            backend = backend.backend
+
+        pool._network_backend = CachingNetworkBackend(cache, backend)
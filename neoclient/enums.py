@@ -43,6 +43,8 @@ class HTTPHeader(HiddenValueEnum, StrEnum):
     AUTHORIZATION = "Authorization"
     CACHE_CONTROL = "Cache-Control"
     CONNECTION = "Connection"
+    CONTENT_ENCODING = "Content-Encoding"
+    CONTENT_LENGTH = "Content-Length"
     CONTENT_TYPE = "Content-Type"
     COOKIE = "Cookie"
     DNT = "DNT"
@@ -59,3 +61,4 @@ class HTTPHeader(HiddenValueEnum, StrEnum):
     TRANSFER_ENCODING = "Transfer-Encoding"
     UPGRADE = "Upgrade"
     USER_AGENT = "User-Agent"
+    VARY = "Vary"
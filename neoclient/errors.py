@@ -15,6 +15,7 @@ __all__ = (
     "ExpectedHeaderError",
     "ExpectedContentTypeError",
     "ServiceInitialisationError",
+    "PaginationError",
 )
 
 
@@ -85,3 +86,7 @@ class ExpectedContentTypeError(Exception):
 
 class ServiceInitialisationError(Exception):
     pass
+
+
+class PaginationError(Exception):
+    pass
@@ -0,0 +1,171 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import httpx
+
+__all__ = (
+    "CacheStats",
+    "OperationCache",
+    "make_key",
+)
+
+_MISSING: Any = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def make_key(request: httpx.Request, /) -> Optional[Hashable]:
+    """
+    Make the cache key of `request`: its method, URL (including query params) and
+    a hash of its headers (including its cookies) and body.
+
+    Headers are keyed on so that values aren't shared between callers with
+    different credentials (e.g. an `Authorization` header). Only the headers of the
+    composed request are keyed on (not those later added by middleware or auth), so
+    each client (or service instance) an operation is bound to has its own cache.
+
+    Requests with streamed bodies can't be keyed without consuming their stream,
+    so return `None`.
+    """
+
+    if not hasattr(request, "_content"):
+        return None
+
+    headers_digest: Any = hashlib.blake2b(digest_size=16)
+
+    name: bytes
+    value: bytes
+    for name, value in request.headers.raw:
+        headers_digest.update(name.lower())
+        headers_digest.update(b":")
+        headers_digest.update(value)
+        headers_digest.update(b"\n")
+
+    content: bytes = request.content
+
+    return (
+        request.method,
+        str(request.url),
+        headers_digest.digest(),
+        hashlib.blake2b(content, digest_size=16).digest() if content else None,
+    )
+
+
+class OperationCache:
+    """
+    Thread-safe memoization cache of operation return values.
+
+    Entries expire after `ttl` seconds (if set), and once the cache holds `maxsize`
+    entries (if set), the least recently used entry is evicted.
+
+    Note that cached values are returned as-is to each caller, so should not be
+    mutated.
+    """
+
+    ttl: Optional[float]
+    maxsize: Optional[int]
+
+    def __init__(
+        self, *, ttl: Optional[float] = None, maxsize: Optional[int] = 128
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._stats: CacheStats = CacheStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}(ttl={self.ttl!r}, maxsize={self.maxsize!r},"
+            f" size={len(self)!r})>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable, /) -> bool:
+        return self._get(key, record=False) is not _MISSING
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def get_or_call(self, key: Hashable, func: Callable[[], Any], /) -> Any:
+        """
+        Get the value cached for `key`, calling `func` to get (and cache) the value
+        if there isn't one.
+
+        Concurrent misses of the same key each call `func`.
+        """
+
+        value: Any = self._get(key)
+
+        if value is not _MISSING:
+            return value
+
+        value = func()
+
+        self.set(key, value)
+
+        return value
+
+    def set(self, key: Hashable, value: Any, /) -> None:
+        expires_at: float = (
+            time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        )
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable, /) -> bool:
+        """Invalidate the value cached for `key`, returning whether there was one"""
+
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def fork(self) -> "OperationCache":
+        """Create an empty cache with the same settings (e.g. for another client)"""
+
+        return type(self)(ttl=self.ttl, maxsize=self.maxsize)
+
+    def _get(self, key: Hashable, /, *, record: bool = True) -> Any:
+        with self._lock:
+            entry: Optional[Tuple[Any, float]] = self._entries.get(key)
+
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+
+                entry = None
+
+            if entry is None:
+                if record:
+                    self._stats.misses += 1
+
+                return _MISSING
+
+            self._entries.move_to_end(key)
+
+            if record:
+                self._stats.hits += 1
+
+            return entry[0]
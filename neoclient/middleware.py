@@ -1,18 +1,37 @@
+import logging
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Optional, Sequence
+from typing import Mapping, MutableMapping, Optional, Sequence, Tuple
 
+import httpx
 import mediate
 import mediatype
 from mediatype import MediaType
 
 from .auth import Auth
+from .caching import (
+    CacheEntry,
+    MemoryStorage,
+    Storage,
+    get_cache_key,
+    parse_cache_control,
+    parse_vary,
+)
+from .compression import (
+    CompressedStream,
+    CompressionStats,
+    Compressor,
+    StatsRecorder,
+    get_compressor,
+)
 from .enums import HTTPHeader
 from .errors import (
     ExpectedContentTypeError,
     ExpectedHeaderError,
     ExpectedStatusCodeError,
 )
-from .models import Request, Response
+from .models import Request, Response, State
 from .typing import CallNext, MiddlewareCallable
 
 __all__ = (
@@ -21,9 +40,13 @@ __all__ = (
     "ExpectedStatusCodeMiddleware",
     "ExpectedHeaderMiddleware",
     "ExpectedContentTypeMiddleware",
+    "CompressionMiddleware",
+    "CacheMiddleware",
     "raise_for_status",
 )
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class Middleware(mediate.Middleware[Request, Response]):
     pass
@@ -125,6 +148,446 @@ class ExpectedContentTypeMiddleware:
         return media_type.string(suffix=self.suffix, parameters=self.parameters)
 
 
+class CompressionMiddleware:
+    """
+    Compress request bodies of at least `threshold` bytes.
+
+    Bodies are compressed with `encoding` (`gzip`, or `zstd` if `zstandard` is
+    installed), and sent with a `Content-Encoding` header. Streamed bodies are
+    compressed as they are sent, unless their `Content-Length` is known to be
+    below the threshold. Bodies that already have a content encoding are sent
+    as-is.
+
+    Stats on the compression ratio and CPU time are kept in `stats`, so that the
+    threshold can be tuned.
+    """
+
+    compressor: Compressor
+    threshold: int
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        /,
+        *,
+        threshold: int = 1024,
+        level: Optional[int] = None,
+    ) -> None:
+        self.compressor = get_compressor(encoding, level=level)
+        self.threshold = threshold
+
+        self._recorder: StatsRecorder = StatsRecorder()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.compressor.encoding!r},"
+            f" threshold={self.threshold!r})"
+        )
+
+    @property
+    def stats(self) -> CompressionStats:
+        return self._recorder.stats
+
+    def reset_stats(self) -> None:
+        self._recorder.reset()
+
+    def __call__(self, call_next: CallNext, request: Request, /) -> Response:
+        self._recorder.record(requests=1)
+
+        if HTTPHeader.CONTENT_ENCODING not in request.headers:
+            if hasattr(request, "_content"):
+                self._compress_content(request)
+            elif isinstance(request.stream, httpx.SyncByteStream):
+                self._compress_stream(request)
+
+        return call_next(request)
+
+    def _compress_content(self, request: Request, /) -> None:
+        content: bytes = request.content
+
+        if not content or len(content) < self.threshold:
+            return
+
+        start: float = time.thread_time()
+        compressed_content: bytes = self.compressor.compress(content)
+
+        self._recorder.record(
+            compressed=1,
+            bytes_in=len(content),
+            bytes_out=len(compressed_content),
+            cpu_time=time.thread_time() - start,
+        )
+
+        request.headers[HTTPHeader.CONTENT_ENCODING] = self.compressor.encoding
+        request.headers[HTTPHeader.CONTENT_LENGTH] = str(len(compressed_content))
+        request.stream = httpx.ByteStream(compressed_content)
+        request._content = compressed_content
+
+    def _compress_stream(self, request: Request, /) -> None:
+        content_length: Optional[str] = request.headers.get(HTTPHeader.CONTENT_LENGTH)
+
+        if content_length is not None and int(content_length) < self.threshold:
+            return
+
+        self._recorder.record(compressed=1)
+
+        # The compressed length isn't known up-front, so is sent chunked
+        if content_length is not None:
+            del request.headers[HTTPHeader.CONTENT_LENGTH]
+            request.headers[HTTPHeader.TRANSFER_ENCODING] = "chunked"
+
+        request.headers[HTTPHeader.CONTENT_ENCODING] = self.compressor.encoding
+        request.stream = CompressedStream(
+            request.stream, self.compressor, self._recorder
+        )
+
+
+class CacheMiddleware:
+    """
+    Cache responses in `storage` (in memory, by default).
+
+    Responses to `GET` and `HEAD` requests with a cacheable status code are cached
+    for `ttl` seconds (or their `Cache-Control: max-age`), keyed on the request's
+    method, URL, body and credentials (its `Authorization` and `Cookie` headers),
+    as well as any request headers listed by the response's `Vary` header. Fresh
+    cached responses are served without sending the request. Requests and
+    responses with `Cache-Control: no-store` (or `Vary: *`) are not cached,
+    requests with `Cache-Control: no-cache` bypass the cache, and responses with
+    `Cache-Control: no-cache` are revalidated (i.e. re-sent) on every request.
+    As this is a private cache, responses with `Cache-Control: private` are
+    cached.
+
+    Once stale, a cached response may still be served (RFC 5861):
+
+    * For up to `stale_while_revalidate` seconds, it is served immediately whilst
+      it is revalidated in a background thread. Concurrent revalidations of the
+      same request are deduplicated.
+    * For up to `stale_if_error` seconds, it is served if the request fails, or if
+      the server responds with a 500, 502, 503 or 504.
+
+    Either window can also be set by a response's `Cache-Control` directives of
+    the same names.
+
+    Cached responses are marked with the `from_cache` response extension, and stale
+    responses with the `stale` response extension.
+    """
+
+    CACHEABLE_METHODS: Sequence[str] = ("GET", "HEAD")
+    CACHEABLE_STATUS_CODES: Sequence[int] = (
+        200,
+        203,
+        204,
+        300,
+        301,
+        308,
+        404,
+        405,
+        410,
+        414,
+        501,
+    )
+    ERROR_STATUS_CODES: Sequence[int] = (500, 502, 503, 504)
+
+    storage: Storage
+    ttl: float
+    stale_while_revalidate: float
+    stale_if_error: float
+
+    def __init__(
+        self,
+        storage: Optional[Storage] = None,
+        /,
+        *,
+        ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+    ) -> None:
+        self.storage = storage if storage is not None else MemoryStorage()
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+
+        self._lock: threading.Lock = threading.Lock()
+        self._revalidations: MutableMapping[str, threading.Thread] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self.storage!r}, ttl={self.ttl!r},"
+            f" stale_while_revalidate={self.stale_while_revalidate!r},"
+            f" stale_if_error={self.stale_if_error!r})"
+        )
+
+    def __call__(self, call_next: CallNext, request: Request, /) -> Response:
+        key: Optional[str] = (
+            get_cache_key(request) if request.method in self.CACHEABLE_METHODS else None
+        )
+
+        if key is None:
+            return call_next(request)
+
+        directives: Mapping[str, Optional[str]] = parse_cache_control(
+            request.headers.get(HTTPHeader.CACHE_CONTROL)
+        )
+
+        entry: Optional[CacheEntry] = None
+
+        if "no-cache" not in directives and "no-store" not in directives:
+            entry = self.storage.get(key)
+
+            # Responses that vary on request headers are cached under a key that
+            # includes them, and their `Vary` header under the request's key
+            vary: Sequence[str] = (
+                parse_vary(httpx.Headers(entry.headers).get(HTTPHeader.VARY))
+                if entry is not None
+                else ()
+            )
+
+            if vary:
+                variant_key: Optional[str] = get_cache_key(request, vary=vary)
+
+                assert variant_key is not None
+
+                key = variant_key
+                entry = self.storage.get(key)
+
+        stale_if_error: float = 0.0
+
+        if entry is not None:
+            now: float = time.time()
+
+            if entry.is_fresh(now):
+                return self.build_response(entry, request)
+
+            stale_while_revalidate: float
+            stale_while_revalidate, stale_if_error = self._get_stale_windows(
+                httpx.Headers(entry.headers)
+            )
+
+            if now < entry.fresh_until + stale_while_revalidate:
+                self.revalidate(call_next, request, key)
+
+                return self.build_response(entry, request, stale=True)
+
+        response: Response
+
+        try:
+            response = call_next(request)
+        except httpx.TransportError:
+            if entry is not None and time.time() < entry.fresh_until + stale_if_error:
+                return self.build_response(entry, request, stale=True)
+
+            raise
+
+        if (
+            response.status_code in self.ERROR_STATUS_CODES
+            and entry is not None
+            and time.time() < entry.fresh_until + stale_if_error
+        ):
+            response.close()
+
+            return self.build_response(entry, request, stale=True)
+
+        if "no-store" not in directives:
+            self.store(request, response)
+
+        return response
+
+    def revalidate(self, call_next: CallNext, request: Request, key: str, /) -> None:
+        """Refresh the cached response to `request` in a background thread"""
+
+        def refresh(refresh_request: Request, /) -> None:
+            try:
+                response: Response = call_next(refresh_request)
+
+                self.store(refresh_request, response)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The stale response remains cached (and can still be served)
+                logger.warning(
+                    "Failed to revalidate %s %s",
+                    refresh_request.method,
+                    refresh_request.url,
+                    exc_info=True,
+                )
+            finally:
+                with self._lock:
+                    del self._revalidations[key]
+
+        with self._lock:
+            if key in self._revalidations:
+                return
+
+            # `request` is handed back to the caller (with the stale response), so
+            # a copy of it is sent instead
+            refresh_request: Request = Request(
+                request.method,
+                request.url,
+                headers=request.headers.copy(),
+                # Keyed requests have been read, so their content is available
+                content=request.content,
+                extensions={**request.extensions},
+                state=State(vars(request.state)),
+            )
+
+            thread: threading.Thread = threading.Thread(
+                target=refresh,
+                args=(refresh_request,),
+                name=f"{type(self).__name__}-{key[:8]}",
+                daemon=True,
+            )
+
+            self._revalidations[key] = thread
+
+        thread.start()
+
+    def join(self, timeout: Optional[float] = None, /) -> None:
+        """Wait for any background revalidations to finish"""
+
+        with self._lock:
+            threads: Sequence[threading.Thread] = list(self._revalidations.values())
+
+        thread: threading.Thread
+        for thread in threads:
+            thread.join(timeout)
+
+    def get_ttl(self, response: Response, /) -> Optional[float]:
+        """Get how long `response` is fresh for, or `None` if it can't be cached"""
+
+        if response.status_code not in self.CACHEABLE_STATUS_CODES:
+            return None
+
+        directives: Mapping[str, Optional[str]] = parse_cache_control(
+            response.headers.get(HTTPHeader.CACHE_CONTROL)
+        )
+
+        if "no-store" in directives or "*" in parse_vary(
+            response.headers.get(HTTPHeader.VARY)
+        ):
+            return None
+        # Must be revalidated before each use
+        if "no-cache" in directives:
+            return 0.0
+
+        return _get_seconds(directives, "max-age", self.ttl)
+
+    def store(self, request: Request, response: Response, /) -> None:
+        """Cache `response` (if cacheable) as the response to `request`"""
+
+        key: Optional[str] = get_cache_key(request)
+        ttl: Optional[float] = self.get_ttl(response)
+
+        if key is None or ttl is None:
+            return
+
+        stale_while_revalidate: float
+        stale_if_error: float
+        stale_while_revalidate, stale_if_error = self._get_stale_windows(
+            response.headers
+        )
+
+        stored_at: float = time.time()
+        fresh_until: float = stored_at + ttl
+        # Kept for as long as the entry may be served (whether fresh or stale)
+        expires_at: float = fresh_until + max(stale_while_revalidate, stale_if_error)
+
+        if expires_at <= stored_at:
+            # Superseded, so any previously cached response is no longer served
+            self.storage.delete(key)
+
+            return
+
+        vary: Sequence[str] = parse_vary(response.headers.get(HTTPHeader.VARY))
+
+        if vary:
+            self.storage.set(
+                key,
+                CacheEntry(
+                    status_code=response.status_code,
+                    headers=[(HTTPHeader.VARY, ", ".join(vary))],
+                    content=b"",
+                    stored_at=stored_at,
+                    fresh_until=fresh_until,
+                    expires_at=expires_at,
+                ),
+            )
+
+            variant_key: Optional[str] = get_cache_key(request, vary=vary)
+
+            assert variant_key is not None
+
+            key = variant_key
+
+        content: bytes = response.read()
+
+        self.storage.set(
+            key,
+            CacheEntry(
+                status_code=response.status_code,
+                headers=[
+                    *(
+                        (name, value)
+                        for name, value in response.headers.multi_items()
+                        # Content is stored decoded (and whole)
+                        if name.lower()
+                        not in (
+                            "content-encoding",
+                            "content-length",
+                            "transfer-encoding",
+                        )
+                    ),
+                    (HTTPHeader.CONTENT_LENGTH, str(len(content))),
+                ],
+                content=content,
+                stored_at=stored_at,
+                fresh_until=fresh_until,
+                expires_at=expires_at,
+            ),
+        )
+
+    @staticmethod
+    def build_response(
+        entry: CacheEntry, request: Request, /, *, stale: bool = False
+    ) -> Response:
+        return Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=request,
+            extensions={"from_cache": True, "stale": stale},
+        )
+
+    def _get_stale_windows(self, headers: httpx.Headers, /) -> Tuple[float, float]:
+        """
+        Get how long a response with `headers` may be served stale whilst
+        revalidating, and on error.
+        """
+
+        directives: Mapping[str, Optional[str]] = parse_cache_control(
+            headers.get(HTTPHeader.CACHE_CONTROL)
+        )
+
+        # Must not be served without revalidation
+        if "no-cache" in directives:
+            return (0.0, 0.0)
+
+        return (
+            _get_seconds(
+                directives, "stale-while-revalidate", self.stale_while_revalidate
+            ),
+            _get_seconds(directives, "stale-if-error", self.stale_if_error),
+        )
+
+
+def _get_seconds(
+    directives: Mapping[str, Optional[str]], directive: str, default: float, /
+) -> float:
+    value: Optional[str] = directives.get(directive)
+
+    if value is not None and value.isdigit():
+        return float(value)
+
+    return default
+
+
 def raise_for_status(call_next: CallNext, request: Request, /) -> Response:
     response: Response = call_next(request)
 
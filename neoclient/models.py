@@ -1,4 +1,4 @@
-import dataclasses
+import copy
 import urllib.parse
 from dataclasses import dataclass
 from types import SimpleNamespace
@@ -13,6 +13,9 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
+    Type,
+    TypeVar,
     Union,
 )
 
@@ -30,19 +33,26 @@ from httpx import (
 from httpx._client import USE_CLIENT_DEFAULT, UseClientDefault
 from typing_extensions import Self
 
-from . import converters, utils
+from . import converters
+from .codecs import Codec, get_codec, is_json
 from .constants import USER_AGENT
 from .defaults import (
     DEFAULT_BASE_URL,
     DEFAULT_ENCODING,
     DEFAULT_FOLLOW_REDIRECTS,
+    DEFAULT_HTTP1,
+    DEFAULT_HTTP2,
     DEFAULT_LIMITS,
     DEFAULT_MAX_REDIRECTS,
     DEFAULT_TIMEOUT,
     DEFAULT_TRUST_ENV,
 )
+from .dns import DNSCache, install_dns_cache
 from .enums import HTTPHeader
 from .errors import IncompatiblePathParameters
+from .streams import FileStream
+from .templates import URLTemplate, get_url_template
+from .transports import HostOptions, build_host_mounts, instrument
 from .types import (
     AsyncByteStream,
     AuthTypes,
@@ -80,8 +90,11 @@ __all__ = (
     "Request",
     "Response",
     "RequestOpts",
+    "StaticRequestParts",
 )
 
+T = TypeVar("T")
+
 
 class State(SimpleNamespace, MutableMapping):
     def __init__(
@@ -161,31 +174,17 @@ class Request(httpx.Request):
     def from_httpx_request(
         cls, httpx_request: httpx.Request, /, *, state: Optional[State] = None
     ) -> "Request":
-        if isinstance(httpx_request, Request):
-            return httpx_request
+        """
+        Adopt `httpx_request` as a `Request`.
 
-        if hasattr(httpx_request, "_content"):
-            request: Request = cls(
-                method=httpx_request.method,
-                url=httpx_request.url,
-                headers=httpx_request.headers,
-                extensions=httpx_request.extensions,
-                stream=httpx_request.stream,
-                state=state,
-            )
-
-            request._content = httpx_request.content
+        The request is adopted in place (rather than copied), so its headers,
+        content and stream aren't rebuilt.
+        """
 
-            return request
+        if isinstance(httpx_request, Request):
+            return httpx_request
 
-        return cls(
-            method=httpx_request.method,
-            url=httpx_request.url,
-            headers=httpx_request.headers,
-            extensions=httpx_request.extensions,
-            stream=httpx_request.stream,
-            state=state,
-        )
+        return _adopt(httpx_request, cls, state)
 
 
 class Response(httpx.Response):
@@ -228,32 +227,27 @@ class Response(httpx.Response):
     def from_httpx_response(
         cls, httpx_response: httpx.Response, /, *, state: Optional[State] = None
     ) -> "Response":
-        response: Response
-
-        if hasattr(httpx_response, "_content"):
-            response = cls(
-                status_code=httpx_response.status_code,
-                headers=httpx_response.headers,
-                # NOTE: Type below temporarily ignored due to #168
-                request=httpx_response.request,  # type: ignore
-                stream=httpx_response.stream,
-                state=state,
-            )
+        """
+        Adopt `httpx_response` as a `Response`.
 
-            response._content = httpx_response.content
-        else:
-            response = cls(
-                status_code=httpx_response.status_code,
-                headers=httpx_response.headers,
-                # NOTE: Type below temporarily ignored due to #168
-                request=httpx_response.request,  # type: ignore
-                stream=httpx_response.stream,
-                state=state,
-            )
+        The response is adopted in place (rather than copied), so its headers,
+        content and stream aren't rebuilt, and any state set by the client (such
+        as its elapsed time, once closed) is kept.
+        """
 
-        response.history = httpx_response.history
+        if isinstance(httpx_response, Response):
+            return httpx_response
 
-        return response
+        return _adopt(httpx_response, cls, state)
+
+
+def _adopt(obj: Any, cls: Type[T], state: Optional[State], /) -> T:
+    # `Request` and `Response` only add (non-slotted) attributes to their httpx
+    # counterparts, so instances of the latter can become instances of the former
+    obj.__class__ = cls
+    obj.state = state if state is not None else State()
+
+    return obj
 
 
 @dataclass(init=False)
@@ -268,6 +262,9 @@ class ClientOptions:
     http2: bool
     proxies: Optional[ProxiesTypes]
     mounts: Mapping[str, BaseTransport]
+    hosts: Mapping[str, HostOptions]
+    max_concurrent_streams: Optional[int]
+    dns_cache: Optional[DNSCache]
     timeout: Timeout
     follow_redirects: bool
     limits: Limits
@@ -287,10 +284,13 @@ class ClientOptions:
         cookies: Optional[CookiesTypes] = None,
         verify: VerifyTypes = True,
         cert: Optional[CertTypes] = None,
-        http1: bool = True,
-        http2: bool = False,
+        http1: bool = DEFAULT_HTTP1,
+        http2: bool = DEFAULT_HTTP2,
         proxies: Optional[ProxiesTypes] = None,
         mounts: Optional[Mapping[str, BaseTransport]] = None,
+        hosts: Optional[Mapping[str, HostOptions]] = None,
+        max_concurrent_streams: Optional[int] = None,
+        dns_cache: Optional[DNSCache] = None,
         timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         follow_redirects: bool = DEFAULT_FOLLOW_REDIRECTS,
         limits: Limits = DEFAULT_LIMITS,
@@ -320,6 +320,9 @@ class ClientOptions:
         self.http2 = http2
         self.proxies = proxies
         self.mounts = mounts if mounts is not None else {}
+        self.hosts = hosts if hosts is not None else {}
+        self.max_concurrent_streams = max_concurrent_streams
+        self.dns_cache = dns_cache
         self.timeout = (
             converters.convert_timeout(timeout) if timeout is not None else Timeout()
         )
@@ -341,7 +344,18 @@ class ClientOptions:
         # Set a default User-Agent header
         headers.setdefault(HTTPHeader.USER_AGENT, USER_AGENT)
 
-        return httpx.Client(
+        # Host-specific transports are mounted, unless explicitly overridden
+        mounts: Mapping[str, BaseTransport] = {
+            **build_host_mounts(
+                self.hosts,
+                verify=self.verify,
+                cert=self.cert,
+                trust_env=self.trust_env,
+            ),
+            **self.mounts,
+        }
+
+        client: httpx.Client = httpx.Client(
             auth=self.auth,
             params=self.params,
             headers=headers,
@@ -351,7 +365,7 @@ class ClientOptions:
             http1=self.http1,
             http2=self.http2,
             proxies=self.proxies,
-            mounts=self.mounts,
+            mounts=mounts,
             timeout=self.timeout,
             follow_redirects=self.follow_redirects,
             limits=self.limits,
@@ -364,6 +378,13 @@ class ClientOptions:
             default_encoding=self.default_encoding,
         )
 
+        instrument(client, max_concurrent_streams=self.max_concurrent_streams)
+
+        if self.dns_cache is not None:
+            install_dns_cache(client, self.dns_cache)
+
+        return client
+
 
 @dataclass
 class BaseRequestOpts:
@@ -433,19 +454,63 @@ class BaseRequestOpts:
         url = str(self.url)
         return f"<{class_name}({self.method!r}, {url!r})>"
 
-    def build(self, client: Optional[Client] = None) -> httpx.Request:
+    def build(
+        self,
+        client: Optional[Client] = None,
+        *,
+        static: Optional["StaticRequestParts"] = None,
+    ) -> httpx.Request:
+        return self._build(self.url, client, static=static)
+
+    def _build(
+        self,
+        url: URL,
+        client: Optional[Client] = None,
+        *,
+        static: Optional["StaticRequestParts"] = None,
+    ) -> httpx.Request:
         if client is None:
             client = Client()
 
+        headers: Headers = self.headers
+        content: Optional[RequestContent] = self.content
+        json: Optional[Any] = self.json
+
+        # JSON content is encoded using the codec for the declared content type
+        # (if any), such as MessagePack
+        if json is not None and HTTPHeader.CONTENT_TYPE in headers:
+            codec: Optional[Codec] = get_codec(headers[HTTPHeader.CONTENT_TYPE])
+
+            if not is_json(codec):
+                assert codec is not None
+
+                content = codec.encode(json)
+                json = None
+
+        # Streamed files of a known length can be sent with a `Content-Length`
+        # header, rather than using chunked transfer-encoding
+        if (
+            isinstance(self.content, FileStream)
+            and self.content.length is not None
+            and HTTPHeader.CONTENT_LENGTH not in headers
+        ):
+            headers = headers.copy()
+            headers[HTTPHeader.CONTENT_LENGTH] = str(self.content.length)
+
+        if static is not None:
+            return static.build_request(
+                client, self, url=url, headers=headers, content=content, json=json
+            )
+
         return client.build_request(
             method=self.method,
-            url=self.url,
-            content=self.content,
+            url=url,
+            content=content,
             data=self.data,
             files=self.files,
-            json=self.json,
+            json=json,
             params=self.params,
-            headers=self.headers,
+            headers=headers,
             cookies=self.cookies,
             timeout=self.timeout if self.timeout is not None else USE_CLIENT_DEFAULT,
             extensions=self.extensions,
@@ -464,14 +529,21 @@ class BaseRequestOpts:
         )
 
     def copy(self) -> Self:
-        return dataclasses.replace(
-            self,
-            timeout=(
-                self.timeout
-                if self.timeout is not None
-                else USE_CLIENT_DEFAULT  #  type: ignore
-            ),
-        )
+        """
+        Copy these request options, for layering (e.g. per-call) changes on top.
+
+        Only the mutable parts are copied, so that mutating the copy doesn't affect
+        the original. Immutable parts (e.g. the URL, query params and timeout) are
+        shared, and nothing is re-converted.
+        """
+
+        request: Self = copy.copy(self)
+
+        request.headers = self.headers.copy()
+        request.cookies = Cookies(self.cookies) if self.cookies else Cookies()
+        request.extensions = {**self.extensions}
+
+        return request
 
     def validate(self) -> None:
         return
@@ -525,22 +597,34 @@ class RequestOpts(BaseRequestOpts):
         )
         self.state = state if state is not None else State()
 
-    def build(self, client: Optional[Client] = None) -> Request:
-        request_opts: RequestOpts = dataclasses.replace(self, url=self.formatted_url)
-        request: httpx.Request = BaseRequestOpts.build(request_opts, client)
+    def copy(self) -> Self:
+        request: Self = super().copy()
+
+        request.path_params = {**self.path_params}
+        request.state = State(vars(self.state))
+
+        return request
+
+    def build(
+        self,
+        client: Optional[Client] = None,
+        *,
+        static: Optional["StaticRequestParts"] = None,
+    ) -> Request:
+        request: httpx.Request = self._build(self.formatted_url, client, static=static)
 
         return Request.from_httpx_request(request, state=self.state)
 
+    @property
+    def url_template(self) -> URLTemplate:
+        return get_url_template(str(self.url))
+
     @property
     def formatted_url(self) -> URL:
-        # NOTE: Does URL encoding affect this?
-        return URL(str(self.url).format(**self.path_params))
+        return self.url_template.expand(self.path_params)
 
     def validate(self):
-        # NOTE: Does URL encoding affect this?
-        url: str = str(self.url)
-
-        expected_path_params: Set[str] = utils.parse_format_string(url)
+        expected_path_params: Set[str] = self.url_template.placeholders
         actual_path_params: Set[str] = set(self.path_params.keys())
 
         # Validate path params are correct
@@ -548,3 +632,176 @@ class RequestOpts(BaseRequestOpts):
             raise IncompatiblePathParameters(
                 f"Expected {tuple(expected_path_params)}, got {tuple(actual_path_params)}"
             )
+
+
+CookieItems = Sequence[Tuple[str, Optional[str], str, str, bool, Optional[int]]]
+
+
+def _get_cookie_items(cookies: Cookies, /) -> CookieItems:
+    return [
+        (
+            cookie.name,
+            cookie.value,
+            cookie.domain,
+            cookie.path,
+            cookie.secure,
+            cookie.expires,
+        )
+        for cookie in cookies.jar
+    ]
+
+
+def _merge_url(base_url: URL, url: URL, /) -> URL:
+    # Matches `httpx.Client._merge_url`
+    if url.is_relative_url:
+        return base_url.copy_with(
+            raw_path=base_url.raw_path + url.raw_path.lstrip(b"/")
+        )
+
+    return url
+
+
+@dataclass(frozen=True)
+class StaticRequestParts:
+    """
+    The static headers, query params and cookies of an operation's requests: the
+    defaults of its client merged with those of the operation (e.g. set using
+    decorators).
+
+    These are merged once (rather than by the client for every request), with any
+    cookies that apply to all URLs encoded into a `Cookie` header. Requests whose
+    headers, query params or cookies differ from those of the operation (e.g. due to
+    arguments) have them merged with the client's defaults as usual.
+    """
+
+    # The headers, query params and cookies these parts were merged from
+    client_headers: Sequence[Tuple[bytes, bytes]]
+    client_params: QueryParams
+    client_cookies: CookieItems
+    request_headers: Sequence[Tuple[bytes, bytes]]
+    request_params: Sequence[Tuple[str, str]]
+    request_cookies: CookieItems
+
+    headers: Headers
+    params: QueryParams
+    # `None` if there are cookies that don't apply to all URLs
+    cookie_header: Optional[str]
+
+    @classmethod
+    def assemble(
+        cls, client: Client, request: BaseRequestOpts, /
+    ) -> Optional["StaticRequestParts"]:
+        """
+        Merge the static parts of `request` with the defaults of `client`, returning
+        `None` if the client builds requests itself (by overriding `build_request`).
+        """
+
+        if type(client).build_request is not Client.build_request:
+            return None
+
+        headers: Headers = Headers(client.headers)
+        headers.update(request.headers)
+
+        cookies: Cookies = Cookies(client.cookies)
+        cookies.update(request.cookies)
+
+        cookie_header: Optional[str] = None
+
+        if all(
+            cookie.domain == ""
+            and cookie.path == "/"
+            and not cookie.secure
+            and cookie.expires is None
+            for cookie in cookies.jar
+        ):
+            # These cookies are sent to any URL, so encode them as any URL
+            encoding_request: httpx.Request = httpx.Request(
+                "GET", "http://example.com/", cookies=cookies
+            )
+
+            cookie_header = encoding_request.headers.get(HTTPHeader.COOKIE, "")
+
+        return cls(
+            client_headers=client.headers.raw,
+            client_params=client.params,
+            client_cookies=_get_cookie_items(client.cookies),
+            request_headers=request.headers.raw,
+            request_params=request.params.multi_items(),
+            request_cookies=_get_cookie_items(request.cookies),
+            headers=headers,
+            params=client.params.merge(request.params),
+            cookie_header=cookie_header,
+        )
+
+    def is_current(self, client: Client, request: BaseRequestOpts, /) -> bool:
+        """Whether these parts were merged from `client` and `request` as they are"""
+
+        return (
+            client.params is self.client_params
+            and request.headers.raw == self.request_headers
+            and request.params.multi_items() == self.request_params
+            and _get_cookie_items(request.cookies) == self.request_cookies
+            and client.headers.raw == self.client_headers
+            and _get_cookie_items(client.cookies) == self.client_cookies
+        )
+
+    def build_request(
+        self,
+        client: Client,
+        request: BaseRequestOpts,
+        /,
+        *,
+        url: URL,
+        headers: Headers,
+        content: Optional[RequestContent],
+        json: Optional[Any],
+    ) -> httpx.Request:
+        """
+        Build `request` (with the given `url`, `headers`, `content` and `json`) as
+        `client.build_request` would, only merging its dynamic parts.
+        """
+
+        merged_headers: Headers = self.headers
+        params: QueryParams = self.params
+        cookies: Optional[Cookies] = None
+
+        if headers.raw != self.request_headers:
+            merged_headers = Headers(client.headers)
+            merged_headers.update(headers)
+        if request.params.multi_items() != self.request_params:
+            params = client.params.merge(request.params)
+
+        if (
+            self.cookie_header is not None
+            and _get_cookie_items(request.cookies) == self.request_cookies
+        ):
+            if self.cookie_header and HTTPHeader.COOKIE not in merged_headers:
+                # Copy-on-write, as the static headers are shared
+                merged_headers = Headers(
+                    [*merged_headers.raw, (b"Cookie", self.cookie_header.encode())]
+                )
+        elif client.cookies or request.cookies:
+            cookies = Cookies(client.cookies)
+            cookies.update(request.cookies)
+
+        extensions: RequestExtensions = request.extensions
+
+        if "timeout" not in extensions:
+            timeout: Timeout = (
+                request.timeout if request.timeout is not None else client.timeout
+            )
+
+            extensions = {**extensions, "timeout": timeout.as_dict()}
+
+        return httpx.Request(
+            request.method,
+            _merge_url(client.base_url, url),
+            content=content,
+            data=request.data,
+            files=request.files,
+            json=json,
+            params=params,
+            headers=merged_headers,
+            cookies=cookies,
+            extensions=extensions,
+        )
@@ -1,21 +1,41 @@
+import collections.abc
 import functools
 import inspect
+import typing
 from dataclasses import dataclass, field
-from json import JSONDecodeError
 from types import FunctionType, MethodType
-from typing import Any, Callable, Generic, MutableSequence, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import httpx
-import pydantic
 from httpx import Client
-from pydantic import BaseModel
 from typing_extensions import ParamSpec
 
-from .composition import compose
+from .adapters import TypeAdapter, get_type_adapter
+from .builders import building
+from .codecs import Codec, get_codec, is_json
+from .composition import Composition, compose, get_composition
+from .decoders import Decoder, get_default_decoder
+from .dependence import DependencyGraph, PreparedDependency
+from .enums import HTTPHeader
 from .errors import NotAnOperationError
+from .memoization import OperationCache, make_key
 from .middleware import Middleware
-from .models import ClientOptions, Request, RequestOpts, Response
-from .resolution import resolve_request, resolve_response
+from .models import ClientOptions, Request, RequestOpts, Response, StaticRequestParts
+from .pagination import Paginator
 from .typing import Dependency
 
 __all__ = (
@@ -48,6 +68,21 @@ def get_operation(func: Callable, /) -> "Operation":
     return operation
 
 
+@dataclass
+class _SharedParts:
+    """
+    The parts of an operation prepared for its calls, shared by its (shallow) copies,
+    e.g. one per service instance, so that each doesn't have to prepare them again.
+    """
+
+    composition: Optional[Composition] = None
+    static: Optional[StaticRequestParts] = None
+    # The prepared dependencies of the graphs
+    dependencies: MutableMapping[Hashable, PreparedDependency] = field(
+        default_factory=dict
+    )
+
+
 @dataclass
 class Operation(Generic[PS, RT_co]):
     func: Callable[PS, RT_co]
@@ -58,33 +93,47 @@ class Operation(Generic[PS, RT_co]):
     middleware: Middleware = field(default_factory=Middleware)
     request_dependencies: MutableSequence[Dependency] = field(default_factory=list)
     response_dependencies: MutableSequence[Dependency] = field(default_factory=list)
+    paginator: Optional[Paginator] = None
+    # If `None`, the client's setting is used (responses are validated by default)
+    validate_response: Optional[bool] = None
+    # If `None`, the client's setting is used (arguments are validated by default)
+    validate_arguments: Optional[bool] = None
+    # If `None`, the client's setting is used (argument types aren't checked by
+    # default)
+    check_argument_types: Optional[bool] = None
+    # If `None`, the client's decoder is used (or else the default decoder)
+    decoder: Optional[Decoder] = None
+    cache: Optional[OperationCache] = None
+    # The prepared composition of requests from the function's arguments
+    _composition: Optional[Composition] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The static parts of requests, merged with the defaults of the last client used
+    _static: Optional[StaticRequestParts] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The compiled graphs of the request and response dependencies
+    _request_graph: Optional[DependencyGraph] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _response_graph: Optional[DependencyGraph] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _shared: _SharedParts = field(
+        default_factory=_SharedParts, init=False, repr=False, compare=False
+    )
+    # Gets the client for each call, if it may change between calls (e.g. a
+    # service's shared client, which is rebuilt if closed)
+    _client_getter: Optional[Callable[[], Client]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __call__(self, *args: PS.args, **kwargs: PS.kwargs) -> Any:
-        client: Client
-
-        if self.client is not None:
-            client = self.client
-        else:
-            # Build a disposable client using the available client options
-            client = self.client_options.build()
-
-        # Create a clone of the request options, so that mutations don't
-        # affect the original copy.
-        # Mutations to the request options will occur during composition.
-        pre_request: RequestOpts = self.request_options.copy()
-
-        # Compose the request using the provided arguments
-        compose(self.func, pre_request, args, kwargs)
-
-        # Compose the request using each of the composition dependencies
-        request_dependency: Dependency
-        for request_dependency in self.request_dependencies:
-            resolve_request(request_dependency, pre_request)
-
-        # Validate the pre-request (e.g. to ensure no path params have been missed)
-        pre_request.validate()
+        client: Client = self._get_client()
 
-        request: Request = pre_request.build(client)
+        pre_request: RequestOpts
+        request: Request
+        pre_request, request = self._build_request(client, args, kwargs)
 
         return_annotation: Any = inspect.signature(self.func).return_annotation
 
@@ -104,47 +153,234 @@ class Operation(Generic[PS, RT_co]):
 
             return Response.from_httpx_response(httpx_response)
 
-        response: Response = send_request(request)
+        if self.paginator is not None:
+            return self._paginate(send_request, request, return_annotation)
+
+        def receive() -> Any:
+            return self._parse_response(send_request(request), return_annotation)
+
+        # Memoized return values skip both the network and response parsing
+        if self.cache is not None:
+            key: Optional[Hashable] = make_key(request)
+
+            if key is not None:
+                return self.cache.get_or_call(key, receive)
+
+        return receive()
+
+    def invalidate(self, *args: PS.args, **kwargs: PS.kwargs) -> bool:
+        """
+        Invalidate the memoized return value for the given arguments.
 
+        Returns whether there was a memoized value.
+        """
+
+        if self.cache is None:
+            return False
+
+        request: Request
+        _, request = self._build_request(self._get_client(), args, kwargs)
+
+        key: Optional[Hashable] = make_key(request)
+
+        return key is not None and self.cache.invalidate(key)
+
+    def _get_client(self) -> Client:
+        if self._client_getter is not None:
+            return self._client_getter()
+        if self.client is not None:
+            return self.client
+
+        # Build a disposable client using the available client options
+        return self.client_options.build()
+
+    def _build_request(
+        self, client: Client, args: Tuple[Any, ...], kwargs: Mapping[str, Any], /
+    ) -> Tuple[RequestOpts, Request]:
+        # Create a clone of the request options, so that mutations don't
+        # affect the original copy.
+        # Mutations to the request options will occur during composition.
+        pre_request: RequestOpts = self.request_options.copy()
+
+        with building(pre_request):
+            # Compose the request using the provided arguments
+            compose(
+                self.func,
+                pre_request,
+                args,
+                kwargs,
+                validate=self.validate_arguments is not False,
+                check_types=self.check_argument_types is True,
+                composition=self._get_composition(),
+            )
+
+            # Compose the request using each of the composition dependencies
+            self._get_request_graph().resolve_request(pre_request)
+
+        # Validate the pre-request (e.g. to ensure no path params have been missed)
+        pre_request.validate()
+
+        return pre_request, pre_request.build(client, static=self._get_static(client))
+
+    def _get_composition(self) -> Composition:
+        composition: Optional[Composition] = self._composition
+
+        # The composition is re-prepared if the function (or its path) has changed,
+        # unless a copy of the operation has already prepared it
+        if composition is None or not composition.is_current(
+            self.request_options, self.func
+        ):
+            composition = self._shared.composition
+
+            if composition is None or not composition.is_current(
+                self.request_options, self.func
+            ):
+                composition = get_composition(self.request_options, self.func)
+
+                self._shared.composition = composition
+
+            self._composition = composition
+
+        return composition
+
+    def _get_static(self, client: Client, /) -> Optional[StaticRequestParts]:
+        static: Optional[StaticRequestParts] = self._static
+
+        # The parts are re-assembled if the client (or its defaults) has changed,
+        # unless a copy of the operation has already assembled them
+        if static is None or not static.is_current(client, self.request_options):
+            static = self._shared.static
+
+            if static is None or not static.is_current(client, self.request_options):
+                static = StaticRequestParts.assemble(client, self.request_options)
+
+                self._shared.static = static
+
+            self._static = static
+
+        return static
+
+    def _parse_response(self, response: Response, return_annotation: Any, /) -> Any:
         # Feed the response through each of the response dependencies
-        response_dependency: Dependency
-        for response_dependency in self.response_dependencies:
-            resolve_response(response_dependency, response)
+        resolutions: Sequence[Any] = self._get_response_graph().resolve_response(
+            response
+        )
 
         if self.response is not None:
-            resolved_response: Any
-
-            # If the response dependency is a class-style decorator, resolve
-            # the response against the class instance's `__call__` method, otherwise
-            # inspection of the dependency may inadvertently be inspecting the
-            # `__init__` method instead.
-            if not isinstance(self.response, (FunctionType, MethodType)) and hasattr(
-                self.response, "__call__"
-            ):
-                resolved_response = resolve_response(self.response.__call__, response)
-            else:
-                resolved_response = resolve_response(self.response, response)
+            resolved_response: Any = resolutions[-1]
 
             if return_annotation is inspect.Parameter.empty:
                 return resolved_response
             else:
-                return pydantic.parse_obj_as(return_annotation, resolved_response)
+                return self._parse_obj(return_annotation, resolved_response)
+
+        decoder: Decoder = (
+            self.decoder if self.decoder is not None else get_default_decoder()
+        )
+
+        # Binary content (e.g. MessagePack) is decoded using the codec for its
+        # content type, otherwise content is assumed to be JSON
+        codec: Optional[Codec] = get_codec(
+            response.headers.get(HTTPHeader.CONTENT_TYPE)
+        )
 
         if return_annotation is inspect.Parameter.empty:
             try:
-                return response.json()
-            except JSONDecodeError:
+                return (
+                    decoder.loads(response.content)
+                    if is_json(codec)
+                    else codec.decode(response.content)  # type: ignore
+                )
+            except ValueError:
                 return response.text
         if return_annotation is None:
             return None
         if return_annotation is Response:
             return response
-        if isinstance(return_annotation, type) and issubclass(
-            return_annotation, BaseModel
+        if not is_json(codec):
+            return self._parse_obj(
+                return_annotation, codec.decode(response.content)  # type: ignore
+            )
+
+        return decoder.decode(
+            response.content,
+            return_annotation,
+            validate=self.validate_response is not False,
+        )
+
+    def _parse_obj(self, annotation: Any, obj: Any, /) -> Any:
+        adapter: TypeAdapter = get_type_adapter(annotation)
+
+        if self.validate_response is False:
+            return adapter.construct_python(obj)
+
+        return adapter.validate_python(obj)
+
+    def _get_request_graph(self) -> DependencyGraph:
+        return self._get_graph("_request_graph", tuple(self.request_dependencies))
+
+    def _get_response_graph(self) -> DependencyGraph:
+        dependencies: Tuple[Dependency, ...] = tuple(self.response_dependencies)
+
+        # The resolved response (if any) is the last dependency of the graph
+        if self.response is not None:
+            dependencies += (_get_response_dependency(self.response),)
+
+        return self._get_graph("_response_graph", dependencies)
+
+    def _get_graph(
+        self, attribute: str, dependencies: Tuple[Dependency, ...], /
+    ) -> DependencyGraph:
+        graph: Optional[DependencyGraph] = getattr(self, attribute)
+
+        # The graph is re-compiled if its dependencies have changed (e.g. been
+        # added by decorators since it was compiled)
+        if graph is None or graph.dependencies != dependencies:
+            graph = DependencyGraph.compile(
+                dependencies, prepared=self._shared.dependencies
+            )
+
+            setattr(self, attribute, graph)
+
+        return graph
+
+    def _paginate(
+        self,
+        send_request: Callable[[Request], Response],
+        request: Request,
+        return_annotation: Any,
+        /,
+    ) -> Iterator[Any]:
+        assert self.paginator is not None
+
+        paginator: Paginator = self.paginator
+        item_annotation: Any = Any
+
+        # Operations returning `Iterator[T]` (or similar) have their items parsed as `T`
+        if typing.get_origin(return_annotation) in (
+            collections.abc.Iterator,
+            collections.abc.Iterable,
+            collections.abc.Generator,
         ):
-            return return_annotation.parse_obj(response.json())
+            item_annotation = typing.get_args(return_annotation)[0]
+
+        def get_items(response: Response, /) -> Sequence[Any]:
+            resolutions: Sequence[Any] = self._get_response_graph().resolve_response(
+                response
+            )
+
+            items: Any = (
+                resolutions[-1]
+                if self.response is not None
+                else paginator.pagination.get_items(response)
+            )
 
-        return pydantic.parse_raw_as(return_annotation, response.text)
+            if item_annotation is Any:
+                return items
+
+            return self._parse_obj(List[item_annotation], items)  # type: ignore
+
+        return paginator(send_request, request, get_items)
 
     @property
     def wrapper(self) -> Callable[PS, RT_co]:
@@ -159,3 +395,16 @@ class Operation(Generic[PS, RT_co]):
         set_operation(wrapper, self)
 
         return wrapper
+
+
+def _get_response_dependency(dependency: Dependency, /) -> Dependency:
+    # If the response dependency is a class-style decorator, resolve
+    # the response against the class instance's `__call__` method, otherwise
+    # inspection of the dependency may inadvertently be inspecting the
+    # `__init__` method instead.
+    if not isinstance(dependency, (FunctionType, MethodType)) and hasattr(
+        dependency, "__call__"
+    ):
+        return dependency.__call__
+
+    return dependency
@@ -0,0 +1,334 @@
+import itertools
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Iterator, Mapping, Optional, Sequence
+
+from httpx import URL
+
+from .errors import PaginationError
+from .models import Request, Response, State
+
+__all__ = (
+    "Pagination",
+    "LinkPagination",
+    "CursorPagination",
+    "IndexedPagination",
+    "OffsetPagination",
+    "PagePagination",
+    "Paginator",
+)
+
+Sender = Callable[[Request], Response]
+ItemsGetter = Callable[[Response], Sequence[Any]]
+
+
+def copy_request(request: Request, url: URL, /) -> Request:
+    # The `Host` header is dropped so that it gets recomputed, as the next page
+    # may live on a different host (e.g. a `Link` header with an absolute URL)
+    headers: Sequence = [
+        (key, value)
+        for key, value in request.headers.multi_items()
+        if key.lower() != "host"
+    ]
+
+    return Request(
+        request.method,
+        url,
+        headers=headers,
+        content=request.read(),
+        extensions=request.extensions,
+        state=State(request.state),
+    )
+
+
+def get_path(obj: Any, path: str, /) -> Any:
+    """
+    Look up a dotted `path` within `obj`
+
+    Example:
+        >>> get_path({"meta": {"next": "abc"}}, "meta.next")
+        "abc"
+    """
+
+    key: str
+    for key in path.split("."):
+        if not isinstance(obj, Mapping):
+            return None
+
+        obj = obj.get(key)
+
+    return obj
+
+
+@dataclass
+class Pagination(ABC):
+    items: Optional[str]
+
+    def get_items(self, response: Response, /) -> Sequence[Any]:
+        body: Any = response.json()
+
+        items: Any = get_path(body, self.items) if self.items is not None else body
+
+        if not isinstance(items, Sequence) or isinstance(items, (str, bytes)):
+            raise PaginationError(
+                f"Expected a sequence of items, got {type(items)!r}"
+                + (f" at {self.items!r}" if self.items is not None else "")
+            )
+
+        return items
+
+    def first_request(self, request: Request, /) -> Request:
+        return request
+
+    @abstractmethod
+    def next_request(
+        self, request: Request, response: Response, items: Sequence[Any], /
+    ) -> Optional[Request]: ...
+
+
+@dataclass(init=False)
+class LinkPagination(Pagination):
+    """Follow the RFC 5988 `Link` header with relation `rel`"""
+
+    rel: str
+
+    def __init__(self, *, rel: str = "next", items: Optional[str] = None) -> None:
+        self.rel = rel
+        self.items = items
+
+    def next_request(
+        self, request: Request, response: Response, items: Sequence[Any], /
+    ) -> Optional[Request]:
+        link: Optional[Mapping[str, str]] = response.links.get(self.rel)
+
+        if link is None or "url" not in link:
+            return None
+
+        return copy_request(request, request.url.join(link["url"]))
+
+
+@dataclass(init=False)
+class CursorPagination(Pagination):
+    """Send the cursor found at `cursor` in the response body as query param `param`"""
+
+    cursor: str
+    param: str
+
+    def __init__(
+        self,
+        cursor: str,
+        /,
+        *,
+        param: str = "cursor",
+        items: Optional[str] = None,
+    ) -> None:
+        self.cursor = cursor
+        self.param = param
+        self.items = items
+
+    def next_request(
+        self, request: Request, response: Response, items: Sequence[Any], /
+    ) -> Optional[Request]:
+        cursor: Any = get_path(response.json(), self.cursor)
+
+        if cursor is None or cursor == "":
+            return None
+
+        return copy_request(request, request.url.copy_set_param(self.param, cursor))
+
+
+class IndexedPagination(Pagination):
+    """
+    Pagination where the request for any page can be built from the first request.
+
+    As pages don't depend on each other, later pages can be prefetched.
+    """
+
+    @abstractmethod
+    def page_request(self, request: Request, index: int, /) -> Request: ...
+
+    @abstractmethod
+    def is_last_page(self, items: Sequence[Any], /) -> bool: ...
+
+    def first_request(self, request: Request, /) -> Request:
+        return self.page_request(request, 0)
+
+    def next_request(
+        self, request: Request, response: Response, items: Sequence[Any], /
+    ) -> Optional[Request]:
+        raise PaginationError(f"{type(self)!r} pages are requested by index")
+
+
+@dataclass(init=False)
+class OffsetPagination(IndexedPagination):
+    limit: int
+    offset_param: str
+    limit_param: str
+
+    def __init__(
+        self,
+        limit: int,
+        /,
+        *,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        items: Optional[str] = None,
+    ) -> None:
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.items = items
+
+    def page_request(self, request: Request, index: int, /) -> Request:
+        offset: int = int(request.url.params.get(self.offset_param, 0))
+        offset += index * self.limit
+
+        url: URL = request.url.copy_merge_params(
+            {self.offset_param: offset, self.limit_param: self.limit}
+        )
+
+        return copy_request(request, url)
+
+    def is_last_page(self, items: Sequence[Any], /) -> bool:
+        return len(items) < self.limit
+
+
+@dataclass(init=False)
+class PagePagination(IndexedPagination):
+    param: str
+    start: int
+    size: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        param: str = "page",
+        start: int = 1,
+        size: Optional[int] = None,
+        items: Optional[str] = None,
+    ) -> None:
+        self.param = param
+        self.start = start
+        self.size = size
+        self.items = items
+
+    def page_request(self, request: Request, index: int, /) -> Request:
+        page: int = int(request.url.params.get(self.param, self.start))
+
+        return copy_request(
+            request, request.url.copy_set_param(self.param, page + index)
+        )
+
+    def is_last_page(self, items: Sequence[Any], /) -> bool:
+        if not items:
+            return True
+
+        return self.size is not None and len(items) < self.size
+
+
+@dataclass
+class Paginator:
+    pagination: Pagination
+    prefetch: int = 0
+
+    def __call__(
+        self, send: Sender, request: Request, get_items: ItemsGetter, /
+    ) -> Iterator[Any]:
+        if isinstance(self.pagination, IndexedPagination):
+            return self._paginate_indexed(self.pagination, send, request, get_items)
+
+        return self._paginate_linked(self.pagination, send, request, get_items)
+
+    def _paginate_linked(
+        self,
+        pagination: Pagination,
+        send: Sender,
+        request: Request,
+        get_items: ItemsGetter,
+        /,
+    ) -> Iterator[Any]:
+        next_request: Optional[Request] = pagination.first_request(request)
+        next_response: Optional[Future] = None
+
+        # As the next page is only known once the current page has been received,
+        # at most one page can be fetched ahead (whilst the current page's items
+        # are being consumed).
+        executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1) if self.prefetch > 0 else None
+        )
+
+        try:
+            while next_request is not None:
+                request = next_request
+                response: Response = (
+                    next_response.result()
+                    if next_response is not None
+                    else send(request)
+                )
+                items: Sequence[Any] = get_items(response)
+
+                next_request = pagination.next_request(request, response, items)
+                next_response = (
+                    executor.submit(send, next_request)
+                    if executor is not None and next_request is not None
+                    else None
+                )
+
+                yield from items
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _paginate_indexed(
+        self,
+        pagination: IndexedPagination,
+        send: Sender,
+        request: Request,
+        get_items: ItemsGetter,
+        /,
+    ) -> Iterator[Any]:
+        requests: Iterator[Request] = (
+            pagination.page_request(request, index) for index in itertools.count(1)
+        )
+
+        if self.prefetch <= 0:
+            response: Response = send(pagination.first_request(request))
+
+            while True:
+                items: Sequence[Any] = get_items(response)
+
+                yield from items
+
+                if pagination.is_last_page(items):
+                    return
+
+                response = send(next(requests))
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.prefetch)
+        pending: Deque[Future] = deque()
+
+        try:
+            pending.append(executor.submit(send, pagination.first_request(request)))
+            pending.extend(
+                executor.submit(send, next(requests)) for _ in range(self.prefetch)
+            )
+
+            while True:
+                items = get_items(pending.popleft().result())
+
+                if pagination.is_last_page(items):
+                    yield from items
+
+                    return
+
+                pending.append(executor.submit(send, next(requests)))
+
+                yield from items
+        finally:
+            future: Future
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
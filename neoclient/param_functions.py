@@ -1,13 +1,13 @@
 from typing import Any, Callable, Optional, Sequence, TypeVar
 
-from pydantic.fields import Undefined
-
+from ._compat import Undefined
 from .dependence import DependencyParameter
 from .params import (
     AllRequestStateParameter,
     AllResponseStateParameter,
     AllStateParameter,
     BodyParameter,
+    ContentParameter,
     CookieParameter,
     CookiesParameter,
     HeaderParameter,
@@ -36,6 +36,7 @@ __all__ = (
     "Cookies",
     "PathParams",
     "Body",
+    "Content",
     "Depends",
     "URL",
     "Reason",
@@ -312,16 +313,33 @@ def Body(
     )
 
 
+def Content(
+    *,
+    default: Any = Undefined,
+    default_factory: Optional[Supplier[Any]] = None,
+) -> ContentParameter:
+    return _validate(
+        ContentParameter(
+            default=default,
+            default_factory=default_factory,
+        )
+    )
+
+
 def Depends(
     dependency: Optional[Callable] = None,
     /,
     *,
     use_cache: bool = True,
+    concurrent: bool = False,
+    timeout: Optional[float] = None,
 ) -> DependencyParameter:
     return _validate(
         DependencyParameter(
             dependency=dependency,
             use_cache=use_cache,
+            concurrent=concurrent,
+            timeout=timeout,
         )
     )
 
@@ -349,11 +349,31 @@ def Body(
     embed: bool = False,
 ) -> T: ...
 
+# Content
+@overload
+def Content() -> Any: ...
+@overload
+def Content(*, default: T) -> T: ...
+@overload
+def Content(*, default_factory: Callable[[], T]) -> T: ...
+
 # Depends
 @overload
-def Depends(*, use_cache: bool = True) -> Any: ...
+def Depends(
+    *,
+    use_cache: bool = True,
+    concurrent: bool = False,
+    timeout: Optional[float] = None,
+) -> Any: ...
 @overload
-def Depends(dependency: Callable[..., T], /, *, use_cache: bool = True) -> T: ...
+def Depends(
+    dependency: Callable[..., T],
+    /,
+    *,
+    use_cache: bool = True,
+    concurrent: bool = False,
+    timeout: Optional[float] = None,
+) -> T: ...
 
 # URL
 def URL() -> Any: ...
@@ -13,13 +13,12 @@ from typing import (
     Union,
 )
 
-import fastapi.encoders
 import httpx
 from httpx import Cookies, Headers, QueryParams
-from pydantic import Required
-from pydantic.fields import FieldInfo, ModelField, Undefined
 
+from ._compat import FieldInfo, ModelField, Required, Undefined, jsonable_encoder
 from .consumers import (
+    ContentConsumer,
     CookieConsumer,
     CookiesConsumer,
     HeaderConsumer,
@@ -63,6 +62,7 @@ __all__ = (
     "CookiesParameter",
     "PathParamsParameter",
     "BodyParameter",
+    "ContentParameter",
     "URLParameter",
     "ResponseParameter",
     "RequestParameter",
@@ -360,7 +360,7 @@ class BodyParameter(Parameter):
         if argument is None and self.default is not Required:
             return
 
-        json_value: Any = fastapi.encoders.jsonable_encoder(argument)
+        json_value: Any = jsonable_encoder(argument)
 
         if self.embed:
             if self.alias is None:
@@ -384,6 +384,18 @@ class BodyParameter(Parameter):
         return BodyResolver()(response)
 
 
+class ContentParameter(Parameter):
+    def compose(self, request: RequestOpts, argument: Any, /) -> None:
+        # If the parameter is not required and has no value, it can be omitted
+        if argument is None and self.default is not Required:
+            return
+
+        ContentConsumer(argument).consume_request(request)
+
+    def resolve_request(self, request: RequestOpts, /) -> Any:
+        return request.content
+
+
 class URLParameter(Parameter):
     def resolve_request(self, request: RequestOpts, /) -> httpx.URL:
         return request.url
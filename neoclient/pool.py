@@ -0,0 +1,198 @@
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, MutableSequence, Optional, Sequence
+
+import httpcore
+import httpx
+from httpx import URL, BaseTransport, HTTPTransport
+
+from .transports import InstrumentedTransport
+from .types import URLTypes
+
+__all__ = (
+    "KeepAlive",
+    "ConnectionMaintainer",
+    "get_pools",
+    "count_connections",
+    "reap",
+    "warmup",
+    "maintain",
+)
+
+
+@dataclass
+class KeepAlive:
+    """
+    Policy for maintaining a client's connection pool in the background.
+
+    Every `interval` seconds, expired connections and connections the server has
+    closed are reaped. If `min_connections` is set, the pool is then topped back
+    up to that many connections to the client's base URL.
+    """
+
+    interval: float = 30.0
+    min_connections: int = 0
+
+
+def _get_pool(
+    transport: Optional[BaseTransport], /
+) -> Optional[httpcore.ConnectionPool]:
+    if isinstance(transport, InstrumentedTransport):
+        return _get_pool(transport.transport)
+    if isinstance(transport, HTTPTransport) and isinstance(
+        transport._pool, httpcore.ConnectionPool
+    ):
+        return transport._pool
+
+    return None
+
+
+def get_pools(client: httpx.Client, /) -> Sequence[httpcore.ConnectionPool]:
+    """Collect the connection pool of each transport used by `client`"""
+
+    pools: MutableSequence[httpcore.ConnectionPool] = []
+
+    transport: Optional[BaseTransport]
+    for transport in (client._transport, *client._mounts.values()):
+        pool: Optional[httpcore.ConnectionPool] = _get_pool(transport)
+
+        if pool is not None and pool not in pools:
+            pools.append(pool)
+
+    return pools
+
+
+def count_connections(client: httpx.Client, url: Optional[URLTypes] = None, /) -> int:
+    """Count the open connections pooled by the transport used for `url`"""
+
+    pool: Optional[httpcore.ConnectionPool] = _get_pool(
+        client._transport_for_url(URL(url) if url is not None else client.base_url)
+    )
+
+    if pool is None:
+        return 0
+
+    with pool._optional_thread_lock:
+        return sum(not connection.is_closed() for connection in pool._connections)
+
+
+def reap(client: httpx.Client, /) -> int:
+    """
+    Close pooled connections that are idle and no longer usable.
+
+    A connection is unusable once its keep-alive has expired, or once the server
+    has closed it. httpcore only discovers this when the connection is next needed,
+    so reaping ahead of time saves bursts of traffic from paying for it.
+
+    Returns the number of connections reaped.
+    """
+
+    reaped: int = 0
+
+    pool: httpcore.ConnectionPool
+    for pool in get_pools(client):
+        with pool._optional_thread_lock:
+            closing: Sequence[Any] = [
+                connection
+                for connection in pool._connections
+                if connection.is_closed()
+                or (connection.is_idle() and connection.has_expired())
+            ]
+
+            connection: Any
+            for connection in closing:
+                pool._connections.remove(connection)
+
+        pool._close_connections(list(closing))
+
+        reaped += len(closing)
+
+    return reaped
+
+
+def warmup(
+    client: httpx.Client, url: Optional[URLTypes] = None, /, *, connections: int = 1
+) -> int:
+    """
+    Open up to `connections` pooled connections to `url` (or the client's base URL).
+
+    Connections are opened by concurrent `HEAD` requests, so that DNS resolution
+    and the TCP and TLS handshakes are paid for ahead of the first real request.
+    Requests that fail are ignored. Note that HTTP/2 requests to an origin share
+    a single connection.
+
+    Returns the number of successful requests.
+    """
+
+    target: URL = URL(url) if url is not None else client.base_url
+
+    if not target.host:
+        raise ValueError("Cannot warm up connections without a URL to connect to")
+
+    def send(_: int, /) -> bool:
+        try:
+            client.head(target)
+        except httpx.HTTPError:
+            return False
+
+        return True
+
+    if connections <= 0:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        return sum(executor.map(send, range(connections)))
+
+
+class ConnectionMaintainer(threading.Thread):
+    """
+    Daemon thread that maintains the connection pool of a client.
+
+    Only a weak reference to the client is held, so the thread stops once the
+    client is closed or garbage collected (or when `stop` is called).
+    """
+
+    policy: KeepAlive
+
+    def __init__(self, client: httpx.Client, policy: KeepAlive, /) -> None:
+        super().__init__(name=f"{type(self).__name__}-{id(client):x}", daemon=True)
+
+        self.policy = policy
+
+        self._client: "weakref.ReferenceType[httpx.Client]" = weakref.ref(client)
+        self._stopped: threading.Event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.policy.interval):
+            client: Optional[httpx.Client] = self._client()
+
+            if client is None or client.is_closed:
+                return
+
+            self.maintain(client)
+
+            # Don't keep the client alive whilst waiting
+            del client
+
+    def maintain(self, client: httpx.Client, /) -> None:
+        reap(client)
+
+        if self.policy.min_connections > 0 and client.base_url.host:
+            missing: int = self.policy.min_connections - count_connections(client)
+
+            if missing > 0:
+                warmup(client, connections=missing)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def maintain(client: httpx.Client, policy: KeepAlive, /) -> ConnectionMaintainer:
+    """Start maintaining the connection pool of `client` according to `policy`"""
+
+    maintainer: ConnectionMaintainer = ConnectionMaintainer(client, policy)
+    maintainer.start()
+
+    return maintainer
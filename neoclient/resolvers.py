@@ -3,6 +3,8 @@ from typing import Any, Optional, Sequence, TypeVar
 
 from httpx import Cookies, Headers, QueryParams
 
+from .codecs import Codec, get_codec, is_json
+from .enums import HTTPHeader
 from .models import RequestOpts, Response, State
 from .typing import ResponseResolver, SupportsResolveRequest, SupportsResolveResponse
 
@@ -22,6 +24,8 @@ T = TypeVar("T")
 
 @dataclass
 class QueryResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[Sequence[str]]:
@@ -39,6 +43,8 @@ class QueryResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 @dataclass
 class HeaderResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[Sequence[str]]:
@@ -56,6 +62,8 @@ class HeaderResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 @dataclass
 class CookieResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[str]:
@@ -69,6 +77,8 @@ class CookieResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class QueryParamsResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> QueryParams:
         return request.params
@@ -79,6 +89,8 @@ class QueryParamsResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class HeadersResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> Headers:
         return request.headers
@@ -89,6 +101,8 @@ class HeadersResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class CookiesResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> Cookies:
         return request.cookies
@@ -99,13 +113,26 @@ class CookiesResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class BodyResolver(ResponseResolver[Any]):
+    __slots__ = ()
+
     @staticmethod
     def __call__(response: Response, /) -> Any:
+        codec: Optional[Codec] = get_codec(
+            response.headers.get(HTTPHeader.CONTENT_TYPE)
+        )
+
+        if not is_json(codec):
+            assert codec is not None
+
+            return codec.decode(response.content)
+
         return response.json()
 
 
 @dataclass
 class StateResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("key",)
+
     key: str
 
     def resolve_request(self, request: RequestOpts, /) -> Any:
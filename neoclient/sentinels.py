@@ -1,3 +1,3 @@
-from pydantic.fields import Required, Undefined
+from ._compat import Required, Undefined
 
 __all__ = ("Required", "Undefined")
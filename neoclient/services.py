@@ -1,8 +1,25 @@
+import copy
 import inspect
-from typing import Any, Callable, Dict, MutableSequence, Optional, Sequence, Tuple, Type
+import threading
+from dataclasses import dataclass, field
+from types import MethodType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from annotate.utils import has_annotation
-from mediate.protocols import MiddlewareCallable
+import httpx
+from annotate.utils import get_annotations
 
 from .client import Client
 from .enums import Entity
@@ -10,98 +27,353 @@ from .errors import ServiceInitialisationError
 from .middleware import Middleware
 from .models import Request, Response
 from .operation import Operation, get_operation, has_operation
+from .pool import maintain, warmup
 from .specification import ClientSpecification
 from .typing import Dependency
 
 __all__ = ("Service",)
 
+S = TypeVar("S", bound="Service")
+
+
+@dataclass(frozen=True)
+class ServiceMembers:
+    """The names of the members of a service class, by kind"""
+
+    middleware: Sequence[str] = ()
+    responses: Sequence[str] = ()
+    request_dependencies: Sequence[str] = ()
+    response_dependencies: Sequence[str] = ()
+    operations: Sequence[str] = ()
+    # The operations bound to the service's specification (but not yet to an
+    # instance or its client), by name
+    templates: Mapping[str, Operation] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+
+def get_service_members(cls: type, /) -> ServiceMembers:
+    spec: ClientSpecification = cls._spec  # type: ignore[attr-defined]
+
+    middleware: MutableSequence[str] = []
+    responses: MutableSequence[str] = []
+    request_dependencies: MutableSequence[str] = []
+    response_dependencies: MutableSequence[str] = []
+    operations: MutableSequence[str] = []
+    templates: Dict[str, Operation] = {}
+
+    member_name: str
+    member: Any
+    for member_name, member in inspect.getmembers(cls):
+        if has_operation(member):
+            operations.append(member_name)
+            templates[member_name] = get_operation(member)
+            continue
+
+        annotations: Mapping[Hashable, Any] = get_annotations(member)
+
+        if Entity.MIDDLEWARE in annotations:
+            middleware.append(member_name)
+        if Entity.RESPONSE in annotations:
+            responses.append(member_name)
+        if Entity.REQUEST_DEPENDENCY in annotations:
+            request_dependencies.append(member_name)
+        if Entity.RESPONSE_DEPENDENCY in annotations:
+            response_dependencies.append(member_name)
+
+    return ServiceMembers(
+        middleware=tuple(middleware),
+        responses=tuple(responses),
+        request_dependencies=tuple(request_dependencies),
+        response_dependencies=tuple(response_dependencies),
+        operations=tuple(operations),
+        templates={
+            member_name: _get_template(operation, spec, default_response=not responses)
+            for member_name, operation in templates.items()
+        },
+    )
+
+
+def _get_template(
+    operation: Operation, spec: ClientSpecification, /, *, default_response: bool
+) -> Operation:
+    """Bind `operation` to `spec`, as `Client.bind` would bind it to a client"""
+
+    middleware: Middleware = Middleware()
+    middleware.add_all(operation.middleware.record)
+    middleware.add_all(spec.middleware.record)
+
+    template: Operation = copy.copy(operation)
+
+    template.middleware = middleware
+    template.request_dependencies = [
+        *operation.request_dependencies,
+        *spec.request_dependencies,
+    ]
+    template.response_dependencies = [
+        *operation.response_dependencies,
+        *spec.response_dependencies,
+    ]
+
+    # A service-level response (bound per instance) takes precedence over the
+    # specification's default response
+    if template.response is None and default_response:
+        template.response = spec.default_response
+    if template.validate_response is None:
+        template.validate_response = spec.validate_response
+    if template.validate_arguments is None:
+        template.validate_arguments = spec.validate_arguments
+    if template.check_argument_types is None:
+        template.check_argument_types = spec.check_argument_types
+    if template.decoder is None:
+        template.decoder = spec.decoder
+
+    return template
+
 
 class ServiceMeta(type):
     _spec: ClientSpecification
+    _members: ServiceMembers
+    _shared_client: Optional[httpx.Client]
+    _shared_client_lock: threading.Lock
 
     def __new__(
         mcs: Type["ServiceMeta"], name: str, bases: Tuple[type], attrs: Dict[str, Any]
     ) -> type:
-        def __init__(self) -> None:
-            service_middleware: Sequence[MiddlewareCallable[Request, Response]] = [
-                member
-                for _, member in inspect.getmembers(self)
-                if has_annotation(member, Entity.MIDDLEWARE)
-            ]
-            service_responses: Sequence[Dependency] = [
-                member
-                for _, member in inspect.getmembers(self)
-                if has_annotation(member, Entity.RESPONSE)
-            ]
-            service_request_dependencies: Sequence[Dependency] = [
-                member
-                for _, member in inspect.getmembers(self)
-                if has_annotation(member, Entity.REQUEST_DEPENDENCY)
-            ]
-            service_response_dependencies: Sequence[Dependency] = [
-                member
-                for _, member in inspect.getmembers(self)
-                if has_annotation(member, Entity.RESPONSE_DEPENDENCY)
-            ]
+        def __init__(self, *, client: Union[httpx.Client, Client, None] = None) -> None:
+            # Members are discovered once, when the class is created, so each
+            # instance only has to bind them
+            members: ServiceMembers = self._members
 
-            if len(service_responses) > 1:
+            if len(members.responses) > 1:
                 raise ServiceInitialisationError(
-                    f"Found {len(service_responses)} service responses, expected at most 1"
+                    f"Found {len(members.responses)} service responses, expected at most 1"
                 )
 
+            # The middleware and dependencies bound per instance: those of its
+            # members, then those of an injected client (added after those of the
+            # service, as a client's are added after those of its operations)
+            injected: Optional[Client] = client if isinstance(client, Client) else None
+
+            instance_middleware: Sequence[Any] = [
+                *(getattr(self, member_name) for member_name in members.middleware),
+                *(injected.middleware.record if injected is not None else ()),
+            ]
+            instance_request_dependencies: Sequence[Dependency] = [
+                *(
+                    getattr(self, member_name)
+                    for member_name in members.request_dependencies
+                ),
+                *(injected.request_dependencies if injected is not None else ()),
+            ]
+            instance_response_dependencies: Sequence[Dependency] = [
+                *(
+                    getattr(self, member_name)
+                    for member_name in members.response_dependencies
+                ),
+                *(injected.response_dependencies if injected is not None else ()),
+            ]
+
             middleware: Middleware = Middleware()
 
             middleware.add_all(self._spec.middleware.record)
-            middleware.add_all(service_middleware)
+            middleware.add_all(instance_middleware)
 
             response: Optional[Dependency] = self._spec.default_response
 
             # If a service-level response was defined, use this instead of the one
             # defined within the specification
-            if service_responses:
-                response = service_responses[0]
+            if members.responses:
+                response = getattr(self, members.responses[0])
+            elif response is None and injected is not None:
+                response = injected.default_response
 
-            request_dependencies: MutableSequence[Dependency] = []
+            request_dependencies: MutableSequence[Dependency] = [
+                *self._spec.request_dependencies,
+                *instance_request_dependencies,
+            ]
+            response_dependencies: MutableSequence[Dependency] = [
+                *self._spec.response_dependencies,
+                *instance_response_dependencies,
+            ]
 
-            request_dependencies.extend(self._spec.request_dependencies)
-            request_dependencies.extend(service_request_dependencies)
+            httpx_client: httpx.Client
 
-            response_dependencies: MutableSequence[Dependency] = []
+            # Injected and shared clients are not owned by (so not closed by) the
+            # instance
+            if isinstance(client, Client):
+                if client.client is None:
+                    raise ServiceInitialisationError(
+                        f"Cannot inject {client!r}, as it has no client"
+                    )
 
-            response_dependencies.extend(self._spec.response_dependencies)
-            response_dependencies.extend(service_response_dependencies)
+                httpx_client = client.client
+            elif client is not None:
+                httpx_client = client
+            elif self._spec.shared:
+                httpx_client = type(self).get_shared_client()
+            else:
+                httpx_client = type(self).build_client()
+
+            self._owns_client = client is None and not self._spec.shared
+            self._shares_client = client is None and self._spec.shared
 
             self._client = Client(
-                client=self._spec.options.build(),
+                client=httpx_client,
                 middleware=middleware,
                 default_response=response,
                 request_dependencies=request_dependencies,
                 response_dependencies=response_dependencies,
+                validate_response=self._spec.validate_response,
+                validate_arguments=self._spec.validate_arguments,
+                check_argument_types=self._spec.check_argument_types,
+                decoder=(
+                    self._spec.decoder
+                    if self._spec.decoder is not None or injected is None
+                    else injected.decoder
+                ),
             )
 
-            for member_name, member in inspect.getmembers(self):
-                if not has_operation(member):
-                    continue
+            # Operations are bound to the specification once (when the class is
+            # created or decorated), so only have to be attached to the instance
+            # (and its client, middleware and dependencies)
+            member_name: str
+            template: Operation
+            for member_name, template in members.templates.items():
+                operation: Operation = copy.copy(template)
+
+                operation.client = httpx_client
 
-                bound_operation_func: Callable = self._client.bind(member)
-                bound_operation_method: Callable = bound_operation_func.__get__(self)
+                # The shared client is got for each call, as it's rebuilt if closed
+                # (e.g. by `close_shared_client`)
+                if self._shares_client:
+                    operation._client_getter = type(self).get_shared_client
 
-                bound_operation: Operation = get_operation(bound_operation_method)
+                # Memoized values aren't shared with other instances (whose
+                # middleware may add other credentials)
+                if template.cache is not None:
+                    operation.cache = template.cache.fork()
+                if operation.response is None:
+                    operation.response = response
+                if operation.decoder is None:
+                    operation.decoder = self._client.decoder
+                if instance_middleware:
+                    operation.middleware = Middleware()
+                    operation.middleware.add_all(
+                        [*template.middleware.record, *instance_middleware]
+                    )
+                if instance_request_dependencies:
+                    operation.request_dependencies = [
+                        *template.request_dependencies,
+                        *instance_request_dependencies,
+                    ]
+                if instance_response_dependencies:
+                    operation.response_dependencies = [
+                        *template.response_dependencies,
+                        *instance_response_dependencies,
+                    ]
 
-                bound_operation.func = bound_operation_method
+                operation_method: Callable = MethodType(operation.wrapper, self)
 
-                setattr(self, member_name, bound_operation_method)
+                operation.func = operation_method
+
+                setattr(self, member_name, operation_method)
 
         attrs["_spec"] = ClientSpecification()
+        attrs["_shared_client"] = None
+        attrs["_shared_client_lock"] = threading.Lock()
         attrs["__init__"] = __init__
 
         typ: type = super().__new__(mcs, name, bases, attrs)
 
+        typ._members = get_service_members(typ)  # type: ignore[attr-defined]
+
         return typ
 
+    def build_client(cls) -> httpx.Client:
+        """Build a client according to the service's specification"""
+
+        client: httpx.Client = cls._spec.options.build()
+
+        if cls._spec.keep_alive is not None:
+            maintain(client, cls._spec.keep_alive)
+        if cls._spec.warmup > 0:
+            warmup(client, connections=cls._spec.warmup)
+
+        return client
+
+    def get_shared_client(cls) -> httpx.Client:
+        """
+        Get the client shared by instances of the service, building it if it hasn't
+        been built yet (or has since been closed).
+        """
+
+        client: Optional[httpx.Client] = cls._shared_client
+
+        # Got for each call of the service's operations, so avoids the lock unless
+        # the client needs building
+        if client is not None and not client.is_closed:
+            return client
+
+        with cls._shared_client_lock:
+            if cls._shared_client is None or cls._shared_client.is_closed:
+                cls._shared_client = cls.build_client()
+
+            return cls._shared_client
+
+    def close_shared_client(cls) -> None:
+        """
+        Close the client shared by instances of the service, if there is one.
+
+        Existing instances carry on using a new shared client, built when next
+        needed.
+        """
+
+        with cls._shared_client_lock:
+            if cls._shared_client is not None:
+                cls._shared_client.close()
+                cls._shared_client = None
+
 
 class Service(metaclass=ServiceMeta):
+    """
+    Base class of services.
+
+    By default, each instance builds (and owns) its own client. Alternatively, a
+    client can be injected (e.g. `SomeService(client=NeoClient(...))`), in which
+    case requests are sent using its options (e.g. its base URL), its middleware
+    and dependencies are added after those of the service, and its default response
+    and decoder are used in the absence of the service's own. Validation is still
+    configured by the service. Or instances can share a single client by decorating
+    the service with `@service(shared=True)`.
+
+    Instances should be closed when no longer needed, either by calling `close` or
+    by using them as context managers. Only clients owned by an instance are
+    closed, so injected and shared clients remain open.
+    """
+
     _client: Client
+    _owns_client: bool
+    _shares_client: bool
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}()"
+
+    def __enter__(self: S, /) -> S:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def warmup(self, connections: int = 1, /) -> int:
+        # The shared client may have been rebuilt since the instance was created
+        if self._shares_client:
+            self._client.client = type(self).get_shared_client()
+
+        return self._client.warmup(connections)
+
+    def close(self) -> None:
+        """Close the instance's client, if it owns it"""
+
+        if self._owns_client:
+            self._client.close()
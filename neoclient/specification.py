@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 from typing import MutableSequence, Optional
 
+from .decoders import Decoder
 from .middleware import Middleware
 from .models import ClientOptions
+from .pool import KeepAlive
 from .typing import Dependency
 
 __all__ = ("ClientSpecification",)
@@ -15,3 +17,11 @@ class ClientSpecification:
     default_response: Optional[Dependency] = None
     request_dependencies: MutableSequence[Dependency] = field(default_factory=list)
     response_dependencies: MutableSequence[Dependency] = field(default_factory=list)
+    warmup: int = 0
+    keep_alive: Optional[KeepAlive] = None
+    # Whether all instances of a service share a single client (and so pool)
+    shared: bool = False
+    validate_response: bool = True
+    validate_arguments: bool = True
+    check_argument_types: bool = False
+    decoder: Optional[Decoder] = None
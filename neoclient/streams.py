@@ -0,0 +1,135 @@
+import io
+import mmap
+import os
+from typing import IO, Any, Iterator, Optional, Union
+
+from httpx import StreamConsumed, SyncByteStream
+
+__all__ = (
+    "DEFAULT_CHUNK_SIZE",
+    "FileStream",
+    "MemoryMappedFileStream",
+    "is_seekable",
+)
+
+DEFAULT_CHUNK_SIZE: int = 65_536
+
+FileTypes = Union[IO[bytes], mmap.mmap]
+
+
+def is_seekable(file: Any, /) -> bool:
+    if isinstance(file, mmap.mmap):
+        return True
+
+    seekable: Optional[Any] = getattr(file, "seekable", None)
+
+    if seekable is None:
+        return False
+
+    try:
+        return bool(seekable())
+    except (OSError, ValueError):
+        return False
+
+
+class FileStream(SyncByteStream):
+    """
+    Stream a file-like object (or `mmap`) in chunks.
+
+    If the file is seekable its length is known up-front, and the stream
+    rewinds each time it is iterated so that the request can be re-sent.
+    """
+
+    file: FileTypes
+    chunk_size: int
+    start: Optional[int]
+    length: Optional[int]
+    _consumed: bool
+
+    def __init__(
+        self, file: FileTypes, /, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.start = None
+        self.length = None
+        self._consumed = False
+
+        if is_seekable(file):
+            self.start = file.tell()
+
+            file.seek(0, os.SEEK_END)
+
+            self.length = file.tell() - self.start
+
+            file.seek(self.start)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(file={self.file!r}, length={self.length!r})>"
+
+    @property
+    def seekable(self) -> bool:
+        return self.start is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.start is not None:
+            self.file.seek(self.start)
+        elif self._consumed:
+            raise StreamConsumed()
+
+        self._consumed = True
+
+        chunk: bytes = self.file.read(self.chunk_size)
+
+        while chunk:
+            yield chunk
+
+            chunk = self.file.read(self.chunk_size)
+
+        # Leave the file where it was found, so that it can be sent again
+        if self.start is not None:
+            self.file.seek(self.start)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> "FileStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class MemoryMappedFileStream(FileStream):
+    """Stream the file at `path` through a read-only memory map."""
+
+    path: Union[str, "os.PathLike[str]"]
+    _fileobj: IO[bytes]
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        /,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.path = path
+        self._fileobj = open(path, "rb")  # pylint: disable=consider-using-with
+
+        file: FileTypes
+
+        # Empty files cannot be memory mapped
+        if os.fstat(self._fileobj.fileno()).st_size == 0:
+            file = io.BytesIO()
+        else:
+            file = mmap.mmap(self._fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+
+        super().__init__(file, chunk_size=chunk_size)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(path={self.path!r}, length={self.length!r})>"
+
+    def close(self) -> None:
+        super().close()
+
+        self._fileobj.close()
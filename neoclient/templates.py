@@ -0,0 +1,275 @@
+import functools
+import re
+import string
+import urllib.parse
+from dataclasses import dataclass
+from typing import (
+    Any,
+    FrozenSet,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from httpx import URL
+from httpx._urlparse import ParseResult
+
+__all__ = (
+    "Placeholder",
+    "URLTemplate",
+    "get_url_template",
+)
+
+CompiledComponents = Mapping[str, Sequence[Union[str, "Placeholder"]]]
+
+# Placeholders are replaced with markers whilst compiling a template. Markers only
+# use unreserved characters, so that they are not percent-encoded when parsed.
+MARKER_PREFIX: str = "neoclient-placeholder-"
+MARKER: str = MARKER_PREFIX + "{0}-"
+MARKER_PATTERN: Pattern[str] = re.compile(f"({re.escape(MARKER_PREFIX)}\\d+-)")
+
+# Characters left as-is when substituting into each component of a URL (besides
+# unreserved characters). Slashes are kept in paths, so that values can span
+# multiple segments (e.g. path params of multiple values).
+SAFE_CHARACTERS: Mapping[str, Optional[str]] = {
+    # Values are substituted into the authority (e.g. the host) as-is
+    "authority": None,
+    "path": "/!$&'()*+,;=:@",
+    "query": "/?:@!$'()*,;",
+    "fragment": "/?:@!$&'()*+,;=",
+}
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """Placeholder for the value of `name` in a component of a URL (e.g. `path`)"""
+
+    name: str
+    component: str
+    conversion: Optional[str] = None
+    format_spec: str = ""
+
+    def substitute(self, value: Any, /) -> str:
+        if self.conversion == "r":
+            value = repr(value)
+        elif self.conversion == "s":
+            value = str(value)
+        elif self.conversion == "a":
+            value = ascii(value)
+
+        formatted: str = format(value, self.format_spec)
+
+        safe: Optional[str] = SAFE_CHARACTERS[self.component]
+
+        if safe is None:
+            return formatted
+
+        return urllib.parse.quote(formatted, safe=safe)
+
+
+class URLTemplate:
+    """
+    Compiled URL template, such as `/users/{id}`.
+
+    Templates are parsed once, into their static parts and placeholders, so that
+    expanding them only substitutes the (percent-encoded) values.
+    """
+
+    template: str
+    parts: Sequence[Union[str, Placeholder]]
+    placeholders: FrozenSet[str]
+
+    def __init__(self, template: str, /) -> None:
+        self.template = template
+        self.parts = _parse(template)
+        self.placeholders = frozenset(
+            part.name for part in self.parts if isinstance(part, Placeholder)
+        )
+
+        # Static templates always expand to the same URL
+        self._url: Optional[URL] = URL(template) if not self.placeholders else None
+        self._compiled: Optional[Tuple[ParseResult, CompiledComponents]] = (
+            _compile(self.parts) if self.placeholders else None
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.template!r})"
+
+    def expand(self, values: Mapping[str, Any], /) -> URL:
+        """Expand the template using `values`, raising `KeyError` if one is missing"""
+
+        if self._url is not None:
+            return self._url
+
+        substitutions: Mapping[Placeholder, str] = {
+            part: part.substitute(values[part.name])
+            for part in self.parts
+            if isinstance(part, Placeholder)
+        }
+
+        if self._compiled is not None and not any(
+            _is_dot_segment(substitution) for substitution in substitutions.values()
+        ):
+            base: ParseResult
+            components: CompiledComponents
+            base, components = self._compiled
+
+            # The (already valid) components are substituted into, rather than
+            # parsing the expanded URL
+            url: URL = URL.__new__(URL)
+            url._uri_reference = base._replace(
+                **{
+                    component: "".join(
+                        part if isinstance(part, str) else substitutions[part]
+                        for part in parts
+                    )
+                    for component, parts in components.items()
+                }
+            )
+
+            return url
+
+        return URL(
+            "".join(
+                part if isinstance(part, str) else substitutions[part]
+                for part in self.parts
+            )
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def get_url_template(template: str, /) -> URLTemplate:
+    """Get the compiled template of `template`, compiling it on first use"""
+
+    return URLTemplate(template)
+
+
+def _parse(template: str, /) -> Sequence[Union[str, Placeholder]]:
+    # Braces may have been percent-encoded by `httpx.URL`
+    template = (
+        template.replace("%7B", "{")
+        .replace("%7b", "{")
+        .replace("%7D", "}")
+        .replace("%7d", "}")
+    )
+
+    parts: MutableSequence[Union[str, Placeholder]] = []
+    # The template up to the current position, with values omitted
+    prefix: str = ""
+
+    literal_text: str
+    field_name: Optional[str]
+    format_spec: Optional[str]
+    conversion: Optional[str]
+    for literal_text, field_name, format_spec, conversion in string.Formatter().parse(
+        template
+    ):
+        if literal_text:
+            parts.append(literal_text)
+            prefix += literal_text
+
+        if field_name is None:
+            continue
+
+        if not field_name.isidentifier():
+            raise ValueError(f"Field name {field_name!r} is not a valid identifier")
+
+        parts.append(
+            Placeholder(
+                name=field_name,
+                component=_get_component(prefix),
+                conversion=conversion,
+                format_spec=format_spec or "",
+            )
+        )
+
+    return parts
+
+
+def _get_component(prefix: str, /) -> str:
+    """Get the component of a URL that follows `prefix`"""
+
+    if "#" in prefix:
+        return "fragment"
+    if "?" in prefix:
+        return "query"
+
+    _, separator, authority = prefix.partition("://")
+
+    if separator and "/" not in authority:
+        return "authority"
+
+    return "path"
+
+
+def _compile(
+    parts: Sequence[Union[str, Placeholder]], /
+) -> Optional[Tuple[ParseResult, CompiledComponents]]:
+    """
+    Parse the URL of the template, and split each of its components into its
+    static parts and placeholders.
+
+    Returns `None` if the template can't be compiled (e.g. if it has placeholders
+    in its authority), in which case expanded templates are parsed instead.
+    """
+
+    if any(
+        isinstance(part, Placeholder) and part.component == "authority"
+        for part in parts
+    ):
+        return None
+
+    markers: Mapping[str, Placeholder] = {
+        MARKER.format(index): part
+        for index, part in enumerate(parts)
+        if isinstance(part, Placeholder)
+    }
+
+    base: ParseResult = URL(
+        "".join(
+            part if isinstance(part, str) else MARKER.format(index)
+            for index, part in enumerate(parts)
+        )
+    )._uri_reference
+
+    components: MutableMapping[str, Sequence[Union[str, Placeholder]]] = {}
+    found: int = 0
+
+    component: str
+    for component in ("path", "query", "fragment"):
+        value: Optional[str] = getattr(base, component)
+
+        if value is None or MARKER_PREFIX not in value:
+            continue
+
+        component_parts: MutableSequence[Union[str, Placeholder]] = []
+
+        index: int
+        text: str
+        for index, text in enumerate(MARKER_PATTERN.split(value)):
+            # Odd indices are the markers captured by the pattern
+            if index % 2:
+                component_parts.append(markers[text])
+                found += 1
+            elif text:
+                component_parts.append(text)
+
+        components[component] = component_parts
+
+    # Markers may have been normalised away (e.g. by a dot segment)
+    if found != len(markers):
+        return None
+
+    return base, components
+
+
+def _is_dot_segment(substitution: str, /) -> bool:
+    # Dot segments are only normalised (removed) when a URL is parsed
+    return "." in substitution and any(
+        segment in (".", "..") for segment in substitution.split("/")
+    )
@@ -0,0 +1,246 @@
+import threading
+import weakref
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator, Mapping, MutableMapping, Optional, Sequence
+
+import httpx
+from httpx import BaseTransport, HTTPTransport, Limits
+
+from .defaults import DEFAULT_HTTP1, DEFAULT_HTTP2, DEFAULT_LIMITS
+from .types import CertTypes, VerifyTypes
+
+__all__ = (
+    "HostOptions",
+    "ConnectionStats",
+    "InstrumentedTransport",
+    "build_transport",
+    "build_host_mounts",
+    "instrument",
+    "get_connection_stats",
+)
+
+
+@dataclass
+class HostOptions:
+    http1: bool = DEFAULT_HTTP1
+    http2: bool = DEFAULT_HTTP2
+    limits: Limits = field(default_factory=lambda: DEFAULT_LIMITS)
+    max_concurrent_streams: Optional[int] = None
+
+
+@dataclass
+class ConnectionStats:
+    http_version: str
+    streams: int = 0
+    active_streams: int = 0
+    max_active_streams: int = 0
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Any) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class InstrumentedTransport(BaseTransport):
+    """
+    Wrap `transport`, recording the number of streams sent over each connection.
+
+    If `max_concurrent_streams` is set, at most that many requests are in flight
+    at once. As HTTP/2 requests to an origin are multiplexed over a single pooled
+    connection, this caps the number of concurrent streams on that connection.
+    """
+
+    transport: BaseTransport
+    max_concurrent_streams: Optional[int]
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        /,
+        *,
+        max_concurrent_streams: Optional[int] = None,
+    ) -> None:
+        self.transport = transport
+        self.max_concurrent_streams = max_concurrent_streams
+
+        self._lock: threading.Lock = threading.Lock()
+        self._semaphore: Optional[threading.BoundedSemaphore] = (
+            threading.BoundedSemaphore(max_concurrent_streams)
+            if max_concurrent_streams is not None
+            else None
+        )
+        self._connections: MutableMapping[Any, ConnectionStats] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__}(transport={self.transport!r},"
+            f" max_concurrent_streams={self.max_concurrent_streams!r})>"
+        )
+
+    @property
+    def connections(self) -> Sequence[ConnectionStats]:
+        with self._lock:
+            return [replace(stats) for stats in self._connections.values()]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+
+        try:
+            response: httpx.Response = self.transport.handle_request(request)
+        except BaseException:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+            raise
+
+        stats: Optional[ConnectionStats] = self._open_stream(response)
+
+        def release() -> None:
+            if stats is not None:
+                with self._lock:
+                    stats.active_streams -= 1
+
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+        # Responses whose content was loaded up-front have nothing left to stream
+        if response.is_closed:
+            release()
+
+            return response
+
+        assert isinstance(response.stream, httpx.SyncByteStream)
+
+        response.stream = _ReleasingStream(response.stream, release)
+
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def _open_stream(self, response: httpx.Response, /) -> Optional[ConnectionStats]:
+        network_stream: Any = response.extensions.get("network_stream")
+
+        if network_stream is None:
+            return None
+
+        with self._lock:
+            stats: Optional[ConnectionStats]
+
+            try:
+                stats = self._connections.get(network_stream)
+            except TypeError:
+                # The network stream does not support weak references
+                return None
+
+            if stats is None:
+                http_version: bytes = response.extensions.get(
+                    "http_version", b"HTTP/1.1"
+                )
+
+                stats = ConnectionStats(http_version=http_version.decode("ascii"))
+
+                self._connections[network_stream] = stats
+
+            stats.streams += 1
+            stats.active_streams += 1
+            stats.max_active_streams = max(
+                stats.max_active_streams, stats.active_streams
+            )
+
+            return stats
+
+
+def build_transport(
+    *,
+    verify: VerifyTypes = True,
+    cert: Optional[CertTypes] = None,
+    http1: bool = DEFAULT_HTTP1,
+    http2: bool = DEFAULT_HTTP2,
+    limits: Limits = DEFAULT_LIMITS,
+    trust_env: bool = True,
+    max_concurrent_streams: Optional[int] = None,
+) -> InstrumentedTransport:
+    return InstrumentedTransport(
+        HTTPTransport(
+            verify=verify,
+            cert=cert,
+            http1=http1,
+            http2=http2,
+            limits=limits,
+            trust_env=trust_env,
+        ),
+        max_concurrent_streams=max_concurrent_streams,
+    )
+
+
+def build_host_mounts(
+    hosts: Mapping[str, HostOptions],
+    /,
+    *,
+    verify: VerifyTypes = True,
+    cert: Optional[CertTypes] = None,
+    trust_env: bool = True,
+) -> Mapping[str, BaseTransport]:
+    return {
+        pattern: build_transport(
+            verify=verify,
+            cert=cert,
+            http1=host.http1,
+            http2=host.http2,
+            limits=host.limits,
+            trust_env=trust_env,
+            max_concurrent_streams=host.max_concurrent_streams,
+        )
+        for pattern, host in hosts.items()
+    }
+
+
+def instrument(
+    client: httpx.Client, /, *, max_concurrent_streams: Optional[int] = None
+) -> None:
+    """Instrument the default transport of `client`"""
+
+    client._transport = InstrumentedTransport(
+        client._transport, max_concurrent_streams=max_concurrent_streams
+    )
+
+
+def get_connection_stats(
+    client: httpx.Client, /
+) -> Mapping[str, Sequence[ConnectionStats]]:
+    """
+    Collect the connection stats of each instrumented transport used by `client`.
+
+    The stats of the client's default transport are keyed under `"all://"`.
+    """
+
+    transports: MutableMapping[str, BaseTransport] = {"all://": client._transport}
+
+    pattern: Any
+    transport: Optional[BaseTransport]
+    for pattern, transport in client._mounts.items():
+        if transport is not None:
+            transports[pattern.pattern] = transport
+
+    return {
+        pattern: transport.connections
+        for pattern, transport in transports.items()
+        if isinstance(transport, InstrumentedTransport)
+    }
@@ -55,15 +55,17 @@ class Consumer(Protocol[T_contra]):
 
 
 class Function(Protocol[T_contra, R_co]):
+    __slots__ = ()
+
     def __call__(self, t: T_contra, /) -> R_co: ...
 
 
 class ResponseResolver(Function[Response, T_co], Protocol[T_co]):
-    pass
+    __slots__ = ()
 
 
 class RequestResolver(Function[RequestOpts, T_co], Protocol[T_co]):
-    pass
+    __slots__ = ()
 
 
 class RequestConsumer(Consumer[RequestOpts], Protocol):
@@ -80,23 +82,31 @@ class Composer(Protocol):
 
 @runtime_checkable
 class SupportsConsumeRequest(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def consume_request(self, request: RequestOpts, /) -> None: ...
 
 
 @runtime_checkable
 class SupportsConsumeClient(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def consume_client(self, client: ClientOptions, /) -> None: ...
 
 
 @runtime_checkable
 class SupportsResolveRequest(Protocol[T_co]):
+    __slots__ = ()
+
     @abstractmethod
     def resolve_request(self, request: RequestOpts, /) -> T_co: ...
 
 
 @runtime_checkable
 class SupportsResolveResponse(Protocol[T_co]):
+    __slots__ = ()
+
     @abstractmethod
     def resolve_response(self, response: Response, /) -> T_co: ...
@@ -12,12 +12,15 @@ from typing import (
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from httpx import Headers, QueryParams
-from pydantic import BaseConfig, BaseModel, create_model
-from pydantic.fields import FieldInfo, Undefined
-from pydantic.typing import display_as_type
+from typing_extensions import Annotated, Literal, get_args, get_origin
+
+from ._compat import FieldInfo, Undefined
+from .adapters import get_type_adapter
+from .builders import QueryParamsBuilder
 
 __all__ = (
     "parse_format_string",
@@ -28,6 +31,7 @@ __all__ = (
     "has_default",
     "parse_obj_as",
     "is_generic_alias",
+    "is_instance",
 )
 
 T = TypeVar("T")
@@ -117,20 +121,7 @@ def has_default(field_info: FieldInfo, /) -> bool:
 
 
 def parse_obj_as(type_: Type[T], obj: Any) -> T:
-    parsing_type_name: str = f"ParsingModel[{display_as_type(type_)}]"
-
-    class Config(BaseConfig):
-        arbitrary_types_allowed: bool = True
-
-    model_cls: Type[BaseModel] = create_model(
-        parsing_type_name,
-        __config__=Config,
-        __root__=(type_, ...),
-    )
-
-    model: BaseModel = model_cls(__root__=obj)
-
-    return getattr(model, "__root__")
+    return get_type_adapter(type_, arbitrary_types_allowed=True).validate_python(obj)
 
 
 def is_generic_alias(type_: Type, /) -> bool:
@@ -172,26 +163,53 @@ def merge_query_params(
 
 
 def add_header(headers: Headers, /, key: str, value: str) -> None:
-    new_headers: Headers = Headers(((key, value),))
+    """Add the header `key: value` to `headers`, keeping duplicates."""
+    # Normalised as `Headers` would (without the cost of constructing one)
+    raw_key: bytes = key.encode("ascii")
 
-    headers._list.extend(new_headers._list)
+    headers._list.append((raw_key, raw_key.lower(), value.encode("ascii")))
 
 
 def add_headers(lhs: Headers, rhs: Headers, /) -> None:
     """Add all headers from `rhs` to `lhs`, keeping duplicates."""
-    key: str
-    value: str
-    for key, value in rhs.multi_items():
-        add_header(lhs, key, value)
+    # The headers of `rhs` are already normalised, so are added in bulk
+    lhs._list.extend(rhs._list)
 
 
 def add_params(lhs: QueryParams, rhs: QueryParams, /) -> QueryParams:
     """Return a new QueryParams instance, appending the params from `lhs` and `rhs`"""
-    params: QueryParams = lhs
+    return QueryParamsBuilder(lhs).extend(rhs).build()
 
-    key: str
-    value: str
-    for key, value in rhs.multi_items():
-        params = params.add(key, value)
 
-    return params
+def is_instance(obj: Any, annotation: Any, /) -> bool:
+    """
+    Cheaply check whether `obj` is an instance of the type `annotation`.
+
+    Only the outermost type is checked (e.g. `List[int]` checks for a `list`), and
+    annotations that can't be checked are assumed to match.
+
+    Example:
+        >>> is_instance(123, Optional[int])
+        True
+    """
+
+    if annotation in (Any, inspect.Parameter.empty):
+        return True
+
+    origin: Any = get_origin(annotation)
+
+    if origin is Annotated:
+        return is_instance(obj, get_args(annotation)[0])
+    if origin is Union:
+        return any(is_instance(obj, arg) for arg in get_args(annotation))
+    if origin is Literal:
+        return obj in get_args(annotation)
+    if isinstance(origin, type):
+        return isinstance(obj, origin)
+    if isinstance(annotation, type):
+        try:
+            return isinstance(obj, annotation)
+        except TypeError:
+            return True
+
+    return True
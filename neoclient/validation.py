@@ -17,13 +17,17 @@ from typing import (
     overload,
 )
 
-from pydantic.config import Extra
-from pydantic.fields import Undefined
-from pydantic.main import BaseModel, create_model
-from pydantic.typing import get_all_type_hints
-from pydantic.utils import to_camel
 from typing_extensions import ParamSpec
 
+from ._compat import (
+    BaseModel,
+    Extra,
+    Undefined,
+    create_model,
+    get_all_type_hints,
+    to_camel,
+)
+
 __all__ = (
     "create_func_model",
     "validate",
@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from neoclient.adapters import TypeAdapter, get_constructor, get_type_adapter
+
+
+class Model(BaseModel):
+    id: int
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Node(BaseModel):
+    id: int
+    children: List["Node"] = []
+    parent: Optional[Model] = None
+
+
+Node.update_forward_refs()
+
+
+@dataclass
+class Pair:
+    left: Point
+    right: Optional[Point] = None
+
+
+class Unhashable:
+    __hash__ = None  # type: ignore
+
+
+def test_TypeAdapter_validate_python() -> None:
+    adapter: TypeAdapter[List[Model]] = TypeAdapter(List[Model])
+
+    assert adapter.validate_python([{"id": "1"}]) == [Model(id=1)]
+
+    with pytest.raises(ValidationError):
+        adapter.validate_python([{"id": "foo"}])
+
+
+def test_TypeAdapter_validate_json() -> None:
+    adapter: TypeAdapter[Point] = TypeAdapter(Point)
+
+    assert adapter.validate_json("[1, 2]") == Point(x=1, y=2)
+
+
+def test_TypeAdapter_arbitrary_types_allowed() -> None:
+    obj: Unhashable = Unhashable()
+
+    assert (
+        TypeAdapter(Unhashable, arbitrary_types_allowed=True).validate_python(obj)
+        is obj
+    )
+
+
+def test_get_type_adapter() -> None:
+    assert get_type_adapter(List[int]) is get_type_adapter(List[int])
+    assert get_type_adapter(List[int]) is not get_type_adapter(
+        List[int], arbitrary_types_allowed=True
+    )
+
+
+def test_get_type_adapter_unhashable() -> None:
+    annotation: Any = Annotated[int, {"foo": "bar"}]
+
+    with pytest.raises(TypeError):
+        hash(annotation)
+
+    assert get_type_adapter(annotation).validate_python("1") == 1
+
+
+def test_get_constructor_model() -> None:
+    node: Node = get_constructor(Node)(
+        {"id": "1", "children": [{"id": 2}], "parent": {"id": 3}, "extra": 4}
+    )
+
+    assert isinstance(node.children[0], Node)
+    assert isinstance(node.parent, Model)
+    # Values are not validated
+    assert node.id == "1"
+    assert node == Node.construct(
+        id="1", children=[Node.construct(id=2)], parent=Model.construct(id=3)
+    )
+
+
+def test_get_constructor_classes() -> None:
+    assert get_constructor(Pair)({"left": [1, 2], "right": None}) == Pair(
+        left=Point(1, 2)
+    )
+    assert get_constructor(Point)({"x": 1, "y": 2}) == Point(1, 2)
+
+
+def test_get_constructor_containers() -> None:
+    assert get_constructor(Dict[str, List[Point]])({"a": [[1, 2]]}) == {
+        "a": [Point(1, 2)]
+    }
+    assert get_constructor(Tuple[Point, int])([[1, 2], 3]) == (Point(1, 2), 3)
+    assert get_constructor(Tuple[int, ...])([1, 2]) == (1, 2)
+    assert get_constructor(Optional[Point])(None) is None
+    assert get_constructor(Any)({"a": 1}) == {"a": 1}
+
+
+def test_TypeAdapter_construct_json() -> None:
+    assert TypeAdapter(List[Model]).construct_json('[{"id": "1"}]') == [
+        Model.construct(id="1")
+    ]
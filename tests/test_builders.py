@@ -0,0 +1,52 @@
+import pytest
+from httpx import QueryParams
+
+from neoclient.builders import QueryParamsBuilder, building
+from neoclient.models import RequestOpts
+
+
+def test_QueryParamsBuilder() -> None:
+    builder: QueryParamsBuilder = QueryParamsBuilder({"a": "1"})
+
+    assert builder.add("a", "2") is builder
+    assert builder.set("b", 3) is builder
+    assert builder.merge({"c": "4"}) is builder
+    assert builder.extend(QueryParams({"c": "5"})) is builder
+    assert builder.remove("b") is builder
+
+    assert builder == QueryParams("a=1&a=2&c=4&c=5")
+    assert QueryParams("a=1&a=2&c=4&c=5") == builder
+    assert type(builder.build()) is QueryParams
+    assert builder.build() == QueryParams("a=1&a=2&c=4&c=5")
+
+
+def test_QueryParamsBuilder_unhashable() -> None:
+    with pytest.raises(TypeError):
+        hash(QueryParamsBuilder({"a": "1"}))
+
+
+def test_QueryParamsBuilder_does_not_mutate_original() -> None:
+    params: QueryParams = QueryParams({"a": "1"})
+
+    QueryParamsBuilder(params).add("a", "2")
+
+    assert params == QueryParams({"a": "1"})
+
+
+def test_building() -> None:
+    request: RequestOpts = RequestOpts("GET", "/", params={"a": "1"})
+
+    with building(request):
+        builder: QueryParams = request.params
+
+        assert isinstance(builder, QueryParamsBuilder)
+
+        request.params = request.params.add("a", "2")
+
+        with building(request):
+            assert request.params is builder
+
+        assert request.params is builder
+
+    assert type(request.params) is QueryParams
+    assert request.params == QueryParams("a=1&a=2")
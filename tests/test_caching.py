@@ -0,0 +1,236 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from neoclient.caching import (
+    CacheEntry,
+    DiskStorage,
+    MemoryStorage,
+    Storage,
+    get_cache_key,
+    parse_cache_control,
+    parse_vary,
+)
+from neoclient.models import Request
+
+
+def build_entry(content: bytes = b"foo", **kwargs) -> CacheEntry:
+    return CacheEntry(
+        status_code=200,
+        headers=[("Content-Type", "application/json")],
+        content=content,
+        **kwargs,
+    )
+
+
+def test_get_cache_key() -> None:
+    assert get_cache_key(Request("GET", "https://foo.com/")) == get_cache_key(
+        Request("GET", "https://foo.com/")
+    )
+    assert get_cache_key(Request("GET", "https://foo.com/")) != get_cache_key(
+        Request("HEAD", "https://foo.com/")
+    )
+    assert get_cache_key(Request("POST", "https://foo.com/", content=iter(()))) is None
+
+
+def test_get_cache_key_headers() -> None:
+    alice: Request = Request(
+        "GET", "https://foo.com/", headers={"Authorization": "alice", "Accept": "a"}
+    )
+    bob: Request = Request(
+        "GET", "https://foo.com/", headers={"Authorization": "bob", "Accept": "a"}
+    )
+    alice_b: Request = Request(
+        "GET", "https://foo.com/", headers={"Authorization": "alice", "Accept": "b"}
+    )
+
+    assert get_cache_key(alice) != get_cache_key(bob)
+    assert get_cache_key(alice) != get_cache_key(
+        Request("GET", "https://foo.com/", headers={"Cookie": "alice"})
+    )
+    assert get_cache_key(alice) == get_cache_key(alice_b)
+    assert get_cache_key(alice, vary=["accept"]) != get_cache_key(
+        alice_b, vary=["accept"]
+    )
+
+
+def test_parse_vary() -> None:
+    assert parse_vary(None) == ()
+    assert parse_vary("Accept-Encoding, accept,") == ["accept", "accept-encoding"]
+
+
+def test_parse_cache_control() -> None:
+    assert parse_cache_control(None) == {}
+    assert parse_cache_control('No-Store, max-age=60, foo="bar"') == {
+        "no-store": None,
+        "max-age": "60",
+        "foo": "bar",
+    }
+
+
+def test_Storage_abstract() -> None:
+    with pytest.raises(TypeError):
+        Storage()  # type: ignore[abstract]
+
+
+def test_MemoryStorage() -> None:
+    storage: MemoryStorage = MemoryStorage(maxsize=1)
+
+    storage.set("a", build_entry(b"a"))
+
+    entry: CacheEntry = build_entry(b"b")
+
+    storage.set("b", entry)
+
+    assert storage.get("a") is None
+    assert storage.get("b") is entry
+
+    storage.set("c", build_entry(expires_at=time.time() - 1))
+
+    assert storage.get("c") is None
+
+    storage.delete("c")
+    storage.clear()
+
+    assert len(storage) == 0
+
+
+def test_DiskStorage(tmp_path: Path) -> None:
+    storage: DiskStorage = DiskStorage(str(tmp_path))
+
+    entry: CacheEntry = build_entry(b"foo", fresh_until=1.0)
+
+    storage.set("a", entry)
+
+    assert storage.get("a") == entry
+    assert storage.get("b") is None
+
+    storage.delete("a")
+
+    assert storage.get("a") is None
+
+    storage.set("b", build_entry(expires_at=time.time() - 1))
+
+    assert storage.get("b") is None
+
+    storage.close()
+
+
+def test_DiskStorage_persistence(tmp_path: Path) -> None:
+    storage: DiskStorage = DiskStorage(str(tmp_path))
+
+    storage.set("a", build_entry(b"a"))
+    storage.set("b", build_entry(b"b"))
+    storage.delete("a")
+    storage.close()
+
+    # Re-opened from the saved index
+    storage = DiskStorage(str(tmp_path))
+
+    assert storage.get("a") is None
+    assert storage.get("b") is not None
+
+    storage.set("c", build_entry(b"c"))
+    storage._close()
+
+    # Re-opened from the saved index, and the records appended since
+    storage = DiskStorage(str(tmp_path))
+
+    assert storage.get("b") is not None
+    assert storage.get("c") is not None
+
+    storage.close()
+
+
+def test_DiskStorage_shared(tmp_path: Path) -> None:
+    writer: DiskStorage = DiskStorage(str(tmp_path))
+    reader: DiskStorage = DiskStorage(str(tmp_path))
+
+    writer.set("a", build_entry(b"a"))
+
+    entry = reader.get("a")
+
+    assert entry is not None and entry.content == b"a"
+
+    writer.clear()
+
+    assert reader.get("a") is None
+
+    writer.close()
+    reader.close()
+
+
+def test_DiskStorage_torn_record(tmp_path: Path) -> None:
+    storage: DiskStorage = DiskStorage(str(tmp_path))
+
+    storage.set("a", build_entry(b"a"))
+    storage._close()
+
+    # Simulate a crash part-way through writing a record
+    with open(tmp_path / "cache.log", "ab") as file:
+        file.write(b"NCC1\0\0\0")
+
+    storage = DiskStorage(str(tmp_path))
+
+    assert storage.get("a") is not None
+
+    storage.set("b", build_entry(b"b"))
+
+    assert storage.get("b") is not None
+
+    storage.close()
+
+    assert DiskStorage(str(tmp_path)).get("b") is not None
+
+
+def test_DiskStorage_eviction(tmp_path: Path) -> None:
+    storage: DiskStorage = DiskStorage(str(tmp_path), max_size=4096)
+
+    key: int
+    for key in range(10):
+        storage.set(str(key), build_entry(bytes(1000)))
+
+    assert os.path.getsize(tmp_path / "cache.log") <= 4096
+    assert storage.get("0") is None
+    assert storage.get("9") is not None
+
+    storage.close()
+
+
+def test_DiskStorage_concurrent_processes(tmp_path: Path) -> None:
+    script: str = (
+        "import sys\n"
+        "from neoclient.caching import CacheEntry, DiskStorage\n"
+        "storage = DiskStorage(sys.argv[1])\n"
+        "for index in range(50):\n"
+        "    storage.set(f'{sys.argv[2]}-{index}', CacheEntry(200, [], b'x' * 100))\n"
+        "storage.close()\n"
+    )
+
+    processes: List[subprocess.Popen] = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, str(tmp_path), str(worker)],
+            cwd=Path(__file__).parent.parent,
+        )
+        for worker in range(4)
+    ]
+
+    process: subprocess.Popen
+    for process in processes:
+        assert process.wait(timeout=60) == 0
+
+    storage: DiskStorage = DiskStorage(str(tmp_path))
+
+    assert len(storage) == 200
+    assert all(
+        storage.get(f"{worker}-{index}") is not None
+        for worker in range(4)
+        for index in range(50)
+    )
+
+    storage.close()
@@ -1,11 +1,19 @@
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
+import httpx
 import pytest
 from httpx import Headers
-from pydantic import BaseModel, Required
-
-from neoclient import Body, NeoClient, Query, QueryParams
-from neoclient.decorators import request
+from pydantic import BaseModel
+
+from neoclient import Body, Depends, NeoClient, Query, QueryParams, Required
+from neoclient.decorators import (
+    request,
+    response,
+    response_depends,
+    validate_arguments,
+    validate_response,
+)
+from neoclient.errors import CompositionError
 from neoclient.models import Request, RequestOpts, Response
 from neoclient.operation import Operation, get_operation
 from neoclient.typing import CallNext
@@ -217,3 +225,93 @@ def test_client_response_dependencies(client: NeoClient) -> None:
     def foo(): ...
 
     assert get_operation(foo).response_dependencies == [response_dependency]
+
+
+def test_client_shared_response_dependencies() -> None:
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"id": 1, "name": "sam"})
+        ),
+    )
+
+    calls: List[Response] = []
+
+    def parse_body(response: Response, /) -> dict:
+        calls.append(response)
+
+        return response.json()
+
+    def check_body(body: dict = Depends(parse_body)) -> None:
+        assert body["id"] == 1
+
+    def get_name(body: dict = Depends(parse_body)) -> str:
+        return body["name"]
+
+    @response(get_name)
+    @response_depends(check_body)
+    @client.get("/users/1")
+    def get_user() -> str: ...
+
+    assert get_user() == "sam"
+    assert get_user() == "sam"
+    # The shared dependency is resolved once per call
+    assert len(calls) == 2
+
+
+def test_client_validate_response() -> None:
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=[{"id": "1", "name": "sam"}])
+        ),
+        validate_response=False,
+    )
+
+    @client.get("/users")
+    def get_users() -> List[User]: ...
+
+    @validate_response(True)
+    @client.get("/users")
+    def get_validated_users() -> List[User]: ...
+
+    assert get_users() == [User.construct(id="1", name="sam")]
+    assert get_validated_users() == [User(id=1, name="sam")]
+
+
+def test_client_validate_arguments() -> None:
+    requests: List[httpx.Request] = []
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200)
+        ),
+        validate_arguments=False,
+    )
+
+    @client.post("/users")
+    def create_user(user: User, notify: bool = Query(default=False)) -> None: ...
+
+    @validate_arguments(False, check_types=True)
+    @client.post("/users")
+    def create_checked_user(user: User) -> None: ...
+
+    create_user(User(id=1, name="sam"))
+    create_user({"id": "not validated"}, notify=True)
+
+    assert requests[0].read() == b'{"id": 1, "name": "sam"}'
+    assert requests[0].url.params.get("notify") == "false"
+    assert requests[1].read() == b'{"id": "not validated"}'
+    assert requests[1].url.params.get("notify") == "true"
+
+    with pytest.raises(CompositionError):
+        create_checked_user({"id": 1, "name": "sam"})
+
+
+def test_client_close() -> None:
+    with NeoClient("https://foo.com/") as client:
+        assert client.client is not None
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
@@ -0,0 +1,129 @@
+from typing import Any, List
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from neoclient import Body, NeoClient, content_type
+from neoclient.codecs import (
+    CBORCodec,
+    Codec,
+    CodecRegistry,
+    JSONCodec,
+    MessagePackCodec,
+    get_codec,
+)
+from neoclient.models import RequestOpts
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class UpperCodec(Codec):
+    media_types = ("text/upper",)
+    suffix = "upper"
+
+    def encode(self, obj: Any, /) -> bytes:
+        return str(obj).upper().encode()
+
+    def decode(self, content: bytes, /) -> Any:
+        return content.decode().lower()
+
+
+def test_Codec_abstract() -> None:
+    with pytest.raises(TypeError):
+        Codec()  # type: ignore[abstract]
+
+
+def test_CodecRegistry_get() -> None:
+    json_codec: JSONCodec = JSONCodec()
+    upper_codec: UpperCodec = UpperCodec()
+
+    registry: CodecRegistry = CodecRegistry([json_codec, upper_codec])
+
+    assert registry.get("application/json") is json_codec
+    assert registry.get("Application/JSON; charset=utf-8") is json_codec
+    assert registry.get("application/vnd.foo+json") is json_codec
+    assert registry.get("text/upper") is upper_codec
+    assert registry.get("application/vnd.foo+upper") is upper_codec
+    assert registry.get("text/plain") is None
+    assert registry.get("not a media type") is None
+    assert registry.get(None) is None
+
+
+def test_CodecRegistry_register() -> None:
+    registry: CodecRegistry = CodecRegistry([JSONCodec()])
+
+    assert registry.get("text/upper") is None
+
+    upper_codec: UpperCodec = UpperCodec()
+
+    registry.register(upper_codec)
+
+    assert registry.get("text/upper") is upper_codec
+
+
+def test_get_codec() -> None:
+    assert isinstance(get_codec("application/json"), JSONCodec)
+
+
+@pytest.mark.parametrize(
+    "module, codec_type, media_type",
+    [
+        ("msgpack", MessagePackCodec, "application/msgpack"),
+        ("cbor2", CBORCodec, "application/cbor"),
+    ],
+)
+def test_binary_codec(module: str, codec_type: type, media_type: str) -> None:
+    pytest.importorskip(module)
+
+    codec: Codec = codec_type()
+
+    assert isinstance(get_codec(media_type), codec_type)
+    assert codec.decode(codec.encode({"id": 1, "name": "sam"})) == {
+        "id": 1,
+        "name": "sam",
+    }
+
+
+def test_build_encodes_body_with_codec() -> None:
+    pytest.importorskip("msgpack")
+
+    request: httpx.Request = RequestOpts(
+        "POST",
+        "https://foo.com/",
+        json={"id": 1},
+        headers={"Content-Type": "application/msgpack"},
+    ).build()
+
+    assert request.headers["Content-Type"] == "application/msgpack"
+    assert MessagePackCodec().decode(request.content) == {"id": 1}
+
+
+def test_operation_msgpack() -> None:
+    pytest.importorskip("msgpack")
+
+    codec: MessagePackCodec = MessagePackCodec()
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "application/msgpack"},
+            content=codec.encode([{"id": 1, "name": "sam"}]),
+        )
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/", transport=httpx.MockTransport(handler)
+    )
+
+    @content_type("application/msgpack")
+    @client.post("/users")
+    def create_user(user: User = Body()) -> List[User]: ...
+
+    assert create_user(User(id=1, name="sam")) == [User(id=1, name="sam")]
+    assert codec.decode(requests[0].content) == {"id": 1, "name": "sam"}
@@ -0,0 +1,47 @@
+from typing import List, Optional
+
+import pydantic
+import pytest
+
+from neoclient._compat import (
+    PYDANTIC_V2,
+    BaseModel,
+    has_v2_model,
+    is_model_type,
+    jsonable_encoder,
+)
+from neoclient.adapters import get_type_adapter
+
+
+class ModelV1(BaseModel):
+    id: int
+
+
+def test_is_model_type() -> None:
+    assert is_model_type(ModelV1)
+    assert is_model_type(pydantic.BaseModel)
+    assert not is_model_type(ModelV1(id=1))
+    assert not is_model_type(dict)
+
+
+def test_jsonable_encoder() -> None:
+    assert jsonable_encoder(ModelV1(id=1)) == {"id": 1}
+    assert jsonable_encoder([ModelV1(id=1)]) == [{"id": 1}]
+
+
+def test_has_v2_model_v1() -> None:
+    assert not has_v2_model(ModelV1)
+    assert not has_v2_model(List[ModelV1])
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="requires pydantic v2")
+def test_v2_model() -> None:
+    class ModelV2(pydantic.BaseModel):
+        id: int
+
+    assert has_v2_model(ModelV2)
+    assert has_v2_model(Optional[List[ModelV2]])
+    assert jsonable_encoder(ModelV2(id=1)) == {"id": 1}
+    assert get_type_adapter(List[ModelV2]).validate_json('[{"id": "1"}]') == [
+        ModelV2(id=1)
+    ]
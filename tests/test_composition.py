@@ -0,0 +1,75 @@
+from typing import Optional
+
+import pytest
+from httpx import QueryParams
+
+from neoclient import Header, NeoClient, Query
+from neoclient.composition import Composition, compose, get_composition
+from neoclient.enums import HTTPMethod
+from neoclient.errors import DuplicateParameters
+from neoclient.models import RequestOpts
+from neoclient.operation import Operation, get_operation
+from neoclient.params import HeaderParameter, PathParameter, QueryParameter
+
+
+def test_get_composition() -> None:
+    def foo(id: str, q: str = Query(), x_name: str = Header()) -> None: ...
+
+    request: RequestOpts = RequestOpts(HTTPMethod.GET, "/users/{id}")
+    composition: Composition = get_composition(request, foo)
+
+    assert composition.fields == {
+        "id": (str, PathParameter(alias="id")),
+        "q": (str, QueryParameter(alias="q")),
+        "x_name": (str, HeaderParameter(alias="x_name")),
+    }
+
+    assert composition.is_current(request.copy(), foo)
+    assert not composition.is_current(RequestOpts(HTTPMethod.GET, "/users"), foo)
+    assert composition.model_cls is composition.model_cls
+
+    with pytest.raises(TypeError):
+        composition.fields["id"] = (str, QueryParameter(alias="id"))  # type: ignore
+
+
+def test_get_composition_duplicate_parameters() -> None:
+    def foo(a: str = Query("name"), b: str = Query("name")) -> None: ...
+
+    with pytest.raises(DuplicateParameters):
+        get_composition(RequestOpts(HTTPMethod.GET, "/"), foo)
+
+
+def test_compose_shares_composition() -> None:
+    def foo(id: str, q: str = Query()) -> None: ...
+
+    template: RequestOpts = RequestOpts(HTTPMethod.GET, "/users/{id}")
+    composition: Composition = get_composition(template, foo)
+
+    first: RequestOpts = template.copy()
+    second: RequestOpts = template.copy()
+
+    compose(foo, first, ("1",), {"q": "a"}, composition=composition)
+    compose(foo, second, ("2",), {"q": "b"}, composition=composition)
+
+    assert first.path_params == {"id": "1"}
+    assert first.params == QueryParams({"q": "a"})
+    assert second.path_params == {"id": "2"}
+    assert second.params == QueryParams({"q": "b"})
+
+
+def test_operation_composition() -> None:
+    client: NeoClient = NeoClient("https://foo.com/")
+
+    @client.get("/users/{id}")
+    def get_user(id: str) -> RequestOpts: ...
+
+    operation: Operation = get_operation(get_user)
+
+    assert get_user("1").path_params == {"id": "1"}
+
+    # Compositions are prepared once per operation, and shared by each call
+    composition: Optional[Composition] = operation._composition
+
+    assert composition is not None
+    assert get_user("2").path_params == {"id": "2"}
+    assert operation._composition is composition
@@ -24,6 +24,7 @@ from neoclient.consumers import (
 )
 from neoclient.defaults import DEFAULT_FOLLOW_REDIRECTS
 from neoclient.models import RequestOpts, State
+from neoclient.streams import FileStream
 from neoclient.types import JsonTypes, RequestContent, RequestData, RequestFiles
 
 
@@ -217,3 +218,12 @@ def test_FollowRedirectsConsumer(pre_request: RequestOpts) -> None:
     FollowRedirectsConsumer(follow_redirects).consume_request(pre_request)
 
     assert pre_request == expected_pre_request
+
+
+def test_consumer_content_file(pre_request: RequestOpts) -> None:
+    file: BytesIO = BytesIO(b"content")
+
+    ContentConsumer(file).consume_request(pre_request)
+
+    assert isinstance(pre_request.content, FileStream)
+    assert pre_request.content.file is file
@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from json import JSONDecodeError
+from typing import Any, List
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from neoclient import NeoClient
+from neoclient.decoders import (
+    Decoder,
+    JSONDecoder,
+    MsgspecDecoder,
+    OrjsonDecoder,
+    get_default_decoder,
+)
+from neoclient.decorators import decoder
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+CONTENT: bytes = b'[{"id": "1", "name": "sam"}]'
+
+
+def get_decoders() -> List[Decoder]:
+    decoders: List[Decoder] = [JSONDecoder()]
+
+    if _has_module("orjson"):
+        decoders.append(OrjsonDecoder())
+    if _has_module("msgspec"):
+        decoders.append(MsgspecDecoder())
+
+    return decoders
+
+
+def _has_module(name: str, /) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+
+    return True
+
+
+def test_Decoder_abstract() -> None:
+    with pytest.raises(TypeError):
+        Decoder()  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("json_decoder", get_decoders())
+def test_decoder_loads(json_decoder: Decoder) -> None:
+    assert json_decoder.loads(CONTENT) == [{"id": "1", "name": "sam"}]
+
+    with pytest.raises(JSONDecodeError):
+        json_decoder.loads(b"{")
+
+
+@pytest.mark.parametrize("json_decoder", get_decoders())
+def test_decoder_decode(json_decoder: Decoder) -> None:
+    assert json_decoder.decode(CONTENT, List[User]) == [User(id=1, name="sam")]
+    assert json_decoder.decode(CONTENT, List[Item]) == [Item(id=1, name="sam")]
+    assert json_decoder.decode(CONTENT, Any) == [{"id": "1", "name": "sam"}]
+    assert json_decoder.decode(CONTENT, List[User], validate=False) == [
+        User.construct(id="1", name="sam")
+    ]
+
+
+def test_get_default_decoder() -> None:
+    default_decoder: Decoder = get_default_decoder()
+
+    # msgspec validates differently to pydantic, so is only used if opted into
+    assert not isinstance(default_decoder, MsgspecDecoder)
+
+    if _has_module("orjson"):
+        assert isinstance(default_decoder, OrjsonDecoder)
+    else:
+        assert isinstance(default_decoder, JSONDecoder)
+
+
+def test_default_decoder_decode() -> None:
+    default_decoder: Decoder = get_default_decoder()
+
+    assert default_decoder.decode(b"123", str) == "123"
+    assert default_decoder.decode(b"1.7", int) == 1
+    assert default_decoder.decode(b"[1, 2]", List[str]) == ["1", "2"]
+    assert default_decoder.decode(b'"abc"', bytes) == b"abc"
+
+
+def test_client_decoder() -> None:
+    class RecordingDecoder(JSONDecoder):
+        def __init__(self) -> None:
+            self.decoded: List[Any] = []
+
+        def decode(self, content, annotation, /, *, validate=True):
+            self.decoded.append(annotation)
+
+            return super().decode(content, annotation, validate=validate)
+
+    client_decoder: RecordingDecoder = RecordingDecoder()
+    operation_decoder: RecordingDecoder = RecordingDecoder()
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=CONTENT)
+        ),
+        decoder=client_decoder,
+    )
+
+    @client.get("/users")
+    def get_users() -> List[User]: ...
+
+    @decoder(operation_decoder)
+    @client.get("/items")
+    def get_items() -> List[Item]: ...
+
+    assert get_users() == [User(id=1, name="sam")]
+    assert get_items() == [Item(id=1, name="sam")]
+    assert client_decoder.decoded == [List[User]]
+    assert operation_decoder.decoded == [List[Item]]
@@ -1,13 +1,23 @@
+import threading
+import time
+from typing import List
+
 import pytest
 from httpx import Headers
-from pydantic import BaseConfig
-from pydantic.fields import ModelField
 
-from neoclient import Cookie
-from neoclient.dependence import DependencyParameter, DependencyResolver, get_fields
+from neoclient import Cookie, Depends
+from neoclient._compat import BaseConfig, ModelField
+from neoclient.dependence import (
+    DependencyGraph,
+    DependencyParameter,
+    DependencyResolver,
+    PreparedDependency,
+    get_fields,
+    set_max_workers,
+)
 from neoclient.enums import HTTPMethod
-from neoclient.errors import ResolutionError
-from neoclient.models import RequestOpts, Response
+from neoclient.errors import PreparationError, ResolutionError
+from neoclient.models import RequestOpts, Response, State
 from neoclient.param_functions import Request
 from neoclient.params import (
     BodyParameter,
@@ -32,6 +42,20 @@ def test_get_fields() -> None:
     }
 
 
+def test_PreparedDependency_prepare() -> None:
+    def foo(query: str, cookie: int = Cookie()) -> None: ...
+
+    prepared: PreparedDependency = PreparedDependency.prepare(foo)
+
+    assert prepared.fields == {
+        "query": (str, QueryParameter(alias="query")),
+        "cookie": (int, CookieParameter(alias="cookie")),
+    }
+
+    with pytest.raises(TypeError):
+        prepared.fields["query"] = (str, QueryParameter(alias="q"))  # type: ignore
+
+
 def test_DependencyResolver_resolve_response() -> None:
     def dependency(response: Response, /) -> Response:
         return response
@@ -103,3 +127,176 @@ def test_DependencyParameter_prepare() -> None:
     dependency_parameter_without_dependency.prepare(model_field)
 
     assert dependency_parameter_without_dependency.dependency == SomeDependency
+
+
+def test_DependencyGraph_compile() -> None:
+    def body(response: Response, /) -> bytes:
+        return response.content
+
+    def first(content: bytes = Depends(body)) -> bytes:
+        return content
+
+    def second(content: bytes = Depends(body), first: bytes = Depends(first)) -> bytes:
+        return content
+
+    graph: DependencyGraph = DependencyGraph.compile((first, second))
+
+    assert graph.dependencies == (first, second)
+    assert graph.order == (body, first, second)
+
+
+def test_DependencyGraph_compile_prepared() -> None:
+    def body(response: Response, /) -> bytes:
+        return response.content
+
+    def length(content: bytes = Depends(body, use_cache=False)) -> int:
+        return len(content)
+
+    graph: DependencyGraph = DependencyGraph.compile((length,))
+
+    # Uncached sub-dependencies aren't part of the graph, but are still prepared
+    assert graph.order == (length,)
+    assert set(graph.prepared) == {length, body}
+
+    response: Response = Response(200, content=b"foo")
+
+    assert graph.resolve_response(response) == [3]
+
+
+def test_DependencyGraph_compile_circular() -> None:
+    def first(value: None = None) -> None: ...
+
+    def second(value: None = Depends(first)) -> None: ...
+
+    # Make `first` depend on `second`, which depends on `first`
+    first.__defaults__ = (Depends(second),)
+
+    with pytest.raises(PreparationError):
+        DependencyGraph.compile((second,))
+
+
+def test_DependencyGraph_resolve_response() -> None:
+    calls: List[str] = []
+
+    def body(response: Response, /) -> bytes:
+        calls.append("body")
+
+        return response.content
+
+    def uncached(response: Response, /) -> bytes:
+        calls.append("uncached")
+
+        return response.content
+
+    def first(
+        content: bytes = Depends(body),
+        other: bytes = Depends(uncached, use_cache=False),
+    ) -> bytes:
+        return content
+
+    def second(
+        data: bytes = Depends(body), other: bytes = Depends(uncached, use_cache=False)
+    ) -> bytes:
+        return data
+
+    graph: DependencyGraph = DependencyGraph.compile((first, second))
+    response: Response = build_response(content=b"abc")
+
+    assert graph.resolve_response(response) == [b"abc", b"abc"]
+    # Shared sub-dependencies are resolved once per resolution (unless uncached)
+    assert calls == ["body", "uncached", "uncached"]
+
+
+def test_DependencyGraph_resolve_concurrent() -> None:
+    # Each dependency waits for the other, so only resolves if they're resolved
+    # concurrently
+    barrier: threading.Barrier = threading.Barrier(2, timeout=5)
+
+    def fetch_token(request=Request()) -> str:
+        barrier.wait()
+
+        return "token"
+
+    def fetch_key(request=Request()) -> str:
+        barrier.wait()
+
+        return "key"
+
+    def sign(
+        token: str = Depends(fetch_token, concurrent=True),
+        key: str = Depends(fetch_key, concurrent=True),
+    ) -> str:
+        return f"{token}:{key}"
+
+    graph: DependencyGraph = DependencyGraph.compile((sign,))
+
+    assert graph.concurrent == {fetch_token: None, fetch_key: None}
+
+    request: RequestOpts = RequestOpts(HTTPMethod.GET, "https://foo.com/")
+
+    assert graph.resolve_request(request) == ["token:key"]
+    assert set(request.extensions["dependency_timings"]) == {
+        fetch_token,
+        fetch_key,
+        sign,
+    }
+    # Timings aren't recorded in the (user's) state
+    assert request.state == State()
+
+
+def test_DependencyGraph_resolve_empty() -> None:
+    request: RequestOpts = RequestOpts(HTTPMethod.GET, "https://foo.com/")
+
+    assert DependencyGraph.compile(()).resolve_request(request) == []
+    assert request == RequestOpts(HTTPMethod.GET, "https://foo.com/")
+
+
+def test_DependencyGraph_resolve_timeout() -> None:
+    def slow(request=Request()) -> str:
+        time.sleep(0.2)
+
+        return "slow"
+
+    def dependency(value: str = Depends(slow, timeout=0.05)) -> str:
+        return value
+
+    graph: DependencyGraph = DependencyGraph.compile((dependency,))
+
+    assert graph.concurrent == {slow: 0.05}
+
+    with pytest.raises(ResolutionError):
+        graph.resolve_request(RequestOpts(HTTPMethod.GET, "https://foo.com/"))
+
+
+def test_DependencyGraph_resolve_timeout_retires_worker() -> None:
+    release: threading.Event = threading.Event()
+
+    def hang(request=Request()) -> str:
+        release.wait(timeout=5)
+
+        return "hang"
+
+    def fetch(request=Request()) -> str:
+        return "fetch"
+
+    def first(value: str = Depends(hang, timeout=0.05)) -> str:
+        return value
+
+    def second(value: str = Depends(fetch, timeout=1)) -> str:
+        return value
+
+    set_max_workers(1)
+
+    try:
+        with pytest.raises(ResolutionError):
+            DependencyGraph.compile((first,)).resolve_request(
+                RequestOpts(HTTPMethod.GET, "https://foo.com/")
+            )
+
+        # The only worker is still stuck on `hang`, so isn't re-used
+        assert DependencyGraph.compile((second,)).resolve_request(
+            RequestOpts(HTTPMethod.GET, "https://foo.com/")
+        ) == ["fetch"]
+    finally:
+        release.set()
+        set_max_workers(None)
@@ -0,0 +1,146 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Iterator, MutableSequence, Sequence
+
+import httpcore
+import httpx
+import pytest
+
+from neoclient.dns import CachingNetworkBackend, DNSCache, DNSStats
+from neoclient.models import ClientOptions
+
+
+class Resolver:
+    def __init__(self, addresses: Sequence[str]) -> None:
+        self.addresses = addresses
+        self.calls: MutableSequence[str] = []
+
+    def __call__(self, host: str, /) -> Sequence[str]:
+        self.calls.append(host)
+
+        if not self.addresses:
+            raise socket.gaierror("Name or service not known")
+
+        return self.addresses
+
+
+class Backend(httpcore.NetworkBackend):
+    def __init__(self, *unreachable: str) -> None:
+        self.unreachable = unreachable
+        self.calls: MutableSequence[str] = []
+
+    def connect_tcp(self, host: str, port: int, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(host)
+
+        if host in self.unreachable:
+            raise httpcore.ConnectError("Connection refused")
+
+        return host
+
+
+def test_DNSCache_hit() -> None:
+    resolver: Resolver = Resolver(["10.0.0.1"])
+    cache: DNSCache = DNSCache(resolver=resolver)
+
+    assert cache.lookup("foo.com") == ["10.0.0.1"]
+    assert cache.lookup("FOO.com") == ["10.0.0.1"]
+    assert resolver.calls == ["foo.com"]
+    assert cache.stats == DNSStats(hits=1, misses=1)
+
+
+def test_DNSCache_ttl() -> None:
+    resolver: Resolver = Resolver(["10.0.0.1"])
+    cache: DNSCache = DNSCache(ttl=0, resolver=resolver)
+
+    cache.lookup("foo.com")
+    cache.lookup("foo.com")
+
+    assert resolver.calls == ["foo.com", "foo.com"]
+
+
+def test_DNSCache_negative() -> None:
+    resolver: Resolver = Resolver([])
+    cache: DNSCache = DNSCache(resolver=resolver)
+
+    with pytest.raises(socket.gaierror):
+        cache.lookup("foo.com")
+    with pytest.raises(socket.gaierror):
+        cache.lookup("foo.com")
+
+    assert resolver.calls == ["foo.com"]
+    assert cache.stats == DNSStats(misses=1, negative_hits=1, failures=1)
+
+
+def test_DNSCache_round_robin() -> None:
+    cache: DNSCache = DNSCache(static={"foo.com": ["10.0.0.1", "::1", "10.0.0.2"]})
+
+    assert cache.lookup("foo.com") == ["10.0.0.1", "::1", "10.0.0.2"]
+    assert cache.lookup("foo.com") == ["::1", "10.0.0.2", "10.0.0.1"]
+    assert cache.lookup("foo.com") == ["10.0.0.2", "10.0.0.1", "::1"]
+
+
+def test_DNSCache_maxsize() -> None:
+    resolver: Resolver = Resolver(["10.0.0.1"])
+    cache: DNSCache = DNSCache(maxsize=1, resolver=resolver)
+
+    cache.lookup("foo.com")
+    cache.lookup("bar.com")
+    cache.lookup("foo.com")
+
+    assert resolver.calls == ["foo.com", "bar.com", "foo.com"]
+
+
+def test_CachingNetworkBackend() -> None:
+    backend: Backend = Backend("10.0.0.1")
+    caching_backend: CachingNetworkBackend = CachingNetworkBackend(
+        DNSCache(static={"foo.com": ["10.0.0.1", "10.0.0.2"]}), backend
+    )
+
+    assert caching_backend.connect_tcp("foo.com", 443) == "10.0.0.2"
+    assert caching_backend.connect_tcp("10.0.0.3", 443) == "10.0.0.3"
+    assert backend.calls == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+
+
+def test_CachingNetworkBackend_unresolvable() -> None:
+    caching_backend: CachingNetworkBackend = CachingNetworkBackend(
+        DNSCache(resolver=Resolver([])), Backend()
+    )
+
+    with pytest.raises(httpcore.ConnectError):
+        caching_backend.connect_tcp("foo.com", 443)
+
+
+@pytest.fixture
+def server() -> Iterator[HTTPServer]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server: HTTPServer = HTTPServer(("127.0.0.1", 0), Handler)
+    thread: threading.Thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_client_options_dns_cache(server: HTTPServer) -> None:
+    cache: DNSCache = DNSCache(static={"foo.test": ["127.0.0.1"]})
+    client: httpx.Client = ClientOptions(dns_cache=cache, http2=False).build()
+
+    with client:
+        response: httpx.Response = client.get(
+            f"http://foo.test:{server.server_address[1]}/"
+        )
+
+    assert response.status_code == 200
+    assert cache.stats.hits == 1
@@ -0,0 +1,159 @@
+from typing import List
+
+import httpx
+import pytest
+
+from neoclient import Header, NeoClient, cache, get, service
+from neoclient.memoization import CacheStats, OperationCache, make_key
+from neoclient.models import Request
+from neoclient.operation import Operation, get_operation
+from neoclient.services import Service
+
+
+def test_make_key() -> None:
+    assert make_key(Request("GET", "https://foo.com/?a=1")) == make_key(
+        Request("GET", "https://foo.com/?a=1")
+    )
+    assert make_key(Request("GET", "https://foo.com/?a=1")) != make_key(
+        Request("GET", "https://foo.com/?a=2")
+    )
+    assert make_key(Request("POST", "https://foo.com/", json={"a": 1})) != make_key(
+        Request("POST", "https://foo.com/", json={"a": 2})
+    )
+    assert make_key(
+        Request("GET", "https://foo.com/", headers={"Authorization": "alice"})
+    ) != make_key(Request("GET", "https://foo.com/", headers={"Authorization": "bob"}))
+    assert make_key(Request("GET", "https://foo.com/", cookies={"a": "1"})) != make_key(
+        Request("GET", "https://foo.com/", cookies={"a": "2"})
+    )
+    assert make_key(Request("POST", "https://foo.com/", content=iter(()))) is None
+
+
+def test_OperationCache() -> None:
+    operation_cache: OperationCache = OperationCache(maxsize=2)
+
+    assert operation_cache.get_or_call("a", lambda: 1) == 1
+    assert operation_cache.get_or_call("a", lambda: 2) == 1
+    assert operation_cache.get_or_call("b", lambda: 3) == 3
+    assert operation_cache.get_or_call("c", lambda: 4) == 4
+
+    # "a" was the least recently used entry, so was evicted
+    assert "a" not in operation_cache
+    assert operation_cache.stats == CacheStats(hits=1, misses=3, evictions=1)
+
+    assert operation_cache.invalidate("b")
+    assert not operation_cache.invalidate("b")
+
+    operation_cache.clear()
+
+    assert len(operation_cache) == 0
+
+
+def test_OperationCache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now: List[float] = [0.0]
+
+    monkeypatch.setattr("neoclient.memoization.time.monotonic", lambda: now[0])
+
+    operation_cache: OperationCache = OperationCache(ttl=10)
+
+    assert operation_cache.get_or_call("a", lambda: 1) == 1
+
+    now[0] = 9.0
+
+    assert operation_cache.get_or_call("a", lambda: 2) == 1
+
+    now[0] = 10.0
+
+    assert operation_cache.get_or_call("a", lambda: 3) == 3
+
+
+def test_OperationCache_fork() -> None:
+    operation_cache: OperationCache = OperationCache(ttl=10, maxsize=2)
+
+    operation_cache.set("a", 1)
+
+    fork: OperationCache = operation_cache.fork()
+
+    assert (fork.ttl, fork.maxsize) == (10, 2)
+    assert "a" not in fork
+
+
+def test_cache() -> None:
+    requests: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+
+        return httpx.Response(200, json=[request.url.params["name"]])
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/", transport=httpx.MockTransport(handler)
+    )
+
+    @cache(ttl=60)
+    @client.get("/users")
+    def get_users(name: str) -> List[str]: ...
+
+    assert get_users("sam") == ["sam"]
+    assert get_users(name="sam") == ["sam"]
+    assert get_users("bob") == ["bob"]
+    assert len(requests) == 2
+
+    operation: Operation = get_operation(get_users)
+
+    assert operation.cache is not None
+    assert operation.cache.stats == CacheStats(hits=1, misses=2)
+
+    assert operation.invalidate("sam")
+    assert get_users("sam") == ["sam"]
+    assert len(requests) == 3
+
+
+def test_cache_headers() -> None:
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=request.headers["Authorization"])
+        ),
+    )
+
+    @cache(ttl=60)
+    @client.get("/me")
+    def get_me(authorization: str = Header()) -> str: ...
+
+    assert get_me("alice") == "alice"
+    assert get_me("bob") == "bob"
+    assert get_me("alice") == "alice"
+
+
+def test_cache_service_middleware_credentials() -> None:
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json=request.headers["Authorization"])
+        ),
+    )
+
+    class UserService(Service):
+        token: str
+
+        @service.middleware
+        def authenticate(self, call_next, request):
+            request.headers["Authorization"] = f"Bearer {self.token}"
+
+            return call_next(request)
+
+        @cache(ttl=60)
+        @get("/me")
+        def get_me(self) -> str: ...
+
+    alice: UserService = UserService(client=client)
+    alice.token = "alice"
+    bob: UserService = UserService(client=client)
+    bob.token = "bob"
+
+    assert alice.get_me() == "Bearer alice"
+    # Credentials added by middleware aren't part of the key, so instances don't
+    # share memoized values
+    assert bob.get_me() == "Bearer bob"
+    assert alice.get_me() == "Bearer alice"
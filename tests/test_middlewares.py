@@ -1,10 +1,30 @@
+import gzip
+import logging
+import threading
+from typing import List
+
+import httpx
 import pytest
 
 from neoclient import Request, Response
 from neoclient.auth import Auth, BasicAuth
+from neoclient.caching import MemoryStorage
+from neoclient.compression import (
+    CompressedStream,
+    CompressionStats,
+    Compressor,
+    GzipCompressor,
+    StatsRecorder,
+    ZstdCompressor,
+)
 from neoclient.enums import HTTPHeader
 from neoclient.errors import ExpectedContentTypeError
-from neoclient.middleware import AuthMiddleware, ExpectedContentTypeMiddleware
+from neoclient.middleware import (
+    AuthMiddleware,
+    CacheMiddleware,
+    CompressionMiddleware,
+    ExpectedContentTypeMiddleware,
+)
 from neoclient.typing import MiddlewareCallable
 
 from . import utils
@@ -122,3 +142,438 @@ def test_AuthMiddleware() -> None:
     middleware(call_next, request)
 
     assert request.headers.get(HTTPHeader.AUTHORIZATION) == authorization
+
+
+def test_Compressor_abstract() -> None:
+    with pytest.raises(TypeError):
+        Compressor()  # type: ignore[abstract]
+
+
+def test_CompressionMiddleware() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(request=request)
+
+    middleware: CompressionMiddleware = CompressionMiddleware("gzip", threshold=100)
+
+    middleware(call_next, Request("POST", "https://foo.com/", content=b"a" * 10))
+    middleware(call_next, Request("POST", "https://foo.com/", content=b"a" * 1000))
+
+    assert HTTPHeader.CONTENT_ENCODING not in requests[0].headers
+    assert requests[0].content == b"a" * 10
+    assert requests[1].headers[HTTPHeader.CONTENT_ENCODING] == "gzip"
+    assert requests[1].headers[HTTPHeader.CONTENT_LENGTH] == str(
+        len(requests[1].content)
+    )
+    assert gzip.decompress(requests[1].content) == b"a" * 1000
+
+    stats: CompressionStats = middleware.stats
+
+    assert stats.requests == 2
+    assert stats.compressed == 1
+    assert stats.bytes_in == 1000
+    assert stats.bytes_out == len(requests[1].content)
+    assert stats.ratio is not None and stats.ratio < 0.1
+
+
+def test_CompressionMiddleware_stream() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(request=request)
+
+    middleware: CompressionMiddleware = CompressionMiddleware("gzip", threshold=100)
+
+    middleware(
+        call_next,
+        Request("POST", "https://foo.com/", content=iter((b"a" * 500, b"b" * 500))),
+    )
+
+    request: Request = requests[0]
+
+    assert request.headers[HTTPHeader.CONTENT_ENCODING] == "gzip"
+    assert isinstance(request.stream, httpx.SyncByteStream)
+    assert gzip.decompress(b"".join(request.stream)) == b"a" * 500 + b"b" * 500
+    assert middleware.stats.bytes_in == 1000
+
+
+def test_CompressedStream_reiterated() -> None:
+    recorder: StatsRecorder = StatsRecorder()
+    stream: CompressedStream = CompressedStream(
+        httpx.ByteStream(b"a" * 1000), GzipCompressor(), recorder
+    )
+
+    # e.g. the request was retried
+    assert gzip.decompress(b"".join(stream)) == b"a" * 1000
+    assert gzip.decompress(b"".join(stream)) == b"a" * 1000
+
+    assert recorder.stats.bytes_in == 1000
+
+
+def test_CompressionMiddleware_already_encoded() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(request=request)
+
+    middleware: CompressionMiddleware = CompressionMiddleware("gzip", threshold=0)
+
+    middleware(
+        call_next,
+        Request(
+            "POST",
+            "https://foo.com/",
+            headers={HTTPHeader.CONTENT_ENCODING: "br"},
+            content=b"a" * 1000,
+        ),
+    )
+
+    assert requests[0].content == b"a" * 1000
+    assert middleware.stats.compressed == 0
+
+
+def test_CompressionMiddleware_zstd() -> None:
+    zstandard = pytest.importorskip("zstandard")
+
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(request=request)
+
+    middleware: CompressionMiddleware = CompressionMiddleware("zstd", threshold=0)
+
+    middleware(call_next, Request("POST", "https://foo.com/", content=b"a" * 1000))
+
+    assert requests[0].headers[HTTPHeader.CONTENT_ENCODING] == "zstd"
+    assert zstandard.ZstdDecompressor().decompress(requests[0].content) == b"a" * 1000
+
+
+def test_ZstdCompressor_threads() -> None:
+    zstandard = pytest.importorskip("zstandard")
+
+    compressor: ZstdCompressor = ZstdCompressor()
+    results: List[bytes] = []
+
+    def compress(data: bytes, /) -> None:
+        for _ in range(50):
+            results.append(compressor.compress(data))
+
+    threads: List[threading.Thread] = [
+        threading.Thread(target=compress, args=(bytes([i]) * 100_000,))
+        for i in range(4)
+    ]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(
+        set(zstandard.ZstdDecompressor().decompress(result) for result in results)
+    ) == [bytes([i]) * 100_000 for i in range(4)]
+
+
+def test_CacheMiddleware() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(
+            request=request,
+            headers={HTTPHeader.CONTENT_TYPE: "text/plain"},
+            content=b"foo",
+        )
+
+    storage: MemoryStorage = MemoryStorage()
+    middleware: CacheMiddleware = CacheMiddleware(storage, ttl=60)
+
+    response: Response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.content == b"foo"
+    assert "from_cache" not in response.extensions
+
+    response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.content == b"foo"
+    assert response.headers[HTTPHeader.CONTENT_TYPE] == "text/plain"
+    assert response.extensions["from_cache"]
+    assert len(requests) == 1
+
+    # Bypasses the cache
+    middleware(
+        call_next,
+        Request(
+            "GET", "https://foo.com/", headers={HTTPHeader.CACHE_CONTROL: "no-cache"}
+        ),
+    )
+    # Not cacheable
+    middleware(call_next, Request("POST", "https://foo.com/"))
+    middleware(call_next, Request("POST", "https://foo.com/"))
+
+    assert len(requests) == 4
+    assert len(storage) == 1
+
+
+def test_CacheMiddleware_cache_control() -> None:
+    def call_next(request: Request, /) -> Response:
+        return utils.build_response(
+            request=request,
+            headers={HTTPHeader.CACHE_CONTROL: request.url.params["cache-control"]},
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60)
+
+    assert (
+        middleware.get_ttl(
+            call_next(Request("GET", "https://foo.com/?cache-control=max-age=10"))
+        )
+        == 10
+    )
+    assert (
+        middleware.get_ttl(
+            call_next(Request("GET", "https://foo.com/?cache-control=no-store"))
+        )
+        is None
+    )
+    assert (
+        middleware.get_ttl(
+            call_next(Request("GET", "https://foo.com/?cache-control=public"))
+        )
+        == 60
+    )
+
+    assert (
+        middleware.get_ttl(
+            call_next(Request("GET", "https://foo.com/?cache-control=private"))
+        )
+        == 60
+    )
+    assert (
+        middleware.get_ttl(
+            call_next(Request("GET", "https://foo.com/?cache-control=no-cache"))
+        )
+        == 0
+    )
+
+
+def test_CacheMiddleware_no_cache_response() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(
+            request=request,
+            headers={
+                HTTPHeader.CACHE_CONTROL: request.url.params["cache-control"]
+                + ", stale-while-revalidate=60"
+            },
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60)
+
+    middleware(call_next, Request("GET", "https://foo.com/?cache-control=no-cache"))
+    response: Response = middleware(
+        call_next, Request("GET", "https://foo.com/?cache-control=no-cache")
+    )
+
+    # Revalidated (i.e. re-sent), rather than served from the cache
+    assert "from_cache" not in response.extensions
+    assert len(requests) == 2
+    assert len(middleware.storage) == 0
+
+
+def test_CacheMiddleware_credentials() -> None:
+    def call_next(request: Request, /) -> Response:
+        return utils.build_response(
+            request=request,
+            headers={HTTPHeader.CACHE_CONTROL: "private"},
+            content=request.headers.get(HTTPHeader.AUTHORIZATION, "").encode(),
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60)
+
+    def get(authorization: str, /) -> Response:
+        return middleware(
+            call_next,
+            Request(
+                "GET",
+                "https://foo.com/",
+                headers={HTTPHeader.AUTHORIZATION: authorization},
+            ),
+        )
+
+    assert get("alice").content == b"alice"
+    assert get("bob").content == b"bob"
+
+    response: Response = get("alice")
+
+    assert response.content == b"alice"
+    assert response.extensions["from_cache"]
+
+
+def test_CacheMiddleware_vary() -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        return utils.build_response(
+            request=request,
+            headers=[
+                (HTTPHeader.VARY, "Accept-Language"),
+                ("Set-Cookie", "a=1"),
+                ("Set-Cookie", "b=2"),
+            ],
+            content=request.headers[HTTPHeader.ACCEPT_LANGUAGE].encode(),
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60)
+
+    def get(language: str, /) -> Response:
+        return middleware(
+            call_next,
+            Request(
+                "GET",
+                "https://foo.com/",
+                headers={HTTPHeader.ACCEPT_LANGUAGE: language},
+            ),
+        )
+
+    assert get("en").content == b"en"
+    assert get("fr").content == b"fr"
+
+    response: Response = get("en")
+
+    assert response.content == b"en"
+    assert response.extensions["from_cache"]
+    assert response.headers.get_list("Set-Cookie") == ["a=1", "b=2"]
+    assert get("fr").content == b"fr"
+    assert len(requests) == 2
+
+
+def test_CacheMiddleware_stale_while_revalidate() -> None:
+    requests: List[Request] = []
+    release: threading.Event = threading.Event()
+
+    def call_next(request: Request, /) -> Response:
+        if requests:
+            # Block revalidations until released
+            release.wait(timeout=5)
+
+        requests.append(request)
+
+        return utils.build_response(
+            request=request,
+            headers={HTTPHeader.CACHE_CONTROL: "max-age=0"},
+            content=f"foo {len(requests)}".encode(),
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60, stale_while_revalidate=60)
+
+    response: Response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.content == b"foo 1"
+
+    # Served stale (whilst a single revalidation is in progress)
+    response = middleware(call_next, Request("GET", "https://foo.com/"))
+    middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.content == b"foo 1"
+    assert response.extensions["stale"]
+
+    release.set()
+    middleware.join(5)
+
+    assert len(requests) == 2
+
+    response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.content == b"foo 2"
+    assert response.extensions["stale"]
+
+    middleware.join(5)
+
+
+def test_CacheMiddleware_revalidate_failure(caplog: pytest.LogCaptureFixture) -> None:
+    requests: List[Request] = []
+
+    def call_next(request: Request, /) -> Response:
+        requests.append(request)
+
+        if len(requests) > 1:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+
+        return utils.build_response(
+            request=request,
+            headers={HTTPHeader.CACHE_CONTROL: "max-age=0"},
+            content=b"foo",
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware(ttl=60, stale_while_revalidate=60)
+
+    middleware(call_next, Request("GET", "https://foo.com/"))
+
+    request: Request = Request("GET", "https://foo.com/")
+
+    with caplog.at_level(logging.WARNING, logger="neoclient.middleware"):
+        response: Response = middleware(call_next, request)
+
+        middleware.join(5)
+
+    assert response.content == b"foo"
+    assert response.extensions["stale"]
+    # The request handed back to the caller isn't re-sent
+    assert requests[1] is not request
+    assert requests[1].url == request.url
+    assert "Failed to revalidate GET https://foo.com/" in caplog.text
+
+    # The stale response remains cached
+    assert middleware(call_next, Request("GET", "https://foo.com/")).content == b"foo"
+
+    middleware.join(5)
+
+
+def test_CacheMiddleware_stale_if_error() -> None:
+    status_code: int = 200
+
+    def call_next(request: Request, /) -> Response:
+        if status_code == 0:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        return utils.build_response(
+            request=request,
+            status_code=status_code,
+            headers={HTTPHeader.CACHE_CONTROL: "max-age=0, stale-if-error=60"},
+            content=b"foo",
+        )
+
+    middleware: CacheMiddleware = CacheMiddleware()
+
+    middleware(call_next, Request("GET", "https://foo.com/"))
+
+    status_code = 503
+    response: Response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.status_code == 200
+    assert response.extensions["stale"]
+
+    status_code = 0
+    response = middleware(call_next, Request("GET", "https://foo.com/"))
+
+    assert response.status_code == 200
+    assert response.extensions["stale"]
+
+    # Not cached, so the error is raised
+    with pytest.raises(httpx.ConnectError):
+        middleware(call_next, Request("GET", "https://bar.com/"))
@@ -1,6 +1,8 @@
+import httpx
 import pytest
+from httpx import URL, Cookies, Headers, QueryParams
 
-from neoclient.models import State
+from neoclient.models import Request, RequestOpts, Response, State, StaticRequestParts
 
 
 def test_State_init() -> None:
@@ -68,3 +70,166 @@ def test_State_del_item() -> None:
 
     with pytest.raises(KeyError):
         del state["missing"]
+
+
+def test_RequestOpts_copy() -> None:
+    request: RequestOpts = RequestOpts(
+        "GET", "/", headers={"name": "sam"}, cookies={"id": "1"}
+    )
+
+    copy: RequestOpts = request.copy()
+    copy.headers["age"] = "43"
+    copy.cookies.set("session", "abc")
+    copy.extensions["trace"] = True
+    copy.path_params["id"] = "1"
+    copy.state.name = "sam"
+
+    assert request.headers == Headers({"name": "sam"})
+    assert dict(request.cookies) == {"id": "1"}
+    assert request.extensions == {}
+    assert request.path_params == {}
+    assert request.state == State()
+
+    # Immutable parts are shared, rather than copied
+    assert copy.url is request.url
+    assert copy.params is request.params
+
+
+def test_RequestOpts_build() -> None:
+    request: RequestOpts = RequestOpts(
+        "GET", "https://example.com/users/{id}", path_params={"id": "1"}
+    )
+
+    assert request.build().url == URL("https://example.com/users/1")
+    assert request.url == URL("https://example.com/users/{id}")
+
+
+def test_StaticRequestParts_build_request() -> None:
+    client: httpx.Client = httpx.Client(
+        base_url="https://api.example.com/v1",
+        headers={"user-agent": "neoclient", "accept": "application/json"},
+        params={"key": "abc"},
+        cookies={"session": "123"},
+    )
+    request: RequestOpts = RequestOpts(
+        "GET",
+        "/users",
+        headers={"x-name": "sam"},
+        params={"page": "1"},
+        cookies={"theme": "dark"},
+    )
+
+    static: StaticRequestParts = StaticRequestParts.assemble(client, request)
+
+    assert static is not None
+    assert static.is_current(client, request)
+
+    expected: httpx.Request = request.build(client)
+    actual: httpx.Request = request.build(client, static=static)
+
+    assert (
+        actual.url
+        == expected.url
+        == URL("https://api.example.com/v1/users?key=abc&page=1")
+    )
+    assert actual.headers == expected.headers
+    assert actual.headers["cookie"] == "session=123; theme=dark"
+    assert actual.extensions == expected.extensions
+
+
+def test_StaticRequestParts_build_request_dynamic() -> None:
+    client: httpx.Client = httpx.Client(
+        headers={"accept": "application/json"}, cookies={"session": "123"}
+    )
+    request: RequestOpts = RequestOpts(
+        "GET", "https://example.com/", headers={"x-name": "sam"}
+    )
+
+    static: StaticRequestParts = StaticRequestParts.assemble(client, request)
+
+    # Dynamic values override the static values (without modifying them)
+    dynamic: RequestOpts = request.copy()
+    dynamic.headers["x-name"] = "bob"
+    dynamic.params = QueryParams({"page": "2"})
+    dynamic.cookies.set("session", "456")
+
+    expected: httpx.Request = dynamic.build(client)
+    actual: httpx.Request = dynamic.build(client, static=static)
+
+    assert actual.url == expected.url == URL("https://example.com/?page=2")
+    assert actual.headers == expected.headers
+    assert actual.headers["x-name"] == "bob"
+    assert actual.headers["cookie"] == "session=456"
+    assert static.headers["x-name"] == "sam"
+
+
+def test_StaticRequestParts_restricted_cookies() -> None:
+    cookies: Cookies = Cookies()
+    cookies.set("session", "123", domain="example.com")
+
+    client: httpx.Client = httpx.Client(cookies=cookies)
+    request: RequestOpts = RequestOpts("GET", "https://example.org/")
+
+    static: StaticRequestParts = StaticRequestParts.assemble(client, request)
+
+    assert static.cookie_header is None
+    assert "cookie" not in request.build(client, static=static).headers
+    assert (
+        RequestOpts("GET", "https://example.com/")
+        .build(client, static=static)
+        .headers["cookie"]
+        == "session=123"
+    )
+
+
+def test_StaticRequestParts_is_current() -> None:
+    client: httpx.Client = httpx.Client(headers={"accept": "application/json"})
+    request: RequestOpts = RequestOpts("GET", "https://example.com/")
+
+    static: StaticRequestParts = StaticRequestParts.assemble(client, request)
+
+    assert static.is_current(client, request)
+
+    client.headers["accept"] = "text/plain"
+
+    assert not static.is_current(client, request)
+
+
+def test_Request_from_httpx_request() -> None:
+    httpx_request: httpx.Request = httpx.Request(
+        "POST", "https://example.com/", headers={"name": "sam"}, content=b"sam"
+    )
+    headers: Headers = httpx_request.headers
+    state: State = State(name="sam")
+
+    request: Request = Request.from_httpx_request(httpx_request, state=state)
+
+    # The request is adopted, rather than copied
+    assert request is httpx_request
+    assert isinstance(request, Request)
+    assert request.headers is headers
+    assert request.content == b"sam"
+    assert request.state is state
+    assert Request.from_httpx_request(request) is request
+
+
+def test_Response_from_httpx_response() -> None:
+    request: Request = Request("GET", "https://example.com/")
+    httpx_response: httpx.Response = httpx.Response(
+        200,
+        headers={"name": "sam"},
+        content=b"sam",
+        request=request,
+        extensions={"http_version": b"HTTP/1.1"},
+    )
+
+    response: Response = Response.from_httpx_response(httpx_response)
+
+    # The response is adopted, rather than copied
+    assert response is httpx_response
+    assert isinstance(response, Response)
+    assert response.content == b"sam"
+    assert response.request is request
+    assert response.extensions == {"http_version": b"HTTP/1.1"}
+    assert response.state == State()
+    assert Response.from_httpx_response(response) is response
@@ -0,0 +1,159 @@
+import threading
+from typing import Any, Iterator, List, MutableSequence, Optional
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from neoclient import NeoClient, paginate
+from neoclient.errors import PaginationError
+from neoclient.pagination import (
+    CursorPagination,
+    LinkPagination,
+    OffsetPagination,
+    PagePagination,
+    get_path,
+)
+
+ITEMS: List[int] = list(range(10))
+
+
+class Item(BaseModel):
+    id: int
+
+
+def build_client(handler) -> NeoClient:
+    return NeoClient("https://foo.com/", transport=httpx.MockTransport(handler))
+
+
+def test_get_path() -> None:
+    assert get_path({"meta": {"next": "abc"}}, "meta.next") == "abc"
+    assert get_path({"meta": None}, "meta.next") is None
+
+
+def test_link_pagination() -> None:
+    urls: MutableSequence[str] = []
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        urls.append(str(request.url))
+
+        page: int = int(request.url.params.get("page", 0))
+        headers: MutableSequence = []
+
+        if page < 2:
+            headers.append(("Link", f'</items?page={page + 1}>; rel="next"'))
+
+        return httpx.Response(
+            200, headers=headers, json=[{"id": page * 2}, {"id": page * 2 + 1}]
+        )
+
+    client: NeoClient = build_client(handler)
+
+    @paginate(LinkPagination())
+    @client.get("/items")
+    def items() -> Iterator[Item]: ...
+
+    iterator: Iterator[Item] = items()
+
+    # Pages are fetched lazily
+    assert urls == []
+
+    assert list(iterator) == [Item(id=id) for id in range(6)]
+    assert urls == [
+        "https://foo.com/items",
+        "https://foo.com/items?page=1",
+        "https://foo.com/items?page=2",
+    ]
+
+
+def test_cursor_pagination() -> None:
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        cursor: Optional[str] = request.url.params.get("after")
+        start: int = int(cursor) if cursor is not None else 0
+        end: int = start + 4
+
+        return httpx.Response(
+            200,
+            json={
+                "data": ITEMS[start:end],
+                "meta": {"next": str(end) if end < len(ITEMS) else None},
+            },
+        )
+
+    client: NeoClient = build_client(handler)
+
+    @paginate(CursorPagination("meta.next", param="after", items="data"), prefetch=1)
+    @client.get("/items")
+    def items() -> Iterator[int]: ...
+
+    assert list(items()) == ITEMS
+
+
+@pytest.mark.parametrize("prefetch", (0, 1, 3))
+def test_offset_pagination(prefetch: int) -> None:
+    offsets: MutableSequence[int] = []
+    lock: threading.Lock = threading.Lock()
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        offset: int = int(request.url.params["offset"])
+        limit: int = int(request.url.params["limit"])
+
+        with lock:
+            offsets.append(offset)
+
+        return httpx.Response(200, json={"results": ITEMS[offset : offset + limit]})
+
+    client: NeoClient = build_client(handler)
+
+    @paginate(OffsetPagination(4, items="results"), prefetch=prefetch)
+    @client.get("/items")
+    def items() -> Iterator[int]: ...
+
+    assert list(items()) == ITEMS
+    assert sorted(offsets)[:3] == [0, 4, 8]
+
+
+def test_page_pagination() -> None:
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        page: int = int(request.url.params["page"])
+
+        return httpx.Response(200, json=ITEMS[(page - 1) * 3 : page * 3])
+
+    client: NeoClient = build_client(handler)
+
+    @paginate(PagePagination(size=3))
+    @client.get("/items")
+    def items(page: int = 1) -> Iterator[int]: ...
+
+    assert list(items()) == ITEMS
+    assert list(items(page=3)) == ITEMS[6:]
+
+
+def test_pagination_response() -> None:
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        return httpx.Response(200, json={"items": [1, 2, 3]})
+
+    client: NeoClient = build_client(handler)
+
+    def response(body: dict) -> Any:
+        return body["items"][:1]
+
+    @paginate(LinkPagination())
+    @client.get("/items", response=response)
+    def items() -> Iterator[Any]: ...
+
+    assert list(items()) == [1]
+
+
+def test_pagination_not_a_sequence() -> None:
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        return httpx.Response(200, json={"items": [1, 2, 3]})
+
+    client: NeoClient = build_client(handler)
+
+    @paginate(LinkPagination())
+    @client.get("/items")
+    def items(): ...
+
+    with pytest.raises(PaginationError):
+        list(items())
@@ -1,8 +1,14 @@
-from neoclient.param_functions import AllRequestState, AllResponseState, AllState
+from neoclient.param_functions import (
+    AllRequestState,
+    AllResponseState,
+    AllState,
+    Content,
+)
 from neoclient.params import (
     AllRequestStateParameter,
     AllResponseStateParameter,
     AllStateParameter,
+    ContentParameter,
 )
 
 
@@ -16,3 +22,7 @@ def test_AllResponseState() -> None:
 
 def test_AllState() -> None:
     assert AllState() == AllStateParameter()
+
+
+def test_Content() -> None:
+    assert Content() == ContentParameter()
@@ -0,0 +1,143 @@
+import threading
+from typing import MutableSequence
+
+import httpx
+
+from neoclient import NeoClient, Service, get, service
+from neoclient.pool import (
+    ConnectionMaintainer,
+    KeepAlive,
+    count_connections,
+    get_pools,
+    reap,
+    warmup,
+)
+
+
+class Connection:
+    def __init__(
+        self, *, closed: bool = False, idle: bool = True, expired: bool = False
+    ) -> None:
+        self.closed = closed
+        self.idle = idle
+        self.expired = expired
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def is_idle(self) -> bool:
+        return self.idle
+
+    def has_expired(self) -> bool:
+        return self.expired
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def build_client() -> httpx.Client:
+    return httpx.Client(base_url="https://foo.com/")
+
+
+def test_get_pools() -> None:
+    client: httpx.Client = httpx.Client(
+        mounts={"https://bar.com": httpx.HTTPTransport()}
+    )
+
+    assert len(get_pools(client)) == 2
+
+
+def test_reap() -> None:
+    client: httpx.Client = build_client()
+    pool = get_pools(client)[0]
+
+    fresh: Connection = Connection()
+    active: Connection = Connection(idle=False, expired=True)
+    expired: Connection = Connection(expired=True)
+    closed: Connection = Connection(closed=True)
+
+    pool._connections.extend((fresh, active, expired, closed))
+
+    assert count_connections(client) == 3
+    assert reap(client) == 2
+    assert pool._connections == [fresh, active]
+    assert expired.closed
+
+
+def test_warmup() -> None:
+    lock: threading.Lock = threading.Lock()
+    requests: MutableSequence[httpx.Request] = []
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        with lock:
+            requests.append(request)
+
+        return httpx.Response(200)
+
+    client: httpx.Client = httpx.Client(
+        base_url="https://foo.com/", transport=httpx.MockTransport(handler)
+    )
+
+    assert warmup(client, connections=3) == 3
+    assert len(requests) == 3
+    assert all(request.method == "HEAD" for request in requests)
+    assert all(request.url == "https://foo.com/" for request in requests)
+
+
+def test_warmup_failure() -> None:
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    client: httpx.Client = httpx.Client(
+        base_url="https://foo.com/", transport=httpx.MockTransport(handler)
+    )
+
+    assert warmup(client, connections=2) == 0
+
+
+def test_ConnectionMaintainer() -> None:
+    client: httpx.Client = build_client()
+    expired: Connection = Connection(expired=True)
+
+    get_pools(client)[0]._connections.append(expired)
+
+    maintainer: ConnectionMaintainer = ConnectionMaintainer(
+        client, KeepAlive(interval=0.01)
+    )
+    maintainer.maintain(client)
+
+    assert expired.closed
+
+    maintainer.start()
+    client.close()
+    maintainer.join(timeout=1)
+
+    assert not maintainer.is_alive()
+
+
+def test_service_warmup() -> None:
+    requests: MutableSequence[httpx.Request] = []
+
+    @service("https://foo.com/", warmup=2)
+    class FooService(Service):
+        @get("/bar")
+        def bar(self) -> None: ...
+
+    FooService._spec.options.transport = httpx.MockTransport(
+        lambda request: requests.append(request) or httpx.Response(200)
+    )
+
+    foo: FooService = FooService()
+
+    assert len(requests) == 2
+    assert foo.warmup(1) == 1
+    assert len(requests) == 3
+
+
+def test_neoclient_warmup() -> None:
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+
+    assert client.warmup(4) == 4
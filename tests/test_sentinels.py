@@ -1,11 +1,15 @@
-import pydantic.fields
-
 from neoclient import sentinels
+from neoclient._compat import PYDANTIC_V2
+
+if PYDANTIC_V2:
+    import pydantic.v1.fields as fields
+else:
+    import pydantic.fields as fields
 
 
 def test_Required() -> None:
-    assert sentinels.Required is pydantic.fields.Required
+    assert sentinels.Required is fields.Required
 
 
 def test_Undefined() -> None:
-    assert sentinels.Undefined is pydantic.fields.Undefined
+    assert sentinels.Undefined is fields.Undefined
@@ -1,18 +1,24 @@
 from types import MethodType
+from typing import List
 
+import httpx
 import pytest
+from pydantic import BaseModel, ValidationError
 
-from neoclient.client import Client
+from neoclient.client import Client, NeoClient
 from neoclient.decorators import (
     get,
     middleware,
+    post,
     request_depends,
     response_depends,
     service,
+    validate_arguments,
+    validate_response,
 )
 from neoclient.models import ClientOptions
 from neoclient.operation import Operation, get_operation
-from neoclient.services import Service
+from neoclient.services import Service, ServiceMembers
 
 
 def some_middleware(call_next, request):
@@ -123,3 +129,247 @@ def test_service_response_dependencies() -> None:
         some_response_dependency,
         service.some_service_response_dependency,
     ]
+
+
+def test_service_members() -> None:
+    assert SomeService._members == ServiceMembers(
+        middleware=("some_service_middleware",),
+        request_dependencies=("some_service_request_dependency",),
+        response_dependencies=("some_service_response_dependency",),
+        operations=("foo",),
+    )
+
+
+def test_service_members_templates() -> None:
+    @service(middleware=[some_middleware])
+    class SomeDecoratedService(Service):
+        @get("/foo")
+        def foo(self): ...
+
+    template: Operation = SomeDecoratedService._members.templates["foo"]
+
+    # Bound to the (decorated) specification, but not to an instance or client
+    assert template.middleware.record == [some_middleware]
+    assert template.client is None
+
+    some_service: SomeDecoratedService = SomeDecoratedService()
+    operation: Operation = get_operation(some_service.foo)
+
+    assert operation is not template
+    assert operation.client is some_service._client.client
+    assert operation.middleware.record == [some_middleware]
+
+
+def test_service_shared_preparation() -> None:
+    @service(request_dependencies=[some_request_dependency])
+    class UserService(Service):
+        @service.request_depends
+        def member_dependency(self) -> None:
+            pass
+
+        @get("/users/{id}")
+        def get_user(self, id: int) -> None: ...
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+
+    first: UserService = UserService(client=client)
+    second: UserService = UserService(client=client)
+
+    first.get_user(1)
+    second.get_user(2)
+
+    first_operation: Operation = get_operation(first.get_user)
+    second_operation: Operation = get_operation(second.get_user)
+
+    # Prepared by the first instance, and re-used by the second
+    assert first_operation._composition is not None
+    assert second_operation._composition is first_operation._composition
+    assert second_operation._static is first_operation._static
+    # Instances aren't kept alive by what they've prepared
+    assert first_operation._composition.func is get_operation(UserService.get_user).func
+
+    assert first_operation._request_graph is not None
+    assert second_operation._request_graph is not None
+    assert (
+        second_operation._request_graph.prepared[some_request_dependency]
+        is first_operation._request_graph.prepared[some_request_dependency]
+    )
+    # Member dependencies are bound to each instance, but only prepared once
+    assert second.member_dependency in second_operation._request_graph.prepared
+    assert (
+        second_operation._request_graph.prepared[second.member_dependency]
+        is first_operation._request_graph.prepared[first.member_dependency]
+    )
+
+
+def test_service_members_inherited() -> None:
+    class SomeSubService(SomeService):
+        @get("/bar")
+        def bar(self): ...
+
+    assert SomeSubService._members.operations == ("bar", "foo")
+    assert SomeSubService().bar.__self__ is not None
+
+
+def test_service_close() -> None:
+    with SomeService() as some_service:
+        client: httpx.Client = some_service._client.client
+
+        assert not client.is_closed
+
+    assert client.is_closed
+
+
+def test_service_injected_client() -> None:
+    client: NeoClient = NeoClient("https://foo.com/")
+
+    with SomeService(client=client) as some_service:
+        assert some_service._client.client is client.client
+        assert get_operation(some_service.foo).client is client.client
+
+    assert not client.client.is_closed
+
+
+def test_service_shared_client() -> None:
+    @service(shared=True)
+    class SomeSharedService(Service):
+        @get("/foo")
+        def foo(self): ...
+
+    with SomeSharedService() as some_service:
+        client: httpx.Client = some_service._client.client
+
+    assert SomeSharedService()._client.client is client
+    assert not client.is_closed
+
+    SomeSharedService.close_shared_client()
+
+    assert client.is_closed
+    assert SomeSharedService()._client.client is not client
+
+
+def test_service_shared_client_closed() -> None:
+    @service("https://foo.com/", shared=True)
+    class SomeSharedService(Service):
+        @get("/foo")
+        def foo(self) -> str: ...
+
+    SomeSharedService._spec.options.transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json="foo")
+    )
+
+    some_service: SomeSharedService = SomeSharedService()
+
+    assert some_service.foo() == "foo"
+
+    SomeSharedService.close_shared_client()
+
+    # Existing instances carry on, using a new shared client
+    assert some_service.foo() == "foo"
+
+    SomeSharedService.close_shared_client()
+
+
+def test_service_injected_client_parts() -> None:
+    calls: List[str] = []
+
+    def client_middleware(call_next, request):
+        calls.append("client middleware")
+
+        return call_next(request)
+
+    def client_request_dependency() -> None:
+        calls.append("client request dependency")
+
+    def client_response(response: httpx.Response) -> str:
+        return response.text.upper()
+
+    class UserService(Service):
+        @service.middleware
+        def service_middleware(self, call_next, request):
+            calls.append("service middleware")
+
+            return call_next(request)
+
+        @get("/user")
+        def get_user(self): ...
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="sam")),
+        middleware=[client_middleware],
+        request_dependencies=[client_request_dependency],
+        default_response=client_response,
+    )
+
+    user_service: UserService = UserService(client=client)
+
+    assert user_service.get_user() == "SAM"
+    # The client's middleware wraps that of the service (as it would that of its
+    # own operations)
+    assert calls == [
+        "client request dependency",
+        "client middleware",
+        "service middleware",
+    ]
+
+
+def test_service_validate_response() -> None:
+    class User(BaseModel):
+        id: int
+
+    @validate_response(False)
+    class UserService(Service):
+        @get("/user")
+        def get_user(self) -> User: ...
+
+        @validate_response(True)
+        @get("/user")
+        def get_validated_user(self) -> User: ...
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"id": "1"})
+        ),
+    )
+
+    user_service: UserService = UserService(client=client)
+
+    assert user_service.get_user() == User.construct(id="1")
+    assert user_service.get_validated_user() == User(id=1)
+
+
+def test_service_validate_arguments() -> None:
+    class User(BaseModel):
+        id: int
+
+    requests: List[httpx.Request] = []
+
+    @validate_arguments(False)
+    class UserService(Service):
+        @post("/users")
+        def create_user(self, user: User) -> None: ...
+
+        @validate_arguments(True)
+        @post("/users")
+        def create_validated_user(self, user: User) -> None: ...
+
+    client: NeoClient = NeoClient(
+        "https://foo.com/",
+        transport=httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200)
+        ),
+    )
+
+    user_service: UserService = UserService(client=client)
+
+    user_service.create_user({"id": "not validated"})
+
+    assert requests[0].read() == b'{"id": "not validated"}'
+
+    with pytest.raises(ValidationError):
+        user_service.create_validated_user({"id": "not validated"})
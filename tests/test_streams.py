@@ -0,0 +1,104 @@
+import mmap
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Iterator, MutableSequence
+
+import httpx
+import pytest
+from httpx import StreamConsumed
+
+from neoclient import Content, NeoClient, Response
+from neoclient.streams import FileStream, MemoryMappedFileStream
+
+
+def test_FileStream_seekable() -> None:
+    file: BytesIO = BytesIO(b"foo bar")
+    file.seek(4)
+
+    stream: FileStream = FileStream(file, chunk_size=2)
+
+    assert stream.seekable
+    assert stream.length == 3
+    assert list(stream) == [b"ba", b"r"]
+    # The stream rewinds, so may be iterated more than once
+    assert b"".join(stream) == b"bar"
+
+
+def test_FileStream_not_seekable() -> None:
+    class UnseekableFile(BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    stream: FileStream = FileStream(UnseekableFile(b"foo"))
+
+    assert not stream.seekable
+    assert stream.length is None
+    assert b"".join(stream) == b"foo"
+
+    with pytest.raises(StreamConsumed):
+        list(stream)
+
+
+def test_FileStream_mmap(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file.bin"
+    path.write_bytes(b"foo")
+
+    with path.open("rb") as file:
+        memory_map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        stream: FileStream = FileStream(memory_map)
+
+        assert stream.length == 3
+        assert b"".join(stream) == b"foo"
+
+        memory_map.close()
+
+
+def test_MemoryMappedFileStream(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file.bin"
+    path.write_bytes(b"foo" * 100)
+
+    with MemoryMappedFileStream(path, chunk_size=128) as stream:
+        assert stream.length == 300
+        assert [len(chunk) for chunk in stream] == [128, 128, 44]
+        assert b"".join(stream) == b"foo" * 100
+
+
+def test_MemoryMappedFileStream_empty(tmp_path: Path) -> None:
+    path: Path = tmp_path / "file.bin"
+    path.write_bytes(b"")
+
+    with MemoryMappedFileStream(path) as stream:
+        assert stream.length == 0
+        assert b"".join(stream) == b""
+
+
+def test_content_upload() -> None:
+    requests: MutableSequence[httpx.Request] = []
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        request.read()
+        requests.append(request)
+
+        return httpx.Response(200)
+
+    client: NeoClient = NeoClient(transport=httpx.MockTransport(handler))
+
+    @client.post("https://foo.com/")
+    def upload(content: Any = Content()) -> Response: ...
+
+    def chunks() -> Iterator[bytes]:
+        yield b"foo"
+        yield b"bar"
+
+    file: BytesIO = BytesIO(b"foo bar")
+
+    upload(file)
+    upload(file)
+    upload(chunks())
+
+    assert requests[0].content == requests[1].content == b"foo bar"
+    assert requests[0].headers["Content-Length"] == "7"
+    assert "Transfer-Encoding" not in requests[0].headers
+    assert requests[2].content == b"foobar"
+    assert requests[2].headers["Transfer-Encoding"] == "chunked"
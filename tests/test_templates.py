@@ -0,0 +1,99 @@
+from typing import Mapping
+
+import pytest
+from httpx import URL
+
+from neoclient.models import RequestOpts
+from neoclient.templates import Placeholder, URLTemplate, get_url_template
+
+
+def test_URLTemplate() -> None:
+    template: URLTemplate = URLTemplate("https://{host}/users/{id}?q={q}#{fragment}")
+
+    assert template.placeholders == {"host", "id", "q", "fragment"}
+    assert template.parts == [
+        "https://",
+        Placeholder(name="host", component="authority"),
+        "/users/",
+        Placeholder(name="id", component="path"),
+        "?q=",
+        Placeholder(name="q", component="query"),
+        "#",
+        Placeholder(name="fragment", component="fragment"),
+    ]
+
+
+def test_URLTemplate_expand() -> None:
+    assert URLTemplate("/users/{id}").expand({"id": 1}) == URL("/users/1")
+    assert URLTemplate("/users/{{id}}/{id}").expand({"id": "1"}) == URL("/users/{id}/1")
+    assert URLTemplate("/users/{id!r}").expand({"id": "sam"}) == URL("/users/'sam'")
+    assert URLTemplate("/users/{id:03}").expand({"id": 7}) == URL("/users/007")
+    assert URLTemplate("https://{host}.com/").expand({"host": "api"}) == URL(
+        "https://api.com/"
+    )
+
+
+def test_URLTemplate_expand_encoding() -> None:
+    template: URLTemplate = URLTemplate("/files/{path}?q={q}")
+
+    url: URL = template.expand({"path": "a b/c?d#é%", "q": "x&y=z"})
+
+    assert url.raw_path == b"/files/a%20b/c%3Fd%23%C3%A9%25?q=x%26y%3Dz"
+    assert url.path == "/files/a b/c?d#é%"
+    assert url.params["q"] == "x&y=z"
+
+
+def test_URLTemplate_static() -> None:
+    template: URLTemplate = URLTemplate("https://foo.com/users")
+
+    assert template.placeholders == frozenset()
+    assert template.expand({}) is template.expand({})
+
+
+def test_URLTemplate_invalid() -> None:
+    with pytest.raises(ValueError):
+        URLTemplate("/users/{}")
+    with pytest.raises(ValueError):
+        URLTemplate("/users/{0}")
+
+    with pytest.raises(KeyError):
+        URLTemplate("/users/{id}").expand({})
+
+
+def test_get_url_template() -> None:
+    assert get_url_template("/users/{id}") is get_url_template("/users/{id}")
+    assert get_url_template("/users/%7Bid%7D").placeholders == {"id"}
+
+
+def test_RequestOpts_formatted_url() -> None:
+    request: RequestOpts = RequestOpts(
+        "GET", "/users/{id}", path_params={"id": "sam smith"}
+    )
+
+    assert request.url_template is get_url_template("/users/{id}")
+    assert request.formatted_url == URL("/users/sam%20smith")
+
+
+@pytest.mark.parametrize(
+    "template,values",
+    [
+        (
+            "https://foo.com/a b/{id}?q={q}&r=1#{fragment}",
+            {"id": "é 1/2", "q": "a&b c", "fragment": "x y"},
+        ),
+        ("https://foo.com/users/{id}/../{name}", {"id": "1", "name": "sam"}),
+        ("https://foo.com/users/{id}", {"id": "../admin"}),
+        ("https://{host}.com/users/{id}", {"host": "api", "id": "1"}),
+    ],
+)
+def test_URLTemplate_expand_matches_parsing(
+    template: str, values: Mapping[str, str]
+) -> None:
+    url_template: URLTemplate = URLTemplate(template)
+
+    assert url_template.expand(values) == URL(
+        "".join(
+            part if isinstance(part, str) else part.substitute(values[part.name])
+            for part in url_template.parts
+        )
+    )
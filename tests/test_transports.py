@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import MutableSequence
+
+import httpx
+
+from neoclient import NeoClient
+from neoclient.models import ClientOptions
+from neoclient.transports import (
+    ConnectionStats,
+    HostOptions,
+    InstrumentedTransport,
+    get_connection_stats,
+)
+
+
+class NetworkStream:
+    pass
+
+
+def test_InstrumentedTransport_connections() -> None:
+    network_stream: NetworkStream = NetworkStream()
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=iter((b"foo",)),
+            extensions={"network_stream": network_stream, "http_version": b"HTTP/2"},
+        )
+
+    transport: InstrumentedTransport = InstrumentedTransport(
+        httpx.MockTransport(handler)
+    )
+
+    with httpx.Client(transport=transport) as client:
+        client.get("https://foo.com/")
+        client.get("https://foo.com/")
+
+        with client.stream("GET", "https://foo.com/"):
+            assert transport.connections == [
+                ConnectionStats(
+                    http_version="HTTP/2",
+                    streams=3,
+                    active_streams=1,
+                    max_active_streams=1,
+                )
+            ]
+
+    assert transport.connections == [
+        ConnectionStats(
+            http_version="HTTP/2", streams=3, active_streams=0, max_active_streams=1
+        )
+    ]
+
+
+def test_InstrumentedTransport_max_concurrent_streams() -> None:
+    lock: threading.Lock = threading.Lock()
+    active: MutableSequence[int] = [0]
+    peak: MutableSequence[int] = [0]
+
+    def handler(request: httpx.Request, /) -> httpx.Response:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+
+        time.sleep(0.01)
+
+        with lock:
+            active[0] -= 1
+
+        return httpx.Response(200, content=iter((b"foo",)))
+
+    transport: InstrumentedTransport = InstrumentedTransport(
+        httpx.MockTransport(handler), max_concurrent_streams=2
+    )
+
+    with httpx.Client(transport=transport) as client:
+        threads: MutableSequence[threading.Thread] = [
+            threading.Thread(target=client.get, args=("https://foo.com/",))
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert peak[0] == 2
+
+
+def test_hosts() -> None:
+    client: httpx.Client = ClientOptions(
+        hosts={"https://foo.com": HostOptions(http2=False, max_concurrent_streams=4)}
+    ).build()
+
+    stats = get_connection_stats(client)
+
+    assert set(stats) == {"all://", "https://foo.com"}
+
+    transport = client._transport_for_url(httpx.URL("https://foo.com/"))
+
+    assert isinstance(transport, InstrumentedTransport)
+    assert transport.max_concurrent_streams == 4
+
+
+def test_neoclient_instrumented() -> None:
+    client: NeoClient = NeoClient(max_concurrent_streams=8)
+
+    assert client.client is not None
+    assert isinstance(client.client._transport, InstrumentedTransport)
+    assert client.client._transport.max_concurrent_streams == 8
@@ -1,10 +1,10 @@
-from typing import Mapping, Union
+from typing import Any, List, Mapping, Optional, Union
 
 import pytest
-from httpx import QueryParams
-from pydantic.fields import FieldInfo, Undefined
+from httpx import Headers, QueryParams
 
 from neoclient import utils
+from neoclient._compat import FieldInfo, Undefined
 
 
 def test_parse_format_string() -> None:
@@ -154,3 +154,33 @@ def test_parse_obj_as() -> None:
     assert utils.parse_obj_as(
         Mapping[str, str], QueryParams({"name": "sam", "age": "43"})  # type: ignore
     ) == QueryParams({"name": "sam", "age": "43"})
+
+
+def test_add_header() -> None:
+    headers: Headers = Headers({"Accept": "text/plain"})
+
+    utils.add_header(headers, "Accept", "application/json")
+    utils.add_header(headers, "X-Name", "sam")
+
+    assert (
+        headers.raw
+        == Headers(
+            [
+                ("Accept", "text/plain"),
+                ("Accept", "application/json"),
+                ("X-Name", "sam"),
+            ]
+        ).raw
+    )
+    assert headers.get_list("accept") == ["text/plain", "application/json"]
+
+
+def test_is_instance() -> None:
+    assert utils.is_instance(123, int)
+    assert not utils.is_instance("123", int)
+    assert utils.is_instance(None, Optional[int])
+    assert utils.is_instance("abc", Union[int, str])
+    assert utils.is_instance([1, 2, 3], List[int])
+    assert not utils.is_instance((1, 2, 3), List[int])
+    assert utils.is_instance(object(), Any)
+    assert utils.is_instance(object(), "ForwardRef")